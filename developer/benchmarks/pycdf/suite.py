@@ -0,0 +1,396 @@
+#!/usr/bin/env python
+"""Benchmark and regression check for pycdf
+
+Generates synthetic CDFs in a temporary directory and times:
+
+    read
+        Reading a whole zVariable of each type, compressed (GZIP) and
+        not, for a range of numbers of records.
+    write
+        Creating a CDF with one zVariable of each type, compressed and
+        not.
+    attrs
+        Opening a CDF with many variables and many zAttributes and
+        reading every attribute of every variable.
+    epoch
+        Vectorized conversion between EPOCH, EPOCH16, TT2000 and
+        datetime / datetime64.
+    concat
+        :func:`~spacepy.pycdf.concatCDF` over several files, by path.
+
+and records throughput (values, attribute entries, or records per second)
+and peak memory (bytes allocated during one operation, via
+:mod:`tracemalloc`). Creating the input is not timed.
+
+Results are written as JSON. If a baseline (a previous JSON output) is
+given, every case in both is compared, regressions are listed, and the
+exit status is 1 if there were any.
+
+Examples::
+
+    # Everything, 100 to 10 million values
+    python suite.py -o baseline.json
+    # ...upgrade, then compare
+    python suite.py -o new.json -b baseline.json
+    # Quick check of reading and epoch conversion
+    python suite.py --max-size 1e5 -g read epoch
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import os.path
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+import numpy
+
+import spacepy
+from spacepy import pycdf
+from spacepy.pycdf import const
+
+
+GROUPS = ['read', 'write', 'attrs', 'epoch', 'concat']
+#Variable types to read and write, with a function to make n values
+TYPES = {
+    'INT2': (const.CDF_INT2, lambda rng, n: rng.randint(
+        -1000, 1000, n).astype(numpy.int16)),
+    'INT4': (const.CDF_INT4, lambda rng, n: rng.randint(
+        -100000, 100000, n).astype(numpy.int32)),
+    'FLOAT': (const.CDF_FLOAT, lambda rng, n: rng.standard_normal(n)
+              .astype(numpy.float32)),
+    'DOUBLE': (const.CDF_DOUBLE, lambda rng, n: rng.standard_normal(n)),
+    'CHAR': (const.CDF_CHAR, lambda rng, n: numpy.array(
+        ['abcdefgh'[:i] for i in rng.randint(1, 9, n)])),
+    'EPOCH': (const.CDF_EPOCH, lambda rng, n: make_times(rng, n)),
+    'EPOCH16': (const.CDF_EPOCH16, lambda rng, n: make_times(rng, n)),
+    'TT2000': (const.CDF_TIME_TT2000, lambda rng, n: make_times(rng, n)),
+}
+COMPRESS = {'none': const.NO_COMPRESSION, 'gzip': const.GZIP_COMPRESSION}
+EPOCHS = ['EPOCH', 'EPOCH16', 'TT2000']
+
+
+def make_times(rng, n):
+    """Sorted random datetime64[us] from 2000 through 2020"""
+    usec = numpy.sort(rng.randint(946684800, 1609459200, n).astype(
+        numpy.int64) * 1000000 + rng.randint(0, 1000000, n))
+    return usec.astype('datetime64[us]')
+
+
+def timed(func, min_time=0.2, memory=True):
+    """Benchmark a single operation
+
+    Returns
+    =======
+    seconds : float
+        Best time for one call.
+    peak : int
+        Peak memory allocated during one call, bytes (None if not
+        measured).
+    """
+    timer = timeit.Timer(func)
+    # Repeat enough that each measurement takes at least min_time
+    number = 1
+    while True:
+        t = timer.timeit(number)
+        if t >= min_time or number >= 1e6:
+            break
+        number = max(number * 2, int(number * min_time / max(t, 1e-9)))
+    best = min([t] + timer.repeat(repeat=2, number=number)) / number
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return best, peak
+
+
+def new_cdf(path):
+    """Create a new, empty CDF, replacing any existing"""
+    if os.path.exists(path):
+        os.remove(path)
+    return pycdf.CDF(path, '')
+
+
+def read_cases(tmpdir, n, rng):
+    """Cases for reading each type, compressed and not
+
+    Yields
+    ======
+    case : str
+        Name of the case
+    count : int
+        Number of values per call
+    func : callable
+        Operation to time
+    """
+    path = os.path.join(tmpdir, 'read.cdf')
+    with new_cdf(path) as f:
+        for tname, (cdftype, maker) in TYPES.items():
+            for cname, comp in COMPRESS.items():
+                f.new('{}_{}'.format(tname, cname), maker(rng, n),
+                      type=cdftype, compress=comp)
+    f = pycdf.CDF(path)
+    try:
+        for tname in TYPES:
+            for cname in COMPRESS:
+                var = f['{}_{}'.format(tname, cname)]
+                yield '{}/{}'.format(tname, cname), n, \
+                    lambda var=var: var[...]
+                if tname in EPOCHS:
+                    yield '{}/{}/datetime64'.format(tname, cname), n, \
+                        lambda var=var: var.get(time_as='datetime64')
+    finally:
+        f.close()
+
+
+def write_cases(tmpdir, n, rng):
+    """Cases for writing each type, compressed and not"""
+    path = os.path.join(tmpdir, 'write.cdf')
+    for tname, (cdftype, maker) in TYPES.items():
+        data = maker(rng, n)
+        for cname, comp in COMPRESS.items():
+            def write(data=data, cdftype=cdftype, comp=comp):
+                with new_cdf(path) as f:
+                    f.new('data', data, type=cdftype, compress=comp)
+            yield '{}/{}'.format(tname, cname), n, write
+        if tname in EPOCHS:
+            #Same times, as datetime
+            data = data.astype(object)
+            def write(data=data, cdftype=cdftype):
+                with new_cdf(path) as f:
+                    f.new('data', data, type=cdftype)
+            yield '{}/none/datetime'.format(tname), n, write
+
+
+def attrs_cases(tmpdir, n, rng):
+    """Cases for reading all attributes of an attribute-heavy CDF
+
+    n is the total number of zAttribute entries: 20 per variable.
+    """
+    nattrs = 20
+    nvars = max(n // nattrs, 1)
+    path = os.path.join(tmpdir, 'attrs.cdf')
+    with new_cdf(path) as f:
+        f.attrs['Project'] = 'Benchmark'
+        for i in range(nvars):
+            name = 'var{:06d}'.format(i)
+            f.new(name, type=const.CDF_FLOAT, dims=[3])
+            attrs = f[name].attrs
+            for j in range(nattrs // 2):
+                attrs['TEXT{:02d}'.format(j)] = 'Variable {} text {}'.format(
+                    i, j)
+                attrs['VALUE{:02d}'.format(j)] = numpy.float32(i * j)
+    def read_all():
+        with pycdf.CDF(path) as f:
+            return dict((k, v.attrs.copy()) for k, v in f.items())
+    yield 'open_read_all', nvars * nattrs, read_all
+    with pycdf.CDF(path) as f:
+        yield 'read_all', nvars * nattrs, \
+            lambda: dict((k, v.attrs.copy()) for k, v in f.items())
+
+
+def epoch_cases(tmpdir, n, rng):
+    """Cases for vectorized epoch conversion"""
+    times = make_times(rng, n)
+    dts = times.astype(object)
+    lib = pycdf.lib
+    funcs = {
+        'EPOCH': (lib.v_datetime_to_epoch, lib.v_epoch_to_datetime,
+                  lib.v_epoch_to_datetime64),
+        'EPOCH16': (lib.v_datetime_to_epoch16, lib.v_epoch16_to_datetime,
+                    lib.v_epoch16_to_datetime64),
+        'TT2000': (lib.v_datetime_to_tt2000, lib.v_tt2000_to_datetime,
+                   lib.v_tt2000_to_datetime64),
+    }
+    for name, (to_epoch, to_dt, to_dt64) in funcs.items():
+        epochs = to_epoch(times)
+        yield 'datetime->{}'.format(name), n, lambda f=to_epoch: f(dts)
+        yield 'datetime64->{}'.format(name), n, \
+            lambda f=to_epoch: f(times)
+        yield '{}->datetime'.format(name), n, \
+            lambda f=to_dt, e=epochs: f(e)
+        yield '{}->datetime64'.format(name), n, \
+            lambda f=to_dt64, e=epochs: f(e)
+
+
+def concat_cases(tmpdir, n, rng):
+    """Cases for concatCDF of 10 files, n records total"""
+    nfiles = 10
+    nrec = max(n // nfiles, 1)
+    paths = []
+    times = make_times(rng, nrec * nfiles)
+    for i in range(nfiles):
+        path = os.path.join(tmpdir, 'concat{:02d}.cdf'.format(i))
+        with new_cdf(path) as f:
+            f.new('Epoch', times[i * nrec:(i + 1) * nrec],
+                  type=const.CDF_TIME_TT2000)
+            f.new('data', rng.standard_normal((nrec, 3)))
+            f['data'].attrs['DEPEND_0'] = 'Epoch'
+        paths.append(path)
+    yield 'paths', nrec * nfiles, lambda: pycdf.concatCDF(paths)
+    yield 'paths/raw', nrec * nfiles, \
+        lambda: pycdf.concatCDF(paths, raw=True)
+    mid = times[len(times) // 4], times[3 * len(times) // 4]
+    yield 'paths/timerange', nrec * nfiles // 2, lambda: pycdf.concatCDF(
+        paths, starttime=mid[0].item(), endtime=mid[1].item())
+
+
+CASES = {
+    'read': read_cases,
+    'write': write_cases,
+    'attrs': attrs_cases,
+    'epoch': epoch_cases,
+    'concat': concat_cases,
+}
+
+
+def metadata():
+    """Information on the environment being benchmarked"""
+    here = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], cwd=here,
+            stderr=subprocess.STDOUT).decode('ascii').strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'date': datetime.datetime.utcnow().isoformat(),
+        'spacepy': spacepy.__version__,
+        'numpy': numpy.__version__,
+        'cdf': '.'.join(str(i) for i in pycdf.lib.version),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'commit': commit,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Find cases which are slower or use more memory than baseline
+
+    Returns
+    =======
+    list of str
+        Description of each regression.
+    """
+    base = {(r['n'], r['group'], r['case']): r
+            for r in baseline['results']}
+    regressions = []
+    for r in results:
+        b = base.get((r['n'], r['group'], r['case']))
+        if b is None:
+            continue
+        case = '{group:>6} {case:<28} n={n:<9}'.format(**r)
+        if r['throughput'] < b['throughput'] * (1 - tolerance):
+            regressions.append(
+                '{} throughput {:.3g}/s, was {:.3g}/s ({:+.0%})'.format(
+                    case, r['throughput'], b['throughput'],
+                    r['throughput'] / b['throughput'] - 1))
+        if r['peak_bytes'] is not None and b.get('peak_bytes') \
+           and r['peak_bytes'] > b['peak_bytes'] * (1 + tolerance):
+            regressions.append(
+                '{} peak memory {} bytes, was {} ({:+.0%})'.format(
+                    case, r['peak_bytes'], b['peak_bytes'],
+                    r['peak_bytes'] / b['peak_bytes'] - 1))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.split('\n')[0])
+    parser.add_argument('-o', '--output', help='JSON file for results')
+    parser.add_argument('-b', '--baseline',
+                        help='JSON results to compare against')
+    parser.add_argument('-t', '--tolerance', type=float, default=0.25,
+                        help='Fractional change treated as a regression'
+                        ' (default %(default)s)')
+    parser.add_argument('-g', '--groups', nargs='+', default=GROUPS,
+                        choices=GROUPS, metavar='GROUP',
+                        help='Groups of cases to run (default all)')
+    parser.add_argument('--min-size', type=float, default=100,
+                        help='Smallest number of values'
+                        ' (default %(default)s)')
+    parser.add_argument('--max-size', type=float, default=1e7,
+                        help='Largest number of values'
+                        ' (default %(default)s)')
+    parser.add_argument('--max-seconds', type=float, default=30.,
+                        help='Skip larger sizes of a case once one'
+                        ' call would take longer than this'
+                        ' (default %(default)s)')
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='Minimum time per timing repeat, seconds'
+                        ' (default %(default)s)')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='Do not measure peak memory')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Random seed for generated data'
+                        ' (default %(default)s)')
+    args = parser.parse_args(argv)
+
+    pycdf.lib.set_backward(False)
+    sizes = [int(n) for n in 10 ** numpy.arange(
+        numpy.log10(args.min_size), numpy.log10(args.max_size) + 0.01)]
+    results = []
+    skip = set() # (group, case) too slow for larger sizes
+    tmpdir = tempfile.mkdtemp()
+    try:
+        for n in sizes:
+            for group in args.groups:
+                rng = numpy.random.RandomState(args.seed)
+                for case, count, func in CASES[group](tmpdir, n, rng):
+                    if (group, case) in skip:
+                        continue
+                    try:
+                        seconds, peak = timed(
+                            func, min_time=args.min_time,
+                            memory=not args.no_memory)
+                    except Exception as e:
+                        print('{:>6} {:<28} n={:<9} failed: {}'.format(
+                            group, case, n, e))
+                        skip.add((group, case))
+                        continue
+                    results.append({
+                        'n': n, 'group': group, 'case': case,
+                        'count': count, 'seconds': seconds,
+                        'throughput': count / seconds, 'peak_bytes': peak,
+                    })
+                    print('{:>6} {:<28} n={:<9} {:10.3g} s {:10.3g}/s'
+                          ' {:>12} bytes'.format(
+                              group, case, n, seconds, count / seconds,
+                              '-' if peak is None else peak))
+                    sys.stdout.flush()
+                    if seconds * 10 > args.max_seconds:
+                        skip.add((group, case))
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    output = {'metadata': metadata(), 'results': results}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(output, f, indent=1)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print('\nCompared to {} ({}):'.format(
+            args.baseline, baseline['metadata'].get('commit')))
+        regressions = compare(results, baseline, args.tolerance)
+        for r in regressions:
+            print('REGRESSION: ' + r)
+        if not regressions:
+            print('No regressions.')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,23 +1,54 @@
+#!/usr/bin/env python
+"""Speed test for TAI to UTC conversion in Ticktock
+
+Compares the array-based conversion now used by Ticktock.getUTC against
+the previous implementation, which built one timedelta per element and
+searched the leap second table once per element.
+"""
 
 import datetime
-import time
 import timeit
 
-import numpy as np
+import numpy
 import spacepy.time as spt
 
-number = 200
-
-gps = np.linspace(6.96556813e+08, 6.97334413e+08, 10)
-
-tt = spt.Ticktock(gps, 'GPS')
-print(tt)
-
-print tt
-
-
-
-
-
-
 
+def old_getUTC(TAI):
+    """TAI to UTC, per-element (implementation before array engine)"""
+    TAI0 = datetime.datetime(1958, 1, 1, 0, 0, 0, 0)
+    UTC = [datetime.timedelta(
+        seconds=float(tait - (864000 if tait < -11840601600.0 else 0)))
+           + TAI0 for tait in TAI]
+    for i in numpy.arange(len(TAI)):
+        idx = numpy.searchsorted(spt.TAIleaps, TAI[i], side='right') - 1
+        UTC[i] = UTC[i] - datetime.timedelta(seconds=spt.secs[idx]
+                                             if idx > 0 else 0)
+        if int(TAI[i]) == spt.TAIleaps[idx]:
+            UTC[i] = UTC[i].replace(second=59, microsecond=999999)
+    return UTC
+
+
+def new_getUTC(TAI):
+    """TAI to UTC via Ticktock"""
+    return spt.Ticktock(TAI, 'TAI').UTC
+
+
+def new_datetime64(TAI):
+    """TAI to UTC, stopping at datetime64"""
+    return spt._tai_to_datetime64(TAI)
+
+
+# 2008-12-01 through 2009-01-31, across the leap second
+start, stop = 1606780833., 1612137634.
+for n in (10, 1000, 100000, 1000000):
+    tai = numpy.linspace(start, stop, n)
+    number = max(1, 100000 // n)
+    print('{0} elements ({1} repeats)'.format(n, number))
+    if n <= 100000: # Old version takes too long beyond this
+        assert (numpy.asarray(old_getUTC(tai)) == new_getUTC(tai)).all()
+        print('  old:        {0:.4g} s'.format(
+            timeit.timeit(lambda: old_getUTC(tai), number=number) / number))
+    print('  new:        {0:.4g} s'.format(
+        timeit.timeit(lambda: new_getUTC(tai), number=number) / number))
+    print('  datetime64: {0:.4g} s'.format(
+        timeit.timeit(lambda: new_datetime64(tai), number=number) / number))
@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+"""Benchmark and regression check for Ticktock time conversions
+
+Times every conversion from each input dtype to each output
+representation of :class:`~spacepy.time.Ticktock`, for a range of array
+sizes, and records throughput (elements per second) and peak memory
+(bytes allocated during the conversion, via :mod:`tracemalloc`).
+
+Each measurement creates a new Ticktock from the input and accesses one
+output attribute, so the cost includes any intermediate representations
+(e.g. ``TAI``) needed to get there, but not creation of the input.
+
+Results are written as JSON. If a baseline (a previous JSON output) is
+given, every case in both is compared, regressions are listed, and the
+exit status is 1 if there were any.
+
+Examples::
+
+    # Full matrix, 10 to 10 million elements
+    python conversion_suite.py -o baseline.json
+    # ...upgrade, then compare
+    python conversion_suite.py -o new.json -b baseline.json
+    # Quick check of some conversions
+    python conversion_suite.py --max-size 1e5 -i TAI ISO -u UTC DT64
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import os.path
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+import numpy
+
+import spacepy
+import spacepy.time
+
+
+INPUTS = ['TAI', 'UTC', 'ISO', 'DT64', 'UNX', 'RDT', 'CDF', 'JD', 'MJD',
+          'GPS']
+if spacepy.time.HAVE_ASTROPY:
+    INPUTS.append('APT')
+OUTPUTS = list(spacepy.time.Ticktock._keylist)
+
+
+def make_inputs(n, dtypes, seed=0):
+    """Make input data of each dtype, for the same times
+
+    Times are random (but reproducible) over 1990 through 2020, including
+    the leap seconds in that period, with microsecond fractions.
+    """
+    rng = numpy.random.RandomState(seed)
+    tai = numpy.sort(rng.uniform(1009843225., 1956528037., int(n)))
+    tai = numpy.round(tai, 6)
+    # Make sure some times are in leap seconds
+    leaps = spacepy.time._leaptable['leapTAI']
+    leaps = leaps[(leaps > tai[0]) & (leaps < tai[-1])]
+    k = min(len(leaps), len(tai) // 10)
+    if k:
+        tai[::len(tai) // k][:k] = leaps[:k] + 0.25
+        tai.sort()
+    tt = spacepy.time.Ticktock(tai, 'TAI')
+    out = {}
+    for dtype in dtypes:
+        data = getattr(tt, dtype)
+        # Plain arrays, as a user would typically have them
+        out[dtype] = data if dtype == 'APT' else numpy.array(data)
+    return out
+
+
+def run_case(data, indtype, outdtype, min_time=0.2, memory=True):
+    """Benchmark a single conversion
+
+    Returns
+    =======
+    seconds : float
+        Best time for one conversion.
+    peak : int
+        Peak memory allocated during one conversion, bytes (None if not
+        measured).
+    """
+    def convert():
+        return getattr(spacepy.time.Ticktock(data, indtype), outdtype)
+    timer = timeit.Timer(convert)
+    # Repeat enough that each measurement takes at least min_time
+    number = 1
+    while True:
+        t = timer.timeit(number)
+        if t >= min_time or number >= 1e6:
+            break
+        number = max(number * 2, int(number * min_time / max(t, 1e-9)))
+    best = min([t] + timer.repeat(repeat=2, number=number)) / number
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        convert()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return best, peak
+
+
+def metadata():
+    """Information on the environment being benchmarked"""
+    here = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], cwd=here,
+            stderr=subprocess.STDOUT).decode('ascii').strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'date': datetime.datetime.utcnow().isoformat(),
+        'spacepy': spacepy.__version__,
+        'numpy': numpy.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'commit': commit,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Find cases which are slower or use more memory than baseline
+
+    Returns
+    =======
+    list of str
+        Description of each regression.
+    """
+    base = {(r['n'], r['input'], r['output']): r
+            for r in baseline['results']}
+    regressions = []
+    for r in results:
+        b = base.get((r['n'], r['input'], r['output']))
+        if b is None:
+            continue
+        case = '{input:>4} -> {output:<6} n={n:<9}'.format(**r)
+        if r['throughput'] < b['throughput'] * (1 - tolerance):
+            regressions.append(
+                '{} throughput {:.3g}/s, was {:.3g}/s ({:+.0%})'.format(
+                    case, r['throughput'], b['throughput'],
+                    r['throughput'] / b['throughput'] - 1))
+        if r['peak_bytes'] is not None and b.get('peak_bytes') \
+           and r['peak_bytes'] > b['peak_bytes'] * (1 + tolerance):
+            regressions.append(
+                '{} peak memory {} bytes, was {} ({:+.0%})'.format(
+                    case, r['peak_bytes'], b['peak_bytes'],
+                    r['peak_bytes'] / b['peak_bytes'] - 1))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.split('\n')[0])
+    parser.add_argument('-o', '--output', help='JSON file for results')
+    parser.add_argument('-b', '--baseline',
+                        help='JSON results to compare against')
+    parser.add_argument('-t', '--tolerance', type=float, default=0.25,
+                        help='Fractional change treated as a regression'
+                        ' (default %(default)s)')
+    parser.add_argument('-i', '--inputs', nargs='+', default=INPUTS,
+                        choices=INPUTS, metavar='DTYPE',
+                        help='Input dtypes (default all)')
+    parser.add_argument('-u', '--outputs', nargs='+', default=OUTPUTS,
+                        choices=OUTPUTS, metavar='DTYPE',
+                        help='Output representations (default all)')
+    parser.add_argument('--min-size', type=float, default=10,
+                        help='Smallest array (default %(default)s)')
+    parser.add_argument('--max-size', type=float, default=1e7,
+                        help='Largest array (default %(default)s)')
+    parser.add_argument('--max-seconds', type=float, default=30.,
+                        help='Skip larger sizes of a conversion once one'
+                        ' conversion would take longer than this'
+                        ' (default %(default)s)')
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='Minimum time per timing repeat, seconds'
+                        ' (default %(default)s)')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='Do not measure peak memory')
+    args = parser.parse_args(argv)
+
+    sizes = [int(n) for n in 10 ** numpy.arange(
+        numpy.log10(args.min_size), numpy.log10(args.max_size) + 0.01)]
+    results = []
+    skip = set() # (input, output) too slow for larger sizes
+    for n in sizes:
+        inputs = make_inputs(n, args.inputs)
+        for indtype in args.inputs:
+            for outdtype in args.outputs:
+                if (indtype, outdtype) in skip:
+                    continue
+                try:
+                    seconds, peak = run_case(
+                        inputs[indtype], indtype, outdtype,
+                        min_time=args.min_time, memory=not args.no_memory)
+                except Exception as e:
+                    print('{:>4} -> {:<6} n={:<9} failed: {}'.format(
+                        indtype, outdtype, n, e))
+                    skip.add((indtype, outdtype))
+                    continue
+                results.append({
+                    'n': n, 'input': indtype, 'output': outdtype,
+                    'seconds': seconds, 'throughput': n / seconds,
+                    'peak_bytes': peak,
+                })
+                print('{:>4} -> {:<6} n={:<9} {:10.3g} s {:10.3g}/s'
+                      ' {:>12} bytes'.format(
+                          indtype, outdtype, n, seconds, n / seconds,
+                          '-' if peak is None else peak))
+                sys.stdout.flush()
+                if seconds * 10 > args.max_seconds:
+                    skip.add((indtype, outdtype))
+        del inputs
+
+    output = {'metadata': metadata(), 'results': results}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(output, f, indent=1)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print('\nCompared to {} ({}):'.format(
+            args.baseline, baseline['metadata'].get('commit')))
+        regressions = compare(results, baseline, args.tolerance)
+        for r in regressions:
+            print('REGRESSION: ' + r)
+        if not regressions:
+            print('No regressions.')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -28,3 +28,11 @@ t1 = time.time()
 t = spacepy.time.Ticktock(dts, 'ISO', isoformat='%Y-%m-%dT%H:%M:%S.%f').UTC
 print(time.time() - t1)
 
+
+t1 = time.time()
+t = spacepy.time.dtstr2iso(dts, fmt='%Y-%m-%dT%H:%M:%S.%f')
+print(time.time() - t1)
+
+t1 = time.time()
+dt64, good = spacepy.time._parse_iso_fixed(dts)
+print(time.time() - t1)
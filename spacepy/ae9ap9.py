@@ -40,7 +40,6 @@ import gzip
 import os
 import re
 
-from dateutil import relativedelta
 import numpy as np
 
 import spacepy.coordinates as spc
@@ -380,8 +379,7 @@ def readFile(fname, comments='#'):
         if header['time_format'] == 'eDOY':  # have to massage the data first
             year = data[:, 0].astype(int)
             frac = data[:, 1]
-            time = spt.Ticktock([dt.datetime(y, 1, 1) + relativedelta.relativedelta(days=v)
-                                 for y, v in zip(year, frac)], 'UTC')
+            time = spt.Ticktock.from_doy(year, frac + 1)
             ans[header['time_format']] = dm.dmarray(data[:, 0:2])
             ans[header['time_format']].attrs['VAR_TYPE'] = 'support_data'
             ans[header['time_format']].attrs['LABL_PTR_1'] = 'timeComp'
@@ -391,7 +389,7 @@ def readFile(fname, comments='#'):
             data = data[:, 2:]
         elif header['time_format'] == 'UTC':  # have to massage the data first
             tm = data[:, 0:6].astype(int)
-            time = spt.Ticktock([dt.datetime(*v) for v in tm], 'UTC')
+            time = spt.Ticktock.from_components(*tm.T)
             ans[header['time_format']] = dm.dmarray(data[:, 0:6])
             ans[header['time_format']].attrs['VAR_TYPE'] = 'support_data'
             ans[header['time_format']].attrs['LABL_PTR_1'] = 'timeComp'
@@ -8,6 +8,7 @@ implemented slightly differently.
 This contains the following classes:
  * :py:class:`dmarray` - numpy arrays that support .attrs for information about the data
  * :py:class:`SpaceData` - base class that extends dict, to be extended by others
+ * :py:class:`LazySpaceData` - SpaceData which reads values from a file on first access
 
 Authors: Steve Morley and Brian Larsen
 
@@ -160,6 +161,7 @@ The file looks like:
 """
 
 from __future__ import division
+import collections
 import copy
 import datetime
 import itertools
@@ -611,6 +613,272 @@ class SpaceData(dict, MetaMixin):
 
             
 
+class _LazyValue(object):
+    """Placeholder for a value of a :class:`LazySpaceData` not yet read
+
+    Attributes
+    ----------
+    loader : callable
+        Called with no arguments to read the value (a :class:`dmarray`).
+    attrs : dict
+        Attributes of the value, read eagerly; these are the ``attrs`` of
+        the value once read.
+    """
+    def __init__(self, loader, attrs=None):
+        self.loader = loader
+        self.attrs = {} if attrs is None else attrs
+
+    def load(self):
+        """Read the value and give it the attributes of this placeholder"""
+        value = self.loader()
+        value.attrs = self.attrs
+        return value
+
+
+class LazySpaceData(SpaceData):
+    """
+    SpaceData which reads values from their source on first access
+
+    Values which have not been read are stored as loaders, and are read
+    and stored as soon as they are accessed (by indexing, :meth:`get`,
+    :meth:`values` or :meth:`items`). Attributes are not lazy.
+    This is normally created with the ``lazy`` option of :func:`fromCDF`,
+    :func:`fromHDF5`, or :func:`fromNC3`, so opening a file with many
+    variables is fast, and only the variables used are read.
+
+    If a memory budget is given, values which have been read are
+    discarded, least-recently-used first, when the total size of values
+    read exceeds the budget; they are read again from the source on the
+    next access. Changes to the data of a value (but not its attributes)
+    are lost if it is discarded. Values assigned directly are never
+    discarded.
+
+    Copying (including :meth:`copy`) or pickling reads all values, and
+    the copy is a :class:`SpaceData`. Other access to values, such as
+    :meth:`pop` or the string representation, also reads them.
+
+    If the source is an open file, it is closed by :meth:`close` (or
+    when this is deleted, or at the end of a ``with`` block); values not
+    yet read cannot be read after that.
+
+    .. versionadded:: 0.2.3
+
+    Other Parameters
+    ----------------
+    budget : int (optional)
+        Maximum total size, in bytes, of values read from the source to
+        keep in memory (default: no limit). The most recently read value
+        is always kept, even if larger than the budget.
+    source : object (optional)
+        Open file from which values are read, closed (by calling its
+        ``close`` method) by :meth:`close`.
+
+    Examples
+    --------
+    >>> import spacepy.datamodel as dm
+    >>> data = dm.fromCDF('test.cdf', lazy=True, budget=2 ** 30)
+    >>> data.isLoaded('Epoch')
+    False
+    >>> data['Epoch'].attrs['FIELDNAM']
+    'Epoch'
+    >>> data.isLoaded('Epoch')
+    True
+
+    .. currentmodule:: spacepy.datamodel
+    .. autosummary::
+        ~LazySpaceData.addLazy
+        ~LazySpaceData.close
+        ~LazySpaceData.isLoaded
+        ~LazySpaceData.unload
+    .. automethod:: addLazy
+    .. automethod:: close
+    .. automethod:: isLoaded
+    .. automethod:: unload
+    """
+    def __init__(self, *args, **kwargs):
+        self._budget = kwargs.pop('budget', None)
+        self._source = kwargs.pop('source', None)
+        self._lazy = {} # loader for every lazy value, by key
+        self._lru = collections.OrderedDict() # size of values read, by key
+        super(LazySpaceData, self).__init__(*args, **kwargs)
+
+    def __del__(self):
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Close the source of values, if it is an open file
+
+        Values which have not been read can no longer be read.
+        """
+        source = self.__dict__.pop('_source', None)
+        if source is not None:
+            source.close()
+
+    def __iter__(self):
+        #Not dict's iterator, so dict(self) and ** use __getitem__
+        return dict.__iter__(self)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __getitem__(self, key):
+        value = super(LazySpaceData, self).__getitem__(key)
+        if isinstance(value, _LazyValue):
+            value = value.load()
+            dict.__setitem__(self, key, value)
+            self._lru[key] = getattr(value, 'nbytes', 0)
+            self._evict(key)
+        elif not isinstance(key, list) and key in self._lru:
+            #Most recently used goes to end
+            self._lru[key] = self._lru.pop(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._lazy.pop(key, None)
+        self._lru.pop(key, None)
+        super(LazySpaceData, self).__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._lazy.pop(key, None)
+        self._lru.pop(key, None)
+        super(LazySpaceData, self).__delitem__(key)
+
+    def _evict(self, keep):
+        """Discard least-recently used values until within budget
+
+        Parameters
+        ----------
+        keep : str
+            Key of a value never to discard.
+        """
+        if self._budget is None:
+            return
+        total = sum(self._lru.values())
+        for key in list(self._lru):
+            if total <= self._budget:
+                break
+            if key == keep:
+                continue
+            total -= self._lru[key]
+            self.unload(key)
+
+    def addLazy(self, key, loader, attrs=None):
+        """
+        Add a value which is read when first accessed
+
+        Parameters
+        ----------
+        key : str
+            Key of the value.
+        loader : callable
+            Called with no arguments to read the value; must
+            return a :class:`dmarray`.
+        attrs : dict (optional)
+            Attributes of the value (default empty); these replace
+            any attributes from ``loader``.
+
+        Examples
+        --------
+        >>> import spacepy.datamodel as dm
+        >>> data = dm.LazySpaceData()
+        >>> data.addLazy('x', lambda: dm.dmarray([1, 2, 3]), {'units': 'm'})
+        >>> data['x']
+        dmarray([1, 2, 3])
+        """
+        self._lru.pop(key, None)
+        self._lazy[key] = _LazyValue(loader, attrs)
+        dict.__setitem__(self, key, self._lazy[key])
+
+    def isLoaded(self, key):
+        """
+        Check if a value has been read
+
+        Parameters
+        ----------
+        key : str
+            Key of the value.
+
+        Returns
+        -------
+        out : bool
+            False if the value will be read from the source on next access;
+            True if in memory.
+        """
+        return not isinstance(dict.__getitem__(self, key), _LazyValue)
+
+    def unload(self, key):
+        """
+        Discard a value which has been read, to be read again on next access
+
+        Does nothing for values which have not been read or which were
+        assigned directly rather than read from a source.
+
+        Parameters
+        ----------
+        key : str
+            Key of the value.
+        """
+        if key in self._lru:
+            del self._lru[key]
+            dict.__setitem__(self, key, self._lazy[key])
+
+    def __reduce__(self):
+        """Pickle or copy as a :class:`SpaceData`, reading all values"""
+        return (SpaceData, (), {'attrs': self.attrs}, None, iter(self.items()))
+
+    def get(self, key, default=None):
+        """Get a value, reading it if necessary; default if key not found"""
+        return self[key] if key in self else default
+
+    def setdefault(self, key, default=None):
+        """Get a value, reading it if necessary; set to default if not found"""
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def pop(self, key, *args):
+        """Remove and return a value, reading it if necessary"""
+        if key not in self:
+            return super(LazySpaceData, self).pop(key, *args)
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self):
+        """Remove and return a (key, value) pair, reading it if necessary"""
+        key, value = super(LazySpaceData, self).popitem()
+        if isinstance(value, _LazyValue):
+            value = value.load()
+        self._lazy.pop(key, None)
+        self._lru.pop(key, None)
+        return key, value
+
+    def clear(self):
+        self._lazy.clear()
+        self._lru.clear()
+        super(LazySpaceData, self).clear()
+
+    def copy(self):
+        """Copy as a :class:`SpaceData`, reading all values (not a deep copy)"""
+        return SpaceData(self.items(), attrs=self.attrs)
+
+    def values(self):
+        """List of all values, reading any not yet read"""
+        return [self[k] for k in self]
+
+    def items(self):
+        """List of all (key, value) pairs, reading any values not yet read"""
+        return [(k, self[k]) for k in self]
+
+
 def convertKeysToStr(SDobject):
     if isinstance(SDobject, SpaceData):
         newSDobject = SpaceData()
@@ -795,6 +1063,21 @@ def fromCDF(fname, **kwargs):
     file : string
         the name of the cdf file to be loaded into a datamodel
 
+    Other Parameters
+    ----------------
+    lazy : bool (optional)
+        read each variable only when first accessed, returning a
+        :class:`LazySpaceData` (default False, read all variables now).
+        Attributes are always read immediately. The CDF stays open
+        until :meth:`LazySpaceData.close`.
+
+        .. versionadded:: 0.2.3
+    budget : int (optional)
+        if ``lazy``, maximum bytes of variables to keep in memory
+        (default no limit); see :class:`LazySpaceData`.
+
+        .. versionadded:: 0.2.3
+
     Returns
     -------
     out : spacepy.datamodel.SpaceData
@@ -804,6 +1087,9 @@ def fromCDF(fname, **kwargs):
     --------
     >>> import spacepy.datamodel as dm
     >>> data = dm.fromCDF('test.cdf')
+    >>> #Only read the variables used
+    >>> with dm.fromCDF('test.cdf', lazy=True) as data:
+    ...     epoch = data['Epoch']
 
     See Also
     --------
@@ -815,8 +1101,40 @@ def fromCDF(fname, **kwargs):
     except ImportError:
         raise ImportError("CDF converter requires NASA CDF library and SpacePy's pyCDF")
 
-    with pycdf.CDF(fname) as cdfdata:
-        return cdfdata.copy()
+    if not kwargs.get('lazy', False):
+        with pycdf.CDF(fname) as cdfdata:
+            return cdfdata.copy()
+    #Kept open (and metadata read once) for reading variables later
+    cdfdata = pycdf.CDF(fname)
+    try:
+        SDobject = LazySpaceData(attrs=cdfdata.attrs.copy(),
+                                 budget=kwargs.get('budget', None),
+                                 source=cdfdata)
+        for key in cdfdata:
+            SDobject.addLazy(key, partial(_readCDFVar, cdfdata, key),
+                             cdfdata[key].attrs.copy())
+    except:
+        cdfdata.close()
+        raise
+    return SDobject
+
+
+def _readCDFVar(cdfdata, key):
+    """Read one variable from a CDF, for :func:`fromCDF`
+
+    Parameters
+    ----------
+    cdfdata : spacepy.pycdf.CDF
+        Open CDF
+    key : str
+        Name of the variable
+
+    Returns
+    -------
+    out : spacepy.pycdf.VarCopy
+        Data of the variable.
+    """
+    return cdfdata[key].copy()
 
 def toCDF(fname, SDobject, **kwargs):
     '''
@@ -946,6 +1264,20 @@ def fromHDF5(fname, **kwargs):
     file : string
         the name of the HDF5/netCDF4 file to be loaded into a datamodel
 
+    Other Parameters
+    ----------------
+    lazy : bool (optional)
+        read each dataset only when first accessed, returning a
+        :class:`LazySpaceData` for each group (default False, read all
+        datasets now). Attributes are always read immediately.
+
+        .. versionadded:: 0.2.3
+    budget : int (optional)
+        if ``lazy``, maximum bytes of datasets to keep in memory, for
+        each group (default no limit); see :class:`LazySpaceData`.
+
+        .. versionadded:: 0.2.3
+
     Returns
     -------
     out : spacepy.datamodel.SpaceData
@@ -998,7 +1330,9 @@ def fromHDF5(fname, **kwargs):
     else:
         path = kwargs['path']
 
-    SDobject = SpaceData()
+    lazy = kwargs.get('lazy', False)
+    SDobject = LazySpaceData(budget=kwargs.get('budget', None)) if lazy \
+               else SpaceData()
     allowed_elems = [hdf.Group, hdf.Dataset]
     ##carry over the attributes
     hdfcarryattrs(SDobject, hfile, path)
@@ -1007,7 +1341,14 @@ def fromHDF5(fname, **kwargs):
         #try:
             if type(value) is allowed_elems[0]: #if a group
                 SDobject[key] = SpaceData()
-                SDobject[key] = fromHDF5(hfile, path=path+'/'+key)
+                SDobject[key] = fromHDF5(hfile, path=path+'/'+key, lazy=lazy,
+                                         budget=kwargs.get('budget', None))
+            elif type(value) is allowed_elems[1] and lazy:
+                SDobject.addLazy(key, partial(
+                    _readHDF5Dataset, os.path.abspath(hfile.filename),
+                    path+'/'+key))
+                hdfcarryattrs(dict.__getitem__(SDobject, key), hfile,
+                              path+'/'+key)
             elif type(value) is allowed_elems[1]: #if a dataset
                 try:
                     SDobject[key] = dmarray(value)
@@ -1019,6 +1360,28 @@ def fromHDF5(fname, **kwargs):
     if path=='/': hfile.close()
     return SDobject
 
+def _readHDF5Dataset(fname, path):
+    """Read one dataset from an HDF5 file, for :func:`fromHDF5`
+
+    Parameters
+    ----------
+    fname : str
+        Path to the HDF5 file
+    path : str
+        Path of the dataset within the file
+
+    Returns
+    -------
+    out : dmarray
+        Data of the dataset (containing None if zero-sized)
+    """
+    import h5py as hdf
+    with hdf.File(fname, mode='r') as hfile:
+        try:
+            return dmarray(hfile[path])
+        except (TypeError, ZeroDivisionError): #zero-sized DataSets
+            return dmarray(None)
+
 def toHDF5(fname, SDobject, **kwargs):
     '''
     Create an HDF5 file from a SpacePy datamodel representation
@@ -1194,26 +1557,89 @@ def toHDF5(fname, SDobject, **kwargs):
             hfile.close()
 
 
-def fromNC3(fname):
+def fromNC3(fname, **kwargs):
+    '''
+    Create a SpacePy datamodel representation of a netCDF3 file
+
+    Parameters
+    ----------
+    file : string
+        the name of the netCDF3 file to be loaded into a datamodel
+
+    Other Parameters
+    ----------------
+    lazy : bool (optional)
+        read each variable only when first accessed, returning a
+        :class:`LazySpaceData` (default False, read all variables now).
+        Attributes are always read immediately.
+
+        .. versionadded:: 0.2.3
+    budget : int (optional)
+        if ``lazy``, maximum bytes of variables to keep in memory
+        (default no limit); see :class:`LazySpaceData`.
+
+        .. versionadded:: 0.2.3
+
+    Returns
+    -------
+    out : spacepy.datamodel.SpaceData
+        SpaceData with associated attributes and variables in dmarrays
+    '''
     try:
         from scipy.io import netcdf as nc
     except ImportError:
         raise ImportError('SciPy is required to import netcdf3')
 
-    ncfile = nc.netcdf_file(fname, mode='r', mmap=False)
+    lazy = kwargs.get('lazy', False)
+    #mmap to read only the header now if lazy
+    ncfile = nc.netcdf_file(fname, mode='r', mmap=lazy)
 
-    SDobject = SpaceData(attrs=dmcopy(ncfile._attributes))
+    if lazy:
+        SDobject = LazySpaceData(attrs=dmcopy(ncfile._attributes),
+                                 budget=kwargs.get('budget', None))
+        fname = os.path.abspath(fname)
+    else:
+        SDobject = SpaceData(attrs=dmcopy(ncfile._attributes))
 
     ##carry over the groups and datasets
     for key, value in ncfile.variables.items():
+        if lazy:
+            SDobject.addLazy(key, partial(_readNC3Var, fname, key),
+                             dmcopy(value._attributes))
+            continue
         #try:
-            SDobject[key] = dmarray(dmcopy(value.data), attrs=dmcopy(value._attributes))
+        SDobject[key] = dmarray(dmcopy(value.data), attrs=dmcopy(value._attributes))
         #except (TypeError, ZeroDivisionError): #ZeroDivisionError catches zero-sized DataSets
         #    SDobject[key] = dmarray(None)
+    value = None #Release mmap before close
     ncfile.close()
     return SDobject
 
 
+def _readNC3Var(fname, key):
+    """Read one variable from a netCDF3 file, for :func:`fromNC3`
+
+    Parameters
+    ----------
+    fname : str
+        Path to the netCDF3 file
+    key : str
+        Name of the variable
+
+    Returns
+    -------
+    out : dmarray
+        Data of the variable.
+    """
+    from scipy.io import netcdf as nc
+    ncfile = nc.netcdf_file(fname, mode='r', mmap=True)
+    try:
+        data = dmarray(numpy.array(ncfile.variables[key].data))
+    finally:
+        ncfile.close()
+    return data
+
+
 
 def toHTML(fname, SDobject, attrs=(),
            varLinks=False, linkFormat=None, echo=False, tableTag='<table border="1">'):
@@ -312,7 +312,7 @@ def getMPstandoff(ticks, dbase='QDhourly', alpha=[]):
     >>> emp.getMPstandoff(data)
     array([ 9.96096838,  8.96790412])
     """
-    if type(ticks) == spt.Ticktock:
+    if isinstance(ticks, spt.Ticktock):
         omni = om.get_omni(ticks, dbase=dbase)
         P, Bz = omni['Pdyn'], omni['BzIMF']
     elif isinstance(ticks, dict): 
@@ -52,6 +52,8 @@ try:
     from collections.abc import MutableMapping, MutableSequence
 except ImportError:
     from collections import MutableMapping, MutableSequence
+import collections
+import concurrent.futures
 import ctypes
 import ctypes.util
 import datetime
@@ -60,8 +62,10 @@ import operator
 import os
 import os.path
 import shutil
+import struct
 import sys
 import tempfile
+import threading
 import warnings
 import weakref
 
@@ -83,6 +87,37 @@ try:
 except NameError:
     str_classes = (str, bytes)
 
+#Zero of datetime64
+_DATETIME_1970 = datetime.datetime(1970, 1, 1)
+#Zero of EPOCH and EPOCH16
+_EPOCH_ZERO = numpy.datetime64('0000-01-01T00:00:00', 'ms')
+#Zero of TT2000, as UTC
+_TT2000_ZERO = numpy.datetime64('2000-01-01T11:58:55.816', 'ns')
+#Range of EPOCH to convert in bulk to datetime, and to datetime64
+_EPOCH_RANGE = tuple(
+    float((numpy.datetime64(d, 'ms') - _EPOCH_ZERO).astype(numpy.int64))
+    for d in ('0001-01-01', '9999-12-31', '10000-01-01'))
+#Seconds since 1970 to convert to EPOCH/EPOCH16 in bulk, and EPOCH zero
+_EPOCH_SECONDS = tuple(
+    int(numpy.datetime64(d, 's').astype(numpy.int64))
+    for d in ('0001-01-01', '9999-01-01', '0000-01-01', '9999-12-31'))
+#Range of EPOCH16 to convert in bulk to datetime, to datetime64[ns];
+#EPOCH16 of 1970
+_EPOCH16_RANGE = tuple(
+    float((numpy.datetime64(d, 's') - _EPOCH_ZERO.astype('datetime64[s]'))
+          .astype(numpy.int64))
+    for d in ('0001-01-01', '9999-12-31', '1678-01-01', '2262-01-01',
+              '1970-01-01'))
+#TAI (seconds since 1958) of TT2000 zero, whole seconds and fraction
+_TT2000_TAI_SECONDS = 1325419167
+_TT2000_TAI_FRAC = 0.816
+#Valid values for time_as (see CDF.time_as)
+_TIME_AS = ('datetime', 'datetime64', 'tai')
+#Microseconds since 1970 to convert to TT2000 in bulk
+_TT2000_USEC = tuple(
+    int(numpy.datetime64(d, 'us').astype(numpy.int64))
+    for d in ('1972-01-01', '2262-01-01'))
+
 
 class Library(object):
     """
@@ -120,14 +155,17 @@ class Library(object):
         ~Library.tt2000_to_datetime
         ~Library.tt2000_to_epoch
         ~Library.tt2000_to_epoch16
-        v_datetime_to_epoch
-        v_datetime_to_epoch16
-        v_datetime_to_tt2000
-        v_epoch_to_datetime
+        ~Library.v_datetime_to_epoch
+        ~Library.v_datetime_to_epoch16
+        ~Library.v_datetime_to_tt2000
+        ~Library.v_epoch_to_datetime
+        ~Library.v_epoch_to_datetime64
         v_epoch_to_tt2000
-        v_epoch16_to_datetime
+        ~Library.v_epoch16_to_datetime
+        ~Library.v_epoch16_to_datetime64
         v_epoch16_to_tt2000
-        v_tt2000_to_datetime
+        ~Library.v_tt2000_to_datetime
+        ~Library.v_tt2000_to_datetime64
         v_tt2000_to_epoch
         v_tt2000_to_epoch16
         libpath
@@ -156,37 +194,19 @@ class Library(object):
     .. automethod:: tt2000_to_epoch
     .. automethod:: tt2000_to_epoch16
 
-    .. method:: v_datetime_to_epoch(datetime)
-    
-        A vectorized version of :meth:`datetime_to_epoch` which takes a
-        numpy array of datetimes as input and returns an array of epochs.
-
-    .. method:: v_datetime_to_epoch16(datetime)
-    
-        A vectorized version of :meth:`datetime_to_epoch16` which takes a
-        numpy array of datetimes as input and returns an array of epoch16.
-
-    .. method:: v_datetime_to_tt2000(datetime)
-    
-        A vectorized version of :meth:`datetime_to_tt2000` which takes a
-        numpy array of datetimes as input and returns an array of TT2000.
-
-    .. method:: v_epoch_to_datetime(epoch)
-    
-        A vectorized version of :meth:`epoch_to_datetime` which takes a
-        numpy array of epochs as input and returns an array of datetimes.
+    .. automethod:: v_datetime_to_epoch
+    .. automethod:: v_datetime_to_epoch16
+    .. automethod:: v_datetime_to_tt2000
+    .. automethod:: v_epoch_to_datetime
+    .. automethod:: v_epoch_to_datetime64
 
     .. method:: v_epoch_to_tt2000(epoch)
     
         A vectorized version of :meth:`epoch_to_tt2000` which takes a
         numpy array of epochs as input and returns an array of tt2000s.
 
-    .. method:: v_epoch16_to_datetime(epoch0, epoch1)
-    
-        A vectorized version of :meth:`epoch16_to_datetime` which takes
-        a numpy array of epoch16 as input and returns an array of datetimes.
-        An epoch16 is a pair of doubles; the input array's last dimension
-        must be two (and the returned array will have one fewer dimension).
+    .. automethod:: v_epoch16_to_datetime
+    .. automethod:: v_epoch16_to_datetime64
 
     .. method:: v_epoch16_to_tt2000(epoch16)
     
@@ -195,10 +215,8 @@ class Library(object):
         An epoch16 is a pair of doubles; the input array's last dimension
         must be two (and the returned array will have one fewer dimension).
 
-    .. method:: v_tt2000_to_datetime(tt2000)
-    
-        A vectorized version of :meth:`tt2000_to_datetime` which takes
-        a numpy array of tt2000 as input and returns an array of datetimes.
+    .. automethod:: v_tt2000_to_datetime
+    .. automethod:: v_tt2000_to_datetime64
 
     .. method:: v_tt2000_to_epoch(tt2000)
     
@@ -234,6 +252,9 @@ class Library(object):
 
         if not 'CDF_TMP' in os.environ:
             os.environ['CDF_TMP'] = tempfile.gettempdir()
+        #Library keeps selection state; calls from different threads
+        #must not interleave. See Var.prefetch.
+        self._lock = threading.Lock()
 
         if not library:
             if not libpath:
@@ -399,15 +420,17 @@ class Library(object):
                                   'TT2000 functions will not work.')
                 self.datetime_to_tt2000 = self._datetime_to_tt2000_typepunned
 
-        v_epoch16_to_datetime = numpy.frompyfunc(
+        #Scalar-at-a-time versions, for values outside the range of the
+        #array-based conversions
+        _v_epoch16_to_datetime = numpy.frompyfunc(
             self.epoch16_to_datetime, 2, 1)
-        self.v_epoch16_to_datetime = \
-            lambda x: v_epoch16_to_datetime(x[..., 0], x[..., 1])
-        self.v_epoch_to_datetime = numpy.frompyfunc(
+        self._v_epoch16_to_datetime = \
+            lambda x: _v_epoch16_to_datetime(x[..., 0], x[..., 1])
+        self._v_epoch_to_datetime = numpy.frompyfunc(
             self.epoch_to_datetime, 1, 1)
-        self.v_tt2000_to_datetime = numpy.frompyfunc(
+        self._v_tt2000_to_datetime = numpy.frompyfunc(
             self.tt2000_to_datetime, 1, 1)
-        self.v_datetime_to_epoch = numpy.vectorize(
+        self._v_datetime_to_epoch = numpy.vectorize(
             self.datetime_to_epoch, otypes=[numpy.float64])
         v_datetime_to_epoch16 = numpy.frompyfunc(
             self.datetime_to_epoch16, 1, 2)
@@ -424,8 +447,8 @@ class Library(object):
                     -1, -2)
             else:
                 return retval
-        self.v_datetime_to_epoch16 = _v_datetime_to_epoch16
-        self.v_datetime_to_tt2000 = numpy.vectorize(
+        self._v_datetime_to_epoch16 = _v_datetime_to_epoch16
+        self._v_datetime_to_tt2000 = numpy.vectorize(
             self.datetime_to_tt2000, otypes=[numpy.int64])
         self.v_epoch_to_tt2000 = numpy.vectorize(
             self.epoch_to_tt2000, otypes=[numpy.int64])
@@ -456,6 +479,7 @@ class Library(object):
             self.tt2000_to_datetime = self._bad_tt2000
             self.v_datetime_to_tt2000 = self._bad_tt2000
             self.v_tt2000_to_datetime = self._bad_tt2000
+            self.v_tt2000_to_datetime64 = self._bad_tt2000
             self.epoch_to_tt2000 = self._bad_tt2000
             self.v_epoch_to_tt2000 = self._bad_tt2000
             self.tt2000_to_epoch = self._bad_tt2000
@@ -465,6 +489,9 @@ class Library(object):
             self.tt2000_to_epoch16 = self._bad_tt2000
             self.v_tt2000_to_epoch16 = self._bad_tt2000
 
+        #TT2000 leap second table, filled in when needed
+        self._leaps = None
+
         #Default to V2 CDF
         self.set_backward(True)
         # User has not explicitly called set_backward
@@ -633,14 +660,12 @@ class Library(object):
         =====
         CDFWarning : if CDF library reports a warning
         """
+        with self._lock:
+            status = self._library.CDFlib(*(args + (const.NULL_, )))
         if 'ignore' in kwargs:
-            return self.check_status(self._library.CDFlib(
-                *(args + (const.NULL_, ))
-                ), kwargs['ignore'])
+            return self.check_status(status, kwargs['ignore'])
         else:
-            return self.check_status(self._library.CDFlib(
-                *(args + (const.NULL_, ))
-                ))
+            return self.check_status(status)
 
     def set_backward(self, backward=True):
         """
@@ -1174,6 +1199,468 @@ class Library(object):
             return (-1., -1.) #Failure; illegal epoch
         return (epoch16[0], epoch16[1])
 
+    def _tt2000_leaps(self):
+        """Find the leap second table used by the library for TT2000
+
+        The start of every month from 1972 to 2262 is converted to TT2000
+        by the library, so this table matches the library's, including
+        any update via ``CDF_LEAPSECONDSTABLE``. It is made on first
+        use and then kept.
+
+        Returns
+        =======
+        out : tuple of numpy.ndarray of int64
+            Each array has one value per change in TAI - UTC, starting
+            with 1972-01-01. First is UTC, as nanoseconds since TT2000
+            zero with no leap seconds (i.e. from datetime arithmetic);
+            second is TT2000 of the same times; last is TT2000 minus the
+            UTC value, until the next change.
+        """
+        if self._leaps is None:
+            months = numpy.arange('1972-01', '2262-02',
+                                  dtype='datetime64[M]')
+            tt2000 = numpy.array([self.datetime_to_tt2000(d) for d in
+                                  months.astype('datetime64[us]')
+                                  .astype(object)], dtype=numpy.int64)
+            naive = (months.astype('datetime64[ns]') - _TT2000_ZERO)\
+                    .astype(numpy.int64)
+            offset = tt2000 - naive
+            change = numpy.concatenate(([True], numpy.diff(offset) != 0))
+            self._leaps = (naive[change], tt2000[change], offset[change])
+        return self._leaps
+
+    def _tt2000_to_naive(self, tt2000):
+        """Convert TT2000 to UTC nanoseconds, no leap seconds
+
+        Only valid for TT2000 from 1972 on.
+
+        Parameters
+        ==========
+        tt2000 : numpy.ndarray of int64
+            TT2000 values, all 1972 and later
+
+        Returns
+        =======
+        naive : numpy.ndarray of int64
+            UTC as nanoseconds since TT2000 zero, without leap seconds.
+            Times in a leap second are the last nanosecond before it.
+        inleap : numpy.ndarray of bool
+            True where the input is in a leap second.
+        """
+        naive_leaps, tt2000_leaps, offset = self._tt2000_leaps()
+        idx = numpy.searchsorted(tt2000_leaps, tt2000, side='right') - 1
+        naive = tt2000 - offset[idx]
+        #Subtracting the offset from before a leap second puts times
+        #in that leap second at or after the start of the next day.
+        following = numpy.append(naive_leaps[1:],
+                                  numpy.iinfo(numpy.int64).max)[idx]
+        inleap = naive >= following
+        naive[inleap] = following[inleap] - 1
+        return naive, inleap
+
+    @staticmethod
+    def _to_datetime64(dt):
+        """Convert datetimes to datetime64 with at least us resolution
+
+        Returns
+        =======
+        out : numpy.ndarray of datetime64
+            Input as datetime64 (microseconds or finer), or None if it
+            cannot be converted in bulk (e.g. has time zones.)
+        """
+        dt = numpy.asanyarray(dt)
+        if dt.dtype.kind == 'M':
+            if numpy.datetime_data(dt.dtype)[0] \
+               in ('Y', 'M', 'W', 'D', 'h', 'm', 's', 'ms', 'generic'):
+                dt = dt.astype('datetime64[us]')
+            return dt
+        if dt.dtype != object:
+            return None
+        #Much faster than numpy's conversion from object; also fails
+        #(rather than numpy warning) if there are time zones
+        try:
+            usec = (dt - _DATETIME_1970) // datetime.timedelta(microseconds=1)
+        except TypeError:
+            return None
+        return numpy.asarray(usec, dtype=numpy.int64)\
+                    .astype('datetime64[us]')
+
+    def _to_datetime(self, dt):
+        """Get datetimes for values which are not converted in bulk"""
+        dt = numpy.asanyarray(dt)
+        if dt.dtype.kind == 'M':
+            dt = dt.astype('datetime64[us]').astype(object)
+        return dt
+
+    def v_epoch_to_datetime(self, epoch):
+        """
+        Converts CDF epoch values to datetimes
+
+        Vectorized version of :meth:`epoch_to_datetime`. Values
+        from 0001-01-01 to 9999-12-30 are converted with numpy array
+        operations; others are converted by the library, one at a time.
+
+        Parameters
+        ==========
+        epoch : array of float
+            epoch values from CDF
+
+        Returns
+        =======
+        out : numpy.ndarray of :class:`datetime.datetime`
+            dates and times corresponding to epoch. Invalid values are
+            set to usual epoch invalid value, i.e. last moment of year
+            9999.
+
+        See Also
+        ========
+        epoch_to_datetime, v_epoch_to_datetime64
+        """
+        epoch = numpy.asanyarray(epoch, dtype=numpy.float64)
+        bulk = (epoch >= _EPOCH_RANGE[0]) & (epoch < _EPOCH_RANGE[1])
+        out = numpy.empty(epoch.shape, dtype=object)
+        if not bulk.all():
+            out[~bulk] = self._v_epoch_to_datetime(epoch[~bulk])
+        out[bulk] = (_EPOCH_ZERO + numpy.floor(epoch[bulk])
+                     .astype('timedelta64[ms]')).astype(object)
+        return out[()] if out.ndim == 0 else out
+
+    def v_epoch_to_datetime64(self, epoch):
+        """
+        Converts CDF epoch values to numpy datetime64
+
+        This does not make Python objects and is much faster than
+        :meth:`v_epoch_to_datetime`.
+
+        .. versionadded:: 0.2.3
+
+        Parameters
+        ==========
+        epoch : array of float
+            epoch values from CDF
+
+        Returns
+        =======
+        out : numpy.ndarray of datetime64
+            dates and times corresponding to epoch, with millisecond
+            resolution (``datetime64[ms]``). Fill values and other
+            values outside of years 1 through 9999 are ``NaT``.
+
+        See Also
+        ========
+        v_epoch_to_datetime, v_datetime_to_epoch
+        """
+        epoch = numpy.asanyarray(epoch, dtype=numpy.float64)
+        good = (epoch >= _EPOCH_RANGE[0]) & (epoch < _EPOCH_RANGE[2])
+        ms = numpy.where(good, numpy.floor(numpy.where(good, epoch, 0.)),
+                         0.).astype(numpy.int64)
+        out = numpy.where(good, _EPOCH_ZERO + ms.astype('timedelta64[ms]'),
+                          numpy.datetime64('NaT', 'ms'))
+        return out[()] if out.ndim == 0 else out
+
+    def v_epoch16_to_datetime(self, epoch16):
+        """
+        Converts CDF epoch16 values to datetimes
+
+        Vectorized version of :meth:`epoch16_to_datetime`. Values
+        from 0001-01-01 to 9999-12-30 are converted with numpy array
+        operations; others are converted by the library, one at a time.
+
+        Parameters
+        ==========
+        epoch16 : array of float
+            epoch16 values from CDF. Last dimension is size 2, the two
+            values of each epoch16.
+
+        Returns
+        =======
+        out : numpy.ndarray of :class:`datetime.datetime`
+            dates and times corresponding to epoch16. Invalid values are
+            set to usual epoch invalid value, i.e. last moment of year
+            9999.
+
+        See Also
+        ========
+        epoch16_to_datetime, v_epoch16_to_datetime64
+        """
+        epoch16 = numpy.asanyarray(epoch16, dtype=numpy.float64)
+        sec, psec = epoch16[..., 0], epoch16[..., 1]
+        bulk = (sec >= _EPOCH16_RANGE[0]) & (sec < _EPOCH16_RANGE[1]) \
+               & (psec >= 0) & (psec < 1e12)
+        out = numpy.empty(sec.shape, dtype=object)
+        if not bulk.all():
+            out[~bulk] = self._v_epoch16_to_datetime(epoch16[~bulk])
+        #Round to microseconds, half up (as library breakdown)
+        usec = numpy.floor(sec[bulk]).astype(numpy.int64) * 1000000 \
+               + numpy.floor(psec[bulk] / 1e6 + 0.5).astype(numpy.int64)
+        out[bulk] = (_EPOCH_ZERO.astype('datetime64[us]')
+                     + usec.astype('timedelta64[us]')).astype(object)
+        return out[()] if out.ndim == 0 else out
+
+    def v_epoch16_to_datetime64(self, epoch16):
+        """
+        Converts CDF epoch16 values to numpy datetime64
+
+        This does not make Python objects and is much faster than
+        :meth:`v_epoch16_to_datetime`.
+
+        .. versionadded:: 0.2.3
+
+        Parameters
+        ==========
+        epoch16 : array of float
+            epoch16 values from CDF. Last dimension is size 2, the two
+            values of each epoch16.
+
+        Returns
+        =======
+        out : numpy.ndarray of datetime64
+            dates and times corresponding to epoch16, with nanosecond
+            resolution (``datetime64[ns]``). Fill values and other
+            values outside of the range of ``datetime64[ns]`` (about
+            1678 through 2261) are ``NaT``.
+
+        See Also
+        ========
+        v_epoch16_to_datetime, v_datetime_to_epoch16
+        """
+        epoch16 = numpy.asanyarray(epoch16, dtype=numpy.float64)
+        sec, psec = epoch16[..., 0], epoch16[..., 1]
+        good = (sec >= _EPOCH16_RANGE[2]) & (sec < _EPOCH16_RANGE[3]) \
+               & (psec >= 0) & (psec < 1e12)
+        sec = numpy.where(good, sec, _EPOCH16_RANGE[2])
+        psec = numpy.where(good, psec, 0.)
+        nsec = (numpy.floor(sec).astype(numpy.int64)
+                - int(_EPOCH16_RANGE[4])) * 1000000000 \
+                + numpy.floor(psec / 1e3 + 0.5).astype(numpy.int64)
+        out = numpy.where(good, nsec.astype('datetime64[ns]'),
+                          numpy.datetime64('NaT', 'ns'))
+        return out[()] if out.ndim == 0 else out
+
+    def v_tt2000_to_datetime(self, tt2000):
+        """
+        Converts CDF TT2000 values to datetimes
+
+        Vectorized version of :meth:`tt2000_to_datetime`. Values from
+        1972 on are converted with numpy array operations, using the
+        library's leap second table; earlier values (and the fill value)
+        are converted by the library, one at a time.
+
+        Parameters
+        ==========
+        tt2000 : array of int
+            TT2000 values from CDF
+
+        Returns
+        =======
+        out : numpy.ndarray of :class:`datetime.datetime`
+            dates and times corresponding to tt2000. Invalid values are
+            set to usual epoch invalid value, i.e. last moment of year
+            9999. Times in a leap second are truncated to
+            23:59:59.999999.
+
+        See Also
+        ========
+        tt2000_to_datetime, v_tt2000_to_datetime64
+        """
+        tt2000 = numpy.asanyarray(tt2000, dtype=numpy.int64)
+        bulk = tt2000 >= self._tt2000_leaps()[1][0]
+        out = numpy.empty(tt2000.shape, dtype=object)
+        if not bulk.all():
+            out[~bulk] = self._v_tt2000_to_datetime(tt2000[~bulk])
+        naive, inleap = self._tt2000_to_naive(tt2000[bulk])
+        usec = (naive + 500) // 1000 # Round half up
+        usec[inleap] = naive[inleap] // 1000
+        out[bulk] = (_TT2000_ZERO.astype('datetime64[us]')
+                     + usec.astype('timedelta64[us]')).astype(object)
+        return out[()] if out.ndim == 0 else out
+
+    def v_tt2000_to_datetime64(self, tt2000):
+        """
+        Converts CDF TT2000 values to numpy datetime64
+
+        This does not make Python objects and is much faster than
+        :meth:`v_tt2000_to_datetime`. Values from 1972 on are converted
+        with full precision; earlier values are converted by the library
+        with microsecond precision.
+
+        .. versionadded:: 0.2.3
+
+        Parameters
+        ==========
+        tt2000 : array of int
+            TT2000 values from CDF
+
+        Returns
+        =======
+        out : numpy.ndarray of datetime64
+            dates and times corresponding to tt2000, with nanosecond
+            resolution (``datetime64[ns]``). Times in a leap second are
+            truncated to 23:59:59.999999999. Fill values and times after
+            the end of the ``datetime64[ns]`` range (2262-04-11) are
+            ``NaT``.
+
+        See Also
+        ========
+        v_tt2000_to_datetime, v_datetime_to_tt2000
+        """
+        tt2000 = numpy.asanyarray(tt2000, dtype=numpy.int64)
+        bulk = tt2000 >= self._tt2000_leaps()[1][0]
+        out = numpy.empty(tt2000.shape, dtype='datetime64[ns]')
+        if not bulk.all():
+            early = self._v_tt2000_to_datetime(tt2000[~bulk])\
+                        .astype('datetime64[us]')
+            good = (early >= numpy.datetime64('1677-09-22', 'us')) \
+                   & (early < numpy.datetime64('2262-04-11', 'us')) \
+                   & (tt2000[~bulk] > const.FILLED_TT2000_VALUE.value + 1)
+            out[~bulk] = numpy.where(
+                good, early.astype('datetime64[ns]'),
+                numpy.datetime64('NaT', 'ns'))
+        naive, inleap = self._tt2000_to_naive(tt2000[bulk])
+        good = naive < numpy.iinfo(numpy.int64).max \
+               - _TT2000_ZERO.astype(numpy.int64)
+        out[bulk] = numpy.where(
+            good, _TT2000_ZERO + numpy.where(good, naive, 0)
+            .astype('timedelta64[ns]'), numpy.datetime64('NaT', 'ns'))
+        return out[()] if out.ndim == 0 else out
+
+    def v_datetime_to_epoch(self, dt):
+        """
+        Converts datetimes to CDF epoch values
+
+        Vectorized version of :meth:`datetime_to_epoch`. Times from
+        0001-01-01 to 9998-12-31 are converted with numpy array
+        operations; others, and timezone-aware datetimes, are converted
+        by the library, one at a time.
+
+        .. versionchanged:: 0.2.3
+           Accepts ``datetime64`` as well as :class:`~datetime.datetime`.
+
+        Parameters
+        ==========
+        dt : array of :class:`datetime.datetime` or datetime64
+            dates and times to convert
+
+        Returns
+        =======
+        out : numpy.ndarray of float
+            epoch corresponding to dt. ``NaT`` is converted to the fill
+            value.
+
+        See Also
+        ========
+        datetime_to_epoch, v_epoch_to_datetime
+        """
+        dt64 = self._to_datetime64(dt)
+        if dt64 is None:
+            return self._v_datetime_to_epoch(dt)
+        sec = dt64.astype('datetime64[s]')
+        secint = sec.astype(numpy.int64)
+        bulk = (secint >= _EPOCH_SECONDS[0]) & (secint < _EPOCH_SECONDS[1])
+        nat = secint == numpy.iinfo(numpy.int64).min
+        out = numpy.empty(dt64.shape, dtype=numpy.float64)
+        out[nat] = -1e31
+        rest = ~bulk & ~nat
+        if rest.any():
+            out[rest] = self._v_datetime_to_epoch(self._to_datetime(dt)[rest])
+        #Round to millisecond, half up
+        usec = (dt64[bulk] - sec[bulk]).astype('timedelta64[us]')\
+               .astype(numpy.int64)
+        out[bulk] = (secint[bulk] - _EPOCH_SECONDS[2]) * 1000 \
+                    + (usec + 500) // 1000
+        return out[()] if out.ndim == 0 else out
+
+    def v_datetime_to_epoch16(self, dt):
+        """
+        Converts datetimes to CDF epoch16 values
+
+        Vectorized version of :meth:`datetime_to_epoch16`. Times from
+        0001-01-01 to 9999-12-30 are converted with numpy array
+        operations; others, and timezone-aware datetimes, are converted
+        by the library, one at a time.
+
+        .. versionchanged:: 0.2.3
+           Accepts ``datetime64`` as well as :class:`~datetime.datetime`.
+
+        Parameters
+        ==========
+        dt : array of :class:`datetime.datetime` or datetime64
+            dates and times to convert
+
+        Returns
+        =======
+        out : numpy.ndarray of float
+            epoch16 corresponding to dt; last dimension is size 2, the
+            two values of each epoch16. ``NaT`` is converted to the fill
+            value.
+
+        See Also
+        ========
+        datetime_to_epoch16, v_epoch16_to_datetime
+        """
+        dt64 = self._to_datetime64(dt)
+        if dt64 is None:
+            return self._v_datetime_to_epoch16(dt)
+        sec = dt64.astype('datetime64[s]')
+        secint = sec.astype(numpy.int64)
+        bulk = (secint >= _EPOCH_SECONDS[0]) & (secint < _EPOCH_SECONDS[3])
+        nat = secint == numpy.iinfo(numpy.int64).min
+        out = numpy.empty(dt64.shape + (2,), dtype=numpy.float64)
+        out[nat] = -1e31
+        rest = ~bulk & ~nat
+        if rest.any():
+            out[rest] = self._v_datetime_to_epoch16(
+                self._to_datetime(dt)[rest])
+        out[bulk, 0] = secint[bulk] - _EPOCH_SECONDS[2]
+        out[bulk, 1] = (dt64[bulk] - sec[bulk]).astype('timedelta64[ps]')\
+                       .astype(numpy.int64)
+        return out
+
+    def v_datetime_to_tt2000(self, dt):
+        """
+        Converts datetimes to CDF TT2000 values
+
+        Vectorized version of :meth:`datetime_to_tt2000`. Times from
+        1972 to 2261 are converted with numpy array operations, using
+        the library's leap second table; others, and timezone-aware
+        datetimes, are converted by the library, one at a time.
+
+        .. versionchanged:: 0.2.3
+           Accepts ``datetime64`` as well as :class:`~datetime.datetime`.
+
+        Parameters
+        ==========
+        dt : array of :class:`datetime.datetime` or datetime64
+            dates and times to convert
+
+        Returns
+        =======
+        out : numpy.ndarray of int
+            tt2000 corresponding to dt. ``NaT`` is converted to the fill
+            value.
+
+        See Also
+        ========
+        datetime_to_tt2000, v_tt2000_to_datetime
+        """
+        dt64 = self._to_datetime64(dt)
+        if dt64 is None:
+            return self._v_datetime_to_tt2000(dt)
+        naive_leaps = self._tt2000_leaps()[0]
+        usec = dt64.astype('datetime64[us]').astype(numpy.int64)
+        bulk = (usec >= _TT2000_USEC[0]) & (usec < _TT2000_USEC[1])
+        nat = usec == numpy.iinfo(numpy.int64).min
+        out = numpy.empty(dt64.shape, dtype=numpy.int64)
+        out[nat] = const.FILLED_TT2000_VALUE.value
+        rest = ~bulk & ~nat
+        if rest.any():
+            out[rest] = self._v_datetime_to_tt2000(self._to_datetime(dt)[rest])
+        naive = (dt64[bulk].astype('datetime64[ns]') - _TT2000_ZERO)\
+                .astype(numpy.int64)
+        idx = numpy.searchsorted(naive_leaps, naive, side='right') - 1
+        out[bulk] = naive + self._tt2000_leaps()[2][idx]
+        return out[()] if out.ndim == 0 else out
+
     def _bad_tt2000(*args, **kwargs):
         """Convenience function for complaining that TT2000 not supported"""
         raise NotImplementedError(
@@ -1323,10 +1810,10 @@ class CDFException(Exception):
         self.string = 'CDF error ' + repr(status) + ', unable to get details.'
         message = ctypes.create_string_buffer(const.CDF_STATUSTEXT_LEN + 1)
         try:
-            retval = lib._library.CDFlib(const.SELECT_, const.CDF_STATUS_,
-                                         ctypes.c_long(status),
-                                         const.GET_, const.STATUS_TEXT_, message,
-                                         const.NULL_)
+            with lib._lock:
+                retval = lib._library.CDFlib(
+                    const.SELECT_, const.CDF_STATUS_, ctypes.c_long(status),
+                    const.GET_, const.STATUS_TEXT_, message, const.NULL_)
             if retval == const.CDF_OK:
                 if isinstance(message.value, str):
                     self.string = message.value
@@ -1451,6 +1938,164 @@ def _compress(obj, comptype=None, param=None):
     return (comptype, param)
 
 
+def _convert_time(data, cdftype, time_as):
+    """Convert raw values of a CDF time type
+
+    Parameters
+    ==========
+    data : numpy.ndarray
+        values as read from the CDF (float for EPOCH, pairs of float for
+        EPOCH16, int for TT2000)
+    cdftype : int
+        CDF type of `data`
+    time_as : str
+        Return as ``datetime``, ``datetime64`` or ``tai``; see
+        :meth:`CDF.time_as`.
+
+    Returns
+    =======
+    numpy.ndarray
+        Converted values.
+    """
+    if time_as == 'datetime':
+        return {const.CDF_EPOCH.value: lib.v_epoch_to_datetime,
+                const.CDF_EPOCH16.value: lib.v_epoch16_to_datetime,
+                const.CDF_TIME_TT2000.value: lib.v_tt2000_to_datetime,
+                }[cdftype](data)
+    if time_as == 'datetime64':
+        return {const.CDF_EPOCH.value: lib.v_epoch_to_datetime64,
+                const.CDF_EPOCH16.value: lib.v_epoch16_to_datetime64,
+                const.CDF_TIME_TT2000.value: lib.v_tt2000_to_datetime64,
+                }[cdftype](data)
+    #TAI, with NaN for fill (and anything else not a valid time)
+    if cdftype == const.CDF_TIME_TT2000.value:
+        data = numpy.asanyarray(data, dtype=numpy.int64)
+        #TT2000 is TT, which is a constant offset from TAI. Split whole
+        #seconds to avoid rounding the offset into a huge number.
+        sec, nsec = data // 1000000000, data % 1000000000
+        tai = (sec + _TT2000_TAI_SECONDS) + (nsec * 1e-9 + _TT2000_TAI_FRAC)
+        good = data > const.FILLED_TT2000_VALUE.value + 1
+    elif cdftype == const.CDF_EPOCH.value:
+        data = numpy.asanyarray(data, dtype=numpy.float64)
+        good = (data >= _EPOCH_RANGE[0]) & (data < _EPOCH_RANGE[2])
+        tai = numpy.asarray(spacepy.time.Ticktock(
+            numpy.where(good, data, _EPOCH_RANGE[0]).ravel(), 'CDF').TAI)\
+            .reshape(data.shape)
+    else: #EPOCH16
+        data = numpy.asanyarray(data, dtype=numpy.float64)
+        sec, psec = data[..., 0], data[..., 1]
+        good = (sec >= _EPOCH16_RANGE[0]) & (sec < _EPOCH16_RANGE[1] + 86400) \
+               & (psec >= 0) & (psec < 1e12)
+        tai = numpy.asarray(spacepy.time.Ticktock(
+            numpy.where(good, sec * 1000., _EPOCH_RANGE[0]).ravel(), 'CDF')
+                            .TAI).reshape(sec.shape) \
+            + numpy.where(good, psec, 0.) * 1e-12
+    return numpy.where(good, tai, numpy.nan)
+
+
+#Byte order of data in a CDF, by encoding (IEEE floating point only)
+_ENCODING_BYTEORDER = {
+    const.NETWORK_ENCODING.value: '>', const.SUN_ENCODING.value: '>',
+    const.DECSTATION_ENCODING.value: '<', const.SGi_ENCODING.value: '>',
+    const.IBMPC_ENCODING.value: '<', const.IBMRS_ENCODING.value: '>',
+    const.PPC_ENCODING.value: '>', const.HP_ENCODING.value: '>',
+    const.NeXT_ENCODING.value: '>', const.ALPHAOSF1_ENCODING.value: '<',
+    const.ALPHAVMSi_ENCODING.value: '<',
+}
+
+
+def _find_vvr(filename, varname):
+    """Find the data of a zVariable stored in one block of a CDF file
+
+    Reads the internal records of a version 3 CDF file directly (without
+    the library), following the CDF Internal Format Description.
+    Internal records are always big-endian.
+
+    Parameters
+    ==========
+    filename : str
+        Path to the CDF file
+    varname : str
+        Name of the zVariable
+
+    Returns
+    =======
+    tuple
+        Byte offset of the first record of data in the file;
+        byte order character (``<`` or ``>``) of the data;
+        True if the file is row-major.
+
+    Raises
+    ======
+    ValueError : if the data cannot be used directly, e.g. because the
+                 file or variable is compressed or the records are
+                 not stored contiguously
+    """
+    with open(filename, 'rb') as f:
+        def read(offset, fmt):
+            f.seek(offset)
+            return struct.unpack(fmt, f.read(struct.calcsize(fmt)))
+        magic1, magic2 = read(0, '>II')
+        if magic1 != 0xCDF30001:
+            raise ValueError('Only version 3 CDF files supported.')
+        if magic2 != 0x0000FFFF:
+            raise ValueError('CDF file is compressed.')
+        #CDR: RecordSize, RecordType, GDRoffset, Version, Release,
+        #Encoding, Flags
+        fields = read(8, '>qiqiiii')
+        gdr, encoding, flags = fields[2], fields[5], fields[6]
+        if not flags & 2:
+            raise ValueError('Multi-file CDF not supported.')
+        if not encoding in _ENCODING_BYTEORDER:
+            raise ValueError('Unsupported encoding {0}.'.format(encoding))
+        #GDR: RecordSize, RecordType, rVDRhead, zVDRhead
+        vdr = read(gdr, '>qiqq')[3]
+        encname = varname.encode('ascii')
+        while vdr:
+            #zVDR: RecordSize, RecordType, VDRnext, DataType, MaxRec,
+            #VXRhead, VXRtail, Flags, SRecords, rfuB, rfuC, rfuF,
+            #NumElems, Num, CPRorSPRoffset, BlockingFactor, Name
+            fields = read(vdr, '>qiqiiqqiiiiiiiqi256s')
+            if fields[16].rstrip(b'\0') == encname:
+                break
+            vdr = fields[2]
+        else:
+            raise ValueError('zVariable {0} not found.'.format(varname))
+        maxrec, vxr, vflags = fields[4], fields[5], fields[7]
+        if vflags & 4:
+            raise ValueError('Variable {0} is compressed.'.format(varname))
+        #Leaf entries (First, Last, Offset) of the VXR tree
+        entries = []
+        todo = [vxr]
+        while todo:
+            vxr = todo.pop()
+            while vxr:
+                #VXR: RecordSize, RecordType, VXRnext, Nentries, NusedEntries
+                vxrnext, nentries, nused = read(vxr, '>qiqii')[2:]
+                first = read(vxr + 28, '>{0}i'.format(nentries))
+                last = read(vxr + 28 + 4 * nentries, '>{0}i'.format(nentries))
+                offset = read(vxr + 28 + 8 * nentries,
+                              '>{0}q'.format(nentries))
+                for i in range(nused):
+                    rectype = read(offset[i] + 8, '>i')[0]
+                    if rectype == 6: #nested VXR
+                        todo.append(offset[i])
+                    elif rectype == 7: #VVR
+                        entries.append((first[i], last[i], offset[i]))
+                    else:
+                        raise ValueError(
+                            'Variable {0} is compressed.'.format(varname))
+                vxr = vxrnext
+    if maxrec >= 0 and (len(entries) != 1 or entries[0][0] != 0
+                        or entries[0][1] < maxrec):
+        raise ValueError(
+            'Variable {0} is not stored in one contiguous block.'.format(
+                varname))
+    #Data start after the VVR's RecordSize and RecordType
+    return (entries[0][2] + 12 if entries else None,
+            _ENCODING_BYTEORDER[encoding], bool(flags & 1))
+
+
 class CDF(MutableMapping, spacepy.datamodel.MetaMixin):
     """
     Python object representing a CDF file.
@@ -1473,6 +2118,11 @@ class CDF(MutableMapping, spacepy.datamodel.MetaMixin):
         existing CDF; False if creating a new one. A readonly
         CDF with many variables may be slow to close. See
         :meth:`readonly`.
+    time_as : str
+        How to return values of time variables, default
+        :class:`~datetime.datetime`. See :meth:`time_as`.
+
+        .. versionadded:: 0.2.3
 
     Raises
     ======
@@ -1660,12 +2310,16 @@ class CDF(MutableMapping, spacepy.datamodel.MetaMixin):
         ~CDF.compress
         ~CDF.copy
         ~CDF.from_data
+        ~CDF.iter_chunks
         ~CDF.new
         ~CDF.raw_var
         ~CDF.readonly
         ~CDF.save
+        ~CDF.time_as
+        ~CDF.time_slice
         ~CDF.var_num
         ~CDF.version
+        ~CDF.writer
 
     .. attribute:: CDF.attrs
 
@@ -1689,15 +2343,20 @@ class CDF(MutableMapping, spacepy.datamodel.MetaMixin):
     .. automethod:: compress
     .. automethod:: copy
     .. automethod:: from_data
+    .. automethod:: iter_chunks
     .. automethod:: new
     .. automethod:: raw_var
     .. automethod:: readonly
     .. automethod:: save
+    .. automethod:: time_as
+    .. automethod:: time_slice
     .. automethod:: var_num
     .. automethod:: version
+    .. automethod:: writer
 
     """
-    def __init__(self, pathname, masterpath=None, create=None, readonly=None):
+    def __init__(self, pathname, masterpath=None, create=None, readonly=None,
+                 time_as=None):
         """Open or create a CDF file.
 
         Parameters
@@ -1714,6 +2373,9 @@ class CDF(MutableMapping, spacepy.datamodel.MetaMixin):
         readonly : bool
             Open the CDF read-only. Default True if opening an
             existing CDF; False if creating a new one.
+        time_as : str
+            How to return values of time variables, default
+            :class:`~datetime.datetime`. See :meth:`time_as`.
 
         Raises
         ======
@@ -1744,13 +2406,17 @@ class CDF(MutableMapping, spacepy.datamodel.MetaMixin):
                 'pathname must be string-like: {0}'.format(pathname))
         self._handle = ctypes.c_void_p(None)
         self._opened = False
+        self._meta = None
+        """Snapshot of all metadata while readonly, see :class:`_Metadata`"""
+        self._time_as = 'datetime'
+        self.time_as(time_as)
         if masterpath is None and not create:
             self._open(True if readonly is None else readonly)
         elif masterpath:
             self._from_master(masterpath.encode())
         else:
             self._create()
-        lib.call(const.SELECT_, const.CDF_zMODE_, ctypes.c_long(2))
+        self._call(const.SELECT_, const.CDF_zMODE_, ctypes.c_long(2))
         self._attrlistref = weakref.ref(gAttrList(self))
         self.backward = self.version()[0] < 3
         self._var_nums = {}
@@ -1856,6 +2522,8 @@ class CDF(MutableMapping, spacepy.datamodel.MetaMixin):
         @return: number of zVars in the CDF
         @rtype: int
         """
+        if self._meta is not None:
+            return len(self._meta.vars)
         count = ctypes.c_long(0)
         self._call(const.GET_, const.CDF_NUMzVARS_, ctypes.byref(count))
         return count.value
@@ -1875,6 +2543,8 @@ class CDF(MutableMapping, spacepy.datamodel.MetaMixin):
         key = key.rstrip()
         if key in self._var_nums:
             return True
+        if self._meta is not None:
+            return key in self._meta.var_nums
         status = self._call(const.CONFIRM_, const.zVAR_EXISTENCE_, key,
                             ignore=(const.NO_SUCH_VAR,))
         return status != const.NO_SUCH_VAR
@@ -1927,6 +2597,8 @@ class CDF(MutableMapping, spacepy.datamodel.MetaMixin):
 
         lib.call(const.OPEN_, const.CDF_, self.pathname, ctypes.byref(self._handle))
         self._opened = True
+        #Metadata snapshot is read on setting readonly, needs zMODE first
+        self._call(const.SELECT_, const.CDF_zMODE_, ctypes.c_long(2))
         if readonly: #Default is RW
             self.readonly(readonly)
 
@@ -2110,6 +2782,11 @@ class CDF(MutableMapping, spacepy.datamodel.MetaMixin):
         If the CDF has been changed since opening, setting readonly mode
         will have no effect.
 
+        While the CDF is readonly, the type, dimensions, and number of
+        records of every variable, and all attribute entries, are read
+        once and served from memory. This snapshot is discarded when
+        readonly mode is turned off.
+
         .. note::
             Closing a CDF that has been opened readonly, or setting readonly
             False, may take a substantial amount of time if there are many
@@ -2143,12 +2820,193 @@ class CDF(MutableMapping, spacepy.datamodel.MetaMixin):
         self._call(const.CONFIRM_, const.CDF_READONLY_MODE_,
                    ctypes.byref(mode))
         if mode.value == const.READONLYon.value:
+            if self._meta is None:
+                self._meta = _Metadata(self)
             return True
         elif mode.value == const.READONLYoff.value:
+            self._meta = None
             return False
         else:
             raise CDFError(const.BAD_READONLY_MODE.value)
 
+    def time_as(self, new_time_as=None):
+        """
+        Sets or checks how values of time variables are returned
+
+        By default, values of EPOCH, EPOCH16, and TT2000 variables are
+        returned as :class:`~datetime.datetime`. Large arrays of these
+        are slow to create and use a lot of memory; numpy
+        ``datetime64`` or TAI are faster and more compact, and can be
+        used directly to make a :class:`~spacepy.time.Ticktock`.
+
+        This affects reading data from variables (not attributes), and can
+        be overridden for a single read with :meth:`Var.get`. It does
+        not affect a :meth:`raw_var`. Writing is unaffected; either
+        :class:`~datetime.datetime` or ``numpy.datetime64`` can be written.
+
+        .. versionadded:: 0.2.3
+
+        Other Parameters
+        ================
+        new_time_as : str
+            ``'datetime'`` to return :class:`~datetime.datetime`;
+            ``'datetime64'`` to return ``numpy.datetime64`` (millisecond
+            resolution for EPOCH, nanosecond for others; fill is ``NaT``);
+            ``'tai'`` to return TAI seconds since 1958 as float, as
+            :attr:`~spacepy.time.Ticktock.TAI` (fill is ``NaN``).
+            Leave out to check only.
+
+        Returns
+        =======
+        out : str
+            How time values are returned.
+
+        Raises
+        ======
+        ValueError : if `new_time_as` is not a valid value
+
+        Examples
+        ========
+        >>> from spacepy import pycdf
+        >>> import spacepy.time
+        >>> cdffile = pycdf.CDF('cdf_filename.cdf', time_as='tai')
+        >>> t = spacepy.time.Ticktock(cdffile['Epoch'][...], 'TAI')
+        >>> cdffile.time_as('datetime64')
+        'datetime64'
+        >>> cdffile['Epoch'][0]
+        numpy.datetime64('2009-01-01T00:00:00.000000000')
+        """
+        if new_time_as is not None:
+            if new_time_as not in _TIME_AS:
+                raise ValueError('time_as must be one of {0}'.format(
+                    ', '.join(_TIME_AS)))
+            self._time_as = new_time_as
+        return self._time_as
+
+    def iter_chunks(self, varnames=None, nrec=10000, time_as=None):
+        """
+        Iterate over aligned blocks of records of several variables
+
+        Each iteration returns the same range of records from every
+        variable, read as in :meth:`Var.iter_chunks`, so memory use
+        does not depend on the size of the CDF. The ``DEPEND_0`` of
+        each variable is included, converted to times as for reading
+        a variable.
+
+        .. warning::
+            Unless converted, each block is a view of a buffer
+            which is overwritten by the next block. Copy any data to keep
+            past the next iteration.
+
+        .. versionadded:: 0.2.3
+
+        Other Parameters
+        ================
+        varnames : list of str
+            Variables to read; default all. The ``DEPEND_0`` of each is
+            added if not included.
+        nrec : int
+            Number of records in each block (default 10000).
+        time_as : str
+            How to return values of time variables; see
+            :meth:`time_as`.
+
+        Returns
+        =======
+        out : iterator of dict
+            For each block, the data of each variable, keyed by name.
+            Variables which are not record-varying are read once and
+            returned with every block. Variables with fewer records than
+            the block's range have fewer (possibly zero) records.
+
+        Examples
+        ========
+        >>> from spacepy import pycdf
+        >>> with pycdf.CDF('cdf_filename.cdf') as cdffile:
+        ...     for block in cdffile.iter_chunks(['Counts'], 3600):
+        ...         hourly = block['Counts'].mean(axis=0)
+        """
+        if varnames is None:
+            varnames = list(self.keys())
+        names = list(varnames)
+        for v in varnames:
+            attrs = self[v].attrs
+            depend = attrs['DEPEND_0'] if 'DEPEND_0' in attrs else None
+            if depend is not None and depend in self \
+               and not depend in names:
+                names.append(depend)
+        chunks = {}
+        nrv = {}
+        n = 0
+        for v in names:
+            var = self[v]
+            if var.rv():
+                chunks[v] = var.iter_chunks(nrec, time_as=time_as)
+                n = max(n, len(var))
+            else:
+                nrv[v] = var.get(time_as=time_as)
+        empty = dict((v, self[v].get(slice(0, 0), time_as=time_as))
+                     for v in chunks)
+        return self._iter_chunks(chunks, nrv, empty, nrec, n)
+
+    @staticmethod
+    def _iter_chunks(chunks, nrv, empty, nrec, n):
+        """Generator for :meth:`iter_chunks`
+
+        Separate so that argument errors are raised on call, not on
+        first iteration.
+        """
+        for first in range(0, n, nrec):
+            result = dict(nrv)
+            for v, it in chunks.items():
+                result[v] = next(it, empty[v])
+            yield result
+
+    def time_slice(self, start=None, stop=None, varnames=None):
+        """
+        Read only the records of variables in a time range
+
+        For each time variable used as ``DEPEND_0``, finds the records
+        in the range by bisection on the raw time values, reading
+        only a few, and then reads only those records from every
+        variable with that ``DEPEND_0``. Time variables must be in
+        increasing order (as checked by
+        :meth:`~spacepy.pycdf.istp.FileChecks.time_monoton`).
+
+        .. versionadded:: 0.2.3
+
+        Other Parameters
+        ================
+        start : datetime.datetime
+            Read records at or after this time. Default from first record.
+        stop : datetime.datetime
+            Read records before this time. Default to last record.
+        varnames : list of str
+            Names of variables to read (default: all variables).
+            A time variable is sliced by its own values; other variables
+            with no ``DEPEND_0`` are read in full.
+
+        Returns
+        =======
+        out : :class:`~spacepy.datamodel.SpaceData`
+            Data from each variable, with attributes as for
+            :meth:`copy`.
+
+        See Also
+        ========
+        concatCDF
+
+        Examples
+        ========
+        >>> from spacepy import pycdf
+        >>> import datetime
+        >>> with pycdf.CDF('cdf_filename.cdf') as cdffile:
+        ...     data = cdffile.time_slice(
+        ...         datetime.datetime(2009, 1, 1, 12),
+        ...         datetime.datetime(2009, 1, 1, 13), ['Epoch', 'Counts'])
+        """
+        return concatCDF([self], varnames, starttime=start, endtime=stop)
+
     def checksum(self, new_val=None):
         """
         Set or check the checksum status of this CDF. If checksums
@@ -2195,6 +3053,7 @@ class CDF(MutableMapping, spacepy.datamodel.MetaMixin):
 
         self._call(const.CLOSE_, const.CDF_)
         self._opened = False
+        self._meta = None
 
     def compress(self, comptype=None, param=None):
         """
@@ -2513,6 +3372,55 @@ class CDF(MutableMapping, spacepy.datamodel.MetaMixin):
                    const.GET_, const.CDF_INCREMENT_, ctypes.byref(inc))
         return (ver.value, rel.value, inc.value)
 
+    def writer(self, varnames=None, block=1024, nrecs=None, raw=False):
+        """
+        Append records to variables through a buffer
+
+        Returns a :class:`RecordWriter`, which collects records appended
+        to several variables and writes them in blocks, with one library
+        call per variable per block. Use as a context manager, so that
+        remaining records are written at the end.
+
+        .. versionadded:: 0.2.3
+
+        Other Parameters
+        ================
+        varnames : list of str
+            Names of the variables to write; default is all
+            record-varying variables.
+        block : int
+            Number of records to collect for each variable before
+            writing (default 1024).
+        nrecs : int
+            Expected total number of records per variable. If
+            specified, the blocking factor of each variable
+            (see :meth:`Var.blocking_factor`) is set so the file space
+            is allocated in one piece (or, for compressed variables,
+            compressed one block at a time).
+        raw : bool
+            Write raw values, as for :meth:`raw_var`, rather than
+            converting times and strings (default False).
+
+        Returns
+        =======
+        out : :class:`RecordWriter`
+            Writer for this CDF
+
+        Examples
+        ========
+        >>> from spacepy import pycdf
+        >>> with pycdf.CDF('cdf_filename.cdf', '') as cdffile:
+        ...     cdffile.new('Epoch', type=pycdf.const.CDF_TIME_TT2000)
+        ...     cdffile.new('Counts', type=pycdf.const.CDF_UINT2, dims=[4])
+        ...     with cdffile.writer(['Epoch', 'Counts']) as w:
+        ...         for t, c in readings: #any source of records
+        ...             w.append({'Epoch': t, 'Counts': c})
+        """
+        if varnames is None:
+            varnames = [k for k, v in self.items() if v.rv()]
+        return RecordWriter(self, varnames, block=block, nrecs=nrecs,
+                            raw=raw)
+
     def _get_attrs(self):
         """Get attribute list
 
@@ -2565,6 +3473,8 @@ class CDF(MutableMapping, spacepy.datamodel.MetaMixin):
             Variable number of this zvariable.
         """
         num = self._var_nums.get(varname, None)
+        if num is None and self._meta is not None:
+            num = self._meta.var_nums.get(varname, None)
         if num is None: #Copied from Var._get, which can hopefully be thinned
             varNum = ctypes.c_long(0)
             self._call(const.GET_, const.zVAR_NUMBER_, varname,
@@ -2595,6 +3505,8 @@ class CDF(MutableMapping, spacepy.datamodel.MetaMixin):
             attribute number, scope (True for global) of this attribute
         """
         res = self._attr_info.get(attrname, None)
+        if res is None and self._meta is not None:
+            res = self._meta.attr_nums.get(attrname, None)
         if res is None: #Copied from Var._get, which can hopefully be thinned
             attrNum = ctypes.c_long(0)
             self._call(const.GET_, const.ATTR_NUMBER_, attrname,
@@ -2692,6 +3604,19 @@ class CDF(MutableMapping, spacepy.datamodel.MetaMixin):
         """
         self._var_nums[varname] = num
 
+    def _metadata(self):
+        """Get the metadata snapshot of this CDF, if any
+
+        For internal use only.
+
+        Returns
+        =======
+        out : :class:`_Metadata`
+            snapshot of all metadata, or None if the CDF is not readonly
+            (and metadata must be read from the library).
+        """
+        return self._meta
+
     #Note there is no function for delete, currently handled in Var.rename
     #and Attr.rename by just deleting from the dict directly. Maybe this
     #should be differen (maybe should be possible to follow a variable across
@@ -2731,7 +3656,8 @@ class CDFCopy(spacepy.datamodel.SpaceData):
                                       attrs = cdf.attrs.copy())
 
 
-def concatCDF(cdfs, varnames=None, raw=False):
+def concatCDF(cdfs, varnames=None, raw=False, starttime=None, endtime=None,
+              processes=None):
     """Concatenate data from multiple CDFs
 
     Reads data from all specified CDFs in order and returns as if they
@@ -2739,16 +3665,36 @@ def concatCDF(cdfs, varnames=None, raw=False):
     same structure (same variables, each with the same dimensions and
     variance.)
 
+    The number of records to read from each CDF is found first, and the
+    output allocated once, so the peak memory use is little more than
+    the size of the output.
+
+    .. versionchanged:: 0.2.3
+       Accept paths; add `starttime`, `endtime`, and `processes`.
+
     Parameters
     ----------
-    cdfs : list of :class:`~spacepy.pycdf.Var`
-        Open CDFs, will be read from in order. Must be a list (cannot
-        be an iterable, as all files need to be open).
+    cdfs : list of :class:`~spacepy.pycdf.CDF` or str
+        Open CDFs, or paths to CDFs, will be read from in order. Must be a
+        list (cannot be an iterable, as all files need to be open). Paths
+        are opened (read-only) only as needed.
     varnames : list of str
         Names of variables to read (default: all variables in first CDF)
     raw : bool
         If True, read variables as raw (don't convert epochs, etc.)
         Default False.
+    starttime : datetime.datetime
+        Only read records at or after this time. For each variable,
+        the time is taken from its ``DEPEND_0`` (or the variable itself,
+        if it is a time variable). Variables with no time are read in full.
+        Default: read from the first record.
+    endtime : datetime.datetime
+        Only read records before this time. Default: read to the last
+        record.
+    processes : int
+        Number of processes to read the CDFs in parallel, one file
+        at a time per process. Requires `cdfs` to be paths. Default:
+        read all CDFs in this process.
 
     Returns
     -------
@@ -2766,18 +3712,482 @@ def concatCDF(cdfs, varnames=None, raw=False):
     >>> import spacepy.pycdf
     >>> data = spacepy.pycdf.concatCDF([
     ...     spacepy.pycdf.CDF(f) for f in glob.glob('*.cdf')])
+
+    Read one day of two variables from all CDFs in the current directory,
+    using four processes:
+
+    >>> import datetime
+    >>> data = spacepy.pycdf.concatCDF(
+    ...     sorted(glob.glob('*.cdf')), ['Epoch', 'Counts'],
+    ...     starttime=datetime.datetime(2012, 10, 1),
+    ...     endtime=datetime.datetime(2012, 10, 2), processes=4)
     """
-    if varnames is None:
-        varnames = list(cdfs[0].keys()) #Iterate over this CDF only once
+    paths = [isinstance(f, str_classes) for f in cdfs]
+    if any(paths) and not all(paths):
+        raise ValueError('CDFs must be all paths or all open CDFs.')
+    paths = all(paths) and len(cdfs) > 0
+    if processes is not None and processes > 1 and not paths:
+        raise ValueError('Parallel reading requires paths to CDFs.')
     vargetter = lambda f, v: f.raw_var(v) if raw else f[v]
-    return spacepy.datamodel.SpaceData(
-        {v:
-         spacepy.datamodel.dmarray(
-             numpy.concatenate([vargetter(f, v)[...] for f in cdfs]),
-             attrs=vargetter(cdfs[0], v).attrs.copy())
-         if cdfs[0][v].rv() else vargetter(cdfs[0], v).copy()
-        for v in varnames},
-        attrs=cdfs[0].attrs.copy())
+    first = CDF(cdfs[0]) if paths else cdfs[0]
+    try:
+        if varnames is None:
+            varnames = list(first.keys()) #Iterate over this CDF only once
+        rvnames = [v for v in varnames if first[v].rv()]
+        #Records (start, stop) and number of elements, by variable, by file
+        plan = []
+        for i, f in enumerate(cdfs):
+            if i == 0:
+                plan.append(_concat_plan(first, rvnames, starttime, endtime))
+            elif paths:
+                with CDF(f) as cdffile:
+                    plan.append(_concat_plan(
+                        cdffile, rvnames, starttime, endtime))
+            else:
+                plan.append(_concat_plan(f, rvnames, starttime, endtime))
+        #Allocate output and find where each file goes
+        data = {}
+        offsets = [{} for f in cdfs]
+        for v in rvnames:
+            n = 0
+            for i, p in enumerate(plan):
+                offsets[i][v] = n
+                n += p[v][1] - p[v][0]
+            var = vargetter(first, v)
+            data[v] = spacepy.datamodel.dmarray(
+                numpy.empty(
+                    [n] + var._dim_sizes(),
+                    dtype=_concat_dtype(var, raw,
+                                        max([p[v][2] for p in plan]))),
+                attrs=var.attrs.copy())
+        for v in varnames:
+            if not v in data:
+                data[v] = vargetter(first, v).copy()
+        attrs = first.attrs.copy()
+    finally:
+        if paths:
+            first.close()
+    reads = [[(v, p[v][0], p[v][1]) for v in rvnames if p[v][1] > p[v][0]]
+             for p in plan]
+    if paths and processes is not None and processes > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(processes)
+        try:
+            #Each file's data are copied into place as they arrive
+            for i, result in enumerate(pool.imap(
+                    _concat_read, [(f, r, raw) for f, r in zip(cdfs, reads)])):
+                for (v, start, stop), d in zip(reads[i], result):
+                    data[v][offsets[i][v]:offsets[i][v] + stop - start] = d
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+    else:
+        for i, f in enumerate(cdfs):
+            if paths:
+                f = CDF(f)
+            try:
+                for v, start, stop in reads[i]:
+                    data[v][offsets[i][v]:offsets[i][v] + stop - start] \
+                        = vargetter(f, v)[start:stop]
+            finally:
+                if paths:
+                    f.close()
+    return spacepy.datamodel.SpaceData(data, attrs=attrs)
+
+
+def _concat_plan(cdffile, varnames, starttime=None, endtime=None):
+    """Find the records to read from one CDF for :func:`concatCDF`
+
+    Parameters
+    ----------
+    cdffile : :class:`CDF`
+        Open CDF
+    varnames : list of str
+        Names of record-varying variables to read
+    starttime : datetime.datetime
+        Read records at or after this time (default first record)
+    endtime : datetime.datetime
+        Read records before this time (default last record)
+
+    Returns
+    -------
+    dict
+        Keyed by variable name, values are (first record to read, one
+        after the last record to read, number of elements).
+    """
+    plan = {}
+    times = {} #Range of records for each time variable
+    for v in varnames:
+        var = cdffile[v]
+        n = len(var)
+        start, stop = 0, n
+        if starttime is not None or endtime is not None:
+            depend = var.attrs['DEPEND_0'] if 'DEPEND_0' in var.attrs \
+                     else v if var.type() in lib.timetypes else None
+            if depend is not None and depend in cdffile:
+                if not depend in times:
+                    times[depend] = _time_records(
+                        cdffile.raw_var(depend), starttime, endtime)
+                start = min(times[depend][0], n)
+                stop = min(times[depend][1], n)
+        plan[v] = (start, stop, var.nelems())
+    return plan
+
+
+def _time_records(var, starttime=None, endtime=None):
+    """Find records of a time variable in a time range
+
+    Bisects the records, so only reads O(log n) values.
+
+    Parameters
+    ----------
+    var : :class:`Var`
+        Raw variable of a CDF time type, values in increasing order
+    starttime : datetime.datetime
+        Find records at or after this time (default first record)
+    endtime : datetime.datetime
+        Find records before this time (default last record)
+
+    Returns
+    -------
+    tuple of int
+        First record in range, one after the last record in range.
+    """
+    cdftype = var.type()
+    n = len(var)
+    def first_at(t):
+        """Number of records before time t"""
+        t = {const.CDF_EPOCH.value: lib.v_datetime_to_epoch,
+             const.CDF_EPOCH16.value: lib.v_datetime_to_epoch16,
+             const.CDF_TIME_TT2000.value: lib.v_datetime_to_tt2000,
+             }[cdftype](t)
+        if cdftype == const.CDF_EPOCH16.value: #Compare (seconds, picoseconds)
+            t = tuple(t)
+        lo, hi = 0, n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = var[mid]
+            if cdftype == const.CDF_EPOCH16.value:
+                value = tuple(value)
+            if value < t:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+    return (0 if starttime is None else first_at(starttime),
+            n if endtime is None else first_at(endtime))
+
+
+def _concat_dtype(var, raw, nelems):
+    """Find the output type for concatenating a variable
+
+    Parameters
+    ----------
+    var : :class:`Var`
+        Variable
+    raw : bool
+        Variable is read raw
+    nelems : int
+        Number of elements (for strings, the maximum over all CDFs)
+
+    Returns
+    -------
+    numpy.dtype
+        Type of the data as read from the variable.
+    """
+    cdftype = var.type()
+    if cdftype in (const.CDF_CHAR.value, const.CDF_UCHAR.value):
+        return numpy.dtype(
+            ('S' if raw or str is bytes else 'U') + str(nelems))
+    if raw or not cdftype in lib.timetypes:
+        return numpy.dtype(var._np_type())
+    return numpy.dtype({
+        'datetime': object, 'tai': numpy.float64,
+        'datetime64': 'M8[ms]' if cdftype == const.CDF_EPOCH.value
+        else 'M8[ns]'}[var.cdf_file.time_as()])
+
+
+def _concat_read(args):
+    """Read records from one CDF (in a separate process) for concatCDF
+
+    Parameters
+    ----------
+    args : tuple
+        Path to CDF; list of (variable name, first record, one after
+        last record) to read; True to read raw.
+
+    Returns
+    -------
+    list of numpy.ndarray
+        Data for each variable.
+    """
+    path, reads, raw = args
+    with CDF(path) as f:
+        return [(f.raw_var(v) if raw else f[v])[start:stop]
+                for v, start, stop in reads]
+
+
+class RecordWriter(object):
+    """Buffered appending of records to variables of a :class:`CDF`
+
+    Records are copied into a preallocated buffer for each variable and
+    written to the end of the variable when the buffer is full, on
+    :meth:`flush`, and when leaving the context. Times for EPOCH
+    variables are buffered as ``numpy.datetime64`` and converted to
+    the CDF's time type once per block; EPOCH16 and TT2000 times are
+    converted as they are appended, since ``datetime64[ns]`` cannot
+    hold their full range (including the fill value).
+
+    Do not instantiate this class directly; use :meth:`CDF.writer`.
+
+    Each variable is buffered separately, so variables need not be
+    appended to at the same time. Records of variables not buffered by
+    the writer may be written directly, but writing to a buffered
+    variable other than through the writer before a :meth:`flush` will
+    put records out of order.
+
+    .. versionadded:: 0.2.3
+
+    .. autosummary::
+
+        ~RecordWriter.append
+        ~RecordWriter.extend
+        ~RecordWriter.flush
+
+    .. automethod:: append
+    .. automethod:: extend
+    .. automethod:: flush
+    """
+
+    def __init__(self, cdf_file, varnames, block=1024, nrecs=None,
+                 raw=False):
+        """Make a buffered writer
+
+        See :meth:`CDF.writer` for parameters.
+        """
+        if block < 1:
+            raise ValueError('block must be at least 1.')
+        self._block = block
+        self._vars = {}
+        self._buffers = {}
+        self._counts = {}
+        self._converters = {}
+        for name in varnames:
+            var = cdf_file.raw_var(name) if raw else cdf_file[name]
+            if not var.rv():
+                raise ValueError(
+                    'Cannot append to non-record-varying variable {0}.'
+                    .format(name))
+            cdftype = var.type()
+            dtype = var._np_type()
+            if not raw and cdftype == const.CDF_EPOCH.value:
+                dtype = 'M8[us]'
+            elif not raw and cdftype in lib.timetypes:
+                #Buffer as CDF values, written through the raw variable
+                self._converters[name] = lib.v_datetime_to_epoch16 \
+                    if cdftype == const.CDF_EPOCH16.value \
+                    else lib.v_datetime_to_tt2000
+                var = cdf_file.raw_var(name)
+            if nrecs is not None:
+                compressed = var.compress()[0].value \
+                             != const.NO_COMPRESSION.value
+                var.blocking_factor(block if compressed else nrecs)
+            self._vars[name] = var
+            self._buffers[name] = numpy.empty(
+                [block] + var._dim_sizes(), dtype=dtype)
+            self._counts[name] = 0
+
+    def __enter__(self):
+        """Context manager entrance function."""
+        return self
+
+    def __exit__(self, type, value, traceback):
+        """Context manager exit function.
+
+        Write all buffered records.
+        """
+        self.flush()
+
+    def append(self, records):
+        """Append one record to each of several variables
+
+        Parameters
+        ==========
+        records : dict
+            The record to append to each variable, keyed by
+            variable name.
+        """
+        for name, record in records.items():
+            n = self._counts[name]
+            if name in self._converters:
+                record = self._converters[name](record)
+            self._buffers[name][n] = record
+            self._counts[name] = n + 1
+            if n + 1 == self._block:
+                self._flush(name)
+
+    def extend(self, data):
+        """Append several records to each of several variables
+
+        Parameters
+        ==========
+        data : dict
+            The records to append to each variable, keyed by
+            variable name. Records are along the first dimension.
+        """
+        for name, records in data.items():
+            buff = self._buffers[name]
+            if name in self._converters:
+                records = self._converters[name](records)
+            records = numpy.asanyarray(records, dtype=buff.dtype)
+            if records.shape[1:] != buff.shape[1:]:
+                raise ValueError(
+                    'attempt to append records of dimensions {0} to '
+                    'variable {1} with records of dimensions {2}'.format(
+                        records.shape[1:], name, buff.shape[1:]))
+            while len(records):
+                n = self._counts[name]
+                if n == 0 and len(records) >= self._block:
+                    #Whole blocks need not be copied to the buffer
+                    nwhole = len(records) - len(records) % self._block
+                    self._write(name, records[:nwhole])
+                    records = records[nwhole:]
+                    continue
+                count = min(self._block - n, len(records))
+                buff[n:n + count] = records[:count]
+                self._counts[name] = n + count
+                records = records[count:]
+                if n + count == self._block:
+                    self._flush(name)
+
+    def flush(self):
+        """Write all buffered records to the CDF"""
+        for name in self._vars:
+            self._flush(name)
+
+    def _flush(self, name):
+        """Write buffered records of one variable
+
+        @param name: name of the variable
+        @type name: str
+        """
+        n = self._counts[name]
+        if n:
+            self._write(name, self._buffers[name][:n])
+            self._counts[name] = 0
+
+    def _write(self, name, records):
+        """Write records to the end of a variable in one call
+
+        @param name: name of the variable
+        @type name: str
+        @param records: records to write
+        @type records: numpy.ndarray
+        """
+        var = self._vars[name]
+        var[len(var):] = records
+
+
+class _Metadata(object):
+    """Snapshot of the metadata of a read-only CDF
+
+    For internal module use only; see :meth:`CDF.readonly`.
+
+    Reads the name, type, and shape of every zVariable, and every entry
+    of every attribute, from the library in one pass, so that
+    they can be served from memory afterwards.
+
+    @ivar var_nums: variable number, by name
+    @type var_nums: dict
+    @ivar vars: (name, type, number of elements, dimension sizes,
+                record variance, number of records) of each variable,
+                by number
+    @type vars: list of tuple
+    @ivar attr_nums: (attribute number, True if global), by name
+    @type attr_nums: dict
+    @ivar attrs: (name, True if global, maximum entry number) of each
+                 attribute, by number
+    @type attrs: list of tuple
+    @ivar entries: for each attribute (by number), dict of entries by entry
+                   number; each value is (type, number of elements, data)
+    @type entries: list of dict
+    """
+
+    def __init__(self, cdf_file):
+        """Read all metadata
+
+        @param cdf_file: CDF to read
+        @type cdf_file: :py:class:`pycdf.CDF`
+        """
+        count = ctypes.c_long(0)
+        cdf_file._call(const.GET_, const.CDF_NUMzVARS_, ctypes.byref(count))
+        self.var_nums = {}
+        self.vars = []
+        name = ctypes.create_string_buffer(const.CDF_VAR_NAME_LEN256 + 1)
+        cdftype, nelems, ndims, vary, maxrec = [ctypes.c_long(0)
+                                                for i in range(5)]
+        sizes = (ctypes.c_long * const.CDF_MAX_DIMS)(0)
+        for i in range(count.value):
+            cdf_file._call(const.SELECT_, const.zVAR_, ctypes.c_long(i),
+                           const.GET_, const.zVAR_NAME_, name,
+                           const.GET_, const.zVAR_DATATYPE_,
+                           ctypes.byref(cdftype),
+                           const.GET_, const.zVAR_NUMELEMS_,
+                           ctypes.byref(nelems),
+                           const.GET_, const.zVAR_NUMDIMS_, ctypes.byref(ndims),
+                           const.GET_, const.zVAR_DIMSIZES_, sizes,
+                           const.GET_, const.zVAR_RECVARY_, ctypes.byref(vary),
+                           const.GET_, const.zVAR_MAXREC_, ctypes.byref(maxrec))
+            varname = name.value.rstrip()
+            self.var_nums[varname] = i
+            self.vars.append((varname, cdftype.value, nelems.value,
+                              sizes[0:ndims.value],
+                              vary.value != const.NOVARY.value,
+                              maxrec.value + 1))
+        cdf_file._call(const.GET_, const.CDF_NUMATTRS_, ctypes.byref(count))
+        self.attr_nums = {}
+        self.attrs = []
+        self.entries = []
+        name = ctypes.create_string_buffer(const.CDF_ATTR_NAME_LEN256 + 1)
+        scope, maxentry = ctypes.c_long(0), ctypes.c_long(0)
+        for i in range(count.value):
+            cdf_file._call(const.SELECT_, const.ATTR_, ctypes.c_long(i),
+                           const.GET_, const.ATTR_NAME_, name,
+                           const.GET_, const.ATTR_SCOPE_, ctypes.byref(scope))
+            if scope.value == const.GLOBAL_SCOPE.value:
+                attrtype = gAttr
+            elif scope.value == const.VARIABLE_SCOPE.value:
+                attrtype = zAttr
+            else:
+                raise CDFError(const.BAD_SCOPE)
+            cdf_file._call(const.SELECT_, const.ATTR_, ctypes.c_long(i),
+                           const.GET_, attrtype.ATTR_MAXENTRY_,
+                           ctypes.byref(maxentry))
+            attrname = name.value.rstrip()
+            isglobal = attrtype is gAttr
+            self.attr_nums[attrname] = (i, isglobal)
+            self.attrs.append((attrname, isglobal, maxentry.value))
+            entries = {}
+            for j in range(maxentry.value + 1):
+                status = cdf_file._call(
+                    const.SELECT_, const.ATTR_, ctypes.c_long(i),
+                    const.SELECT_, attrtype.ENTRY_, ctypes.c_long(j),
+                    const.GET_, attrtype.ENTRY_DATATYPE_,
+                    ctypes.byref(cdftype),
+                    const.GET_, attrtype.ENTRY_NUMELEMS_,
+                    ctypes.byref(nelems),
+                    ignore=(const.NO_SUCH_ENTRY,))
+                if status == const.NO_SUCH_ENTRY:
+                    continue
+                buff = Attr._entry_buffer(cdftype.value, nelems.value)
+                cdf_file._call(const.SELECT_, const.ATTR_, ctypes.c_long(i),
+                               const.SELECT_, attrtype.ENTRY_,
+                               ctypes.c_long(j),
+                               const.GET_, attrtype.ENTRY_DATA_,
+                               buff.ctypes.data_as(ctypes.c_void_p))
+                entries[j] = (cdftype.value, nelems.value, buff)
+            self.entries.append(entries)
 
 
 class Var(MutableSequence, spacepy.datamodel.MetaMixin):
@@ -3029,14 +4439,19 @@ class Var(MutableSequence, spacepy.datamodel.MetaMixin):
     .. autosummary::
 
         ~Var.attrs
+        ~Var.blocking_factor
         ~Var.compress
         ~Var.copy
         ~Var.dtype
         ~Var.dv
+        ~Var.get
         ~Var.insert
+        ~Var.iter_chunks
+        ~Var.memmap
         ~Var.name
         ~Var.nelems
         ~Var.pad
+        ~Var.prefetch
         ~Var.rename
         ~Var.rv
         ~Var.shape
@@ -3046,14 +4461,19 @@ class Var(MutableSequence, spacepy.datamodel.MetaMixin):
 
        zAttributes for this zVariable in a dict-like format.
        See :class:`zAttrList` for details.
+    .. automethod:: blocking_factor
     .. automethod:: compress
     .. automethod:: copy
     .. autoattribute:: dtype
     .. automethod:: dv
+    .. automethod:: get
     .. automethod:: insert
+    .. automethod:: iter_chunks
+    .. automethod:: memmap
     .. automethod:: name
     .. automethod:: nelems
     .. automethod:: pad
+    .. automethod:: prefetch
     .. automethod:: rename
     .. automethod:: rv
     .. autoattribute:: shape
@@ -3109,6 +4529,50 @@ class Var(MutableSequence, spacepy.datamodel.MetaMixin):
                            or simply unparseable.
         @raise CDFError: for errors from the CDF library
         """
+        return self.get(key)
+
+    def get(self, key=Ellipsis, time_as=None):
+        """Read data from this variable, with options
+
+        ``v.get(key)`` is the same as ``v[key]``, but allows overriding
+        how time values are returned for this one read.
+
+        .. versionadded:: 0.2.3
+
+        Parameters
+        ==========
+        key : 
+            Index or slice to read, as for ``v[key]``. Default all data.
+
+        Other Parameters
+        ================
+        time_as : str
+            How to return values of a time variable: ``'datetime'``,
+            ``'datetime64'``, or ``'tai'``. Default is the setting
+            of the CDF, see :meth:`CDF.time_as`. Ignored for other types.
+
+        Returns
+        =======
+        out : numpy.ndarray
+            The data
+
+        Raises
+        ======
+        IndexError : if `key` is out of range or does not match dimensions
+        ValueError : if `time_as` is not a valid value
+        CDFError : for errors from the CDF library
+
+        Examples
+        ========
+        >>> from spacepy import pycdf
+        >>> import spacepy.time
+        >>> with pycdf.CDF('cdf_filename.cdf') as cdffile:
+        ...     tai = cdffile['Epoch'].get(time_as='tai')
+        >>> t = spacepy.time.Ticktock(tai, 'TAI')
+        """
+        if time_as is not None and time_as not in _TIME_AS:
+            raise ValueError('time_as must be one of {0}'.format(
+                ', '.join(_TIME_AS)))
         hslice = _Hyperslice(self, key)
         #Hyperslice mostly catches this sort of thing, but
         #an empty variable is a special case, since we might want to
@@ -3138,10 +4602,221 @@ class Var(MutableSequence, spacepy.datamodel.MetaMixin):
                     hslice.degen[0] = False
         result = hslice.create_array()
         if hslice.counts[0] != 0:
-            hslice.select()
-            lib.call(const.GET_, const.zVAR_HYPERDATA_,
-                    result.ctypes.data_as(ctypes.c_void_p))
-        return hslice.convert_input_array(result)
+            hslice.select(const.GET_, const.zVAR_HYPERDATA_,
+                          result.ctypes.data_as(ctypes.c_void_p))
+        return hslice.convert_input_array(result, time_as)
+
+    def prefetch(self, keys, depth=2, time_as=None):
+        """Read several slices, reading ahead on a background thread
+
+        Returns an iterator over the data in each slice of ``keys``,
+        as from :meth:`get`. While the caller works on one slice, the
+        next ``depth`` are read (and decompressed, for a compressed
+        variable) on a worker thread, which does not hold the Python
+        global interpreter lock while in the CDF library.
+
+        Calls to the CDF library are serialized, so other use of
+        this or any CDF while iterating is safe, but waits on the
+        reads in progress.
+
+        .. versionadded:: 0.2.3
+
+        Parameters
+        ==========
+        keys : iterable
+            Indices or slices to read, as for ``v[key]``. It is consumed
+            as needed, so it may be a generator.
+
+        Other Parameters
+        ================
+        depth : int
+            Number of slices to read ahead (default 2).
+        time_as : str
+            How to return values of a time variable; see :meth:`get`.
+
+        Returns
+        =======
+        out : iterator of numpy.ndarray
+            Data for each element of ``keys``, in order.
+
+        Examples
+        ========
+        Process a compressed variable 1000 records at a time:
+
+        >>> from spacepy import pycdf
+        >>> with pycdf.CDF('cdf_filename.cdf') as cdffile:
+        ...     v = cdffile['Counts']
+        ...     blocks = (slice(i, i + 1000) for i in range(0, len(v), 1000))
+        ...     total = sum(b.sum() for b in v.prefetch(blocks))
+        """
+        if depth < 1:
+            raise ValueError('depth must be at least 1.')
+        if time_as is not None and time_as not in _TIME_AS:
+            raise ValueError('time_as must be one of {0}'.format(
+                ', '.join(_TIME_AS)))
+        return self._prefetch(iter(keys), depth, time_as)
+
+    def _prefetch(self, keys, depth, time_as):
+        """Generator for :meth:`prefetch`
+
+        Separate so that argument errors are raised on call, not on
+        first iteration.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            pending = collections.deque(
+                pool.submit(self.get, key, time_as)
+                for key in itertools.islice(keys, depth))
+            try:
+                while pending:
+                    data = pending.popleft().result()
+                    for key in itertools.islice(keys, 1):
+                        pending.append(pool.submit(self.get, key, time_as))
+                    yield data
+            finally: #Abandoned early, don't read the rest
+                for future in pending:
+                    future.cancel()
+
+    def iter_chunks(self, nrec, start=0, stop=None, time_as=None):
+        """Iterate over blocks of records
+
+        Reads ``nrec`` records at a time into the same buffer, so
+        a variable of any size can be processed in constant memory.
+
+        .. warning::
+            Unless converted (times, and strings on Python 3), each
+            block is a view of the buffer and is overwritten by the next
+            block. Copy any data to keep past the next iteration.
+
+        .. versionadded:: 0.2.3
+
+        Parameters
+        ==========
+        nrec : int
+            Number of records in each block; the last may be shorter.
+
+        Other Parameters
+        ================
+        start : int
+            First record to read (default 0).
+        stop : int
+            One past the last record to read (default all records).
+        time_as : str
+            How to return values of a time variable; see :meth:`get`.
+
+        Returns
+        =======
+        out : iterator of numpy.ndarray
+            Data for each block of records.
+
+        Raises
+        ======
+        ValueError : if the variable is not record-varying
+
+        See Also
+        ========
+        CDF.iter_chunks, prefetch
+
+        Examples
+        ========
+        >>> from spacepy import pycdf
+        >>> with pycdf.CDF('cdf_filename.cdf') as cdffile:
+        ...     total = sum(block.sum() for block
+        ...                 in cdffile['Counts'].iter_chunks(10000))
+        """
+        if nrec < 1:
+            raise ValueError('nrec must be at least 1.')
+        if not self.rv():
+            raise ValueError('Cannot iterate over records of '
+                             'non-record-varying variable.')
+        if time_as is not None and time_as not in _TIME_AS:
+            raise ValueError('time_as must be one of {0}'.format(
+                ', '.join(_TIME_AS)))
+        n = len(self)
+        stop = n if stop is None else min(stop, n)
+        return self._iter_chunks(nrec, start, stop, time_as)
+
+    def _iter_chunks(self, nrec, start, stop, time_as):
+        """Generator for :meth:`iter_chunks`
+
+        Separate so that argument errors are raised on call, not on
+        first iteration.
+        """
+        if start >= stop:
+            return
+        hslice = _Hyperslice(self, slice(start, min(start + nrec, stop)))
+        buff = hslice.create_array()
+        for first in range(start, stop, nrec):
+            count = min(nrec, stop - first)
+            hslice.starts[0] = first
+            hslice.counts[0] = count
+            #Slicing the record dimension keeps it contiguous
+            block = buff[:count]
+            hslice.select(const.GET_, const.zVAR_HYPERDATA_,
+                          block.ctypes.data_as(ctypes.c_void_p))
+            yield hslice.convert_input_array(block, time_as)
+
+    def memmap(self):
+        """Memory-map the data of this variable without copying
+
+        Returns all data of this variable as a read-only
+        :class:`numpy.memmap` of the CDF file. No data are read until they
+        are used, so indexing a few records from a very large variable is
+        fast, and memory is only used for the parts of the file touched.
+
+        The data are raw, as for :meth:`CDF.raw_var`: there is no
+        conversion of times or strings. The byte order is that of the CDF,
+        which may not be the native order. Like :meth:`copy`,
+        the memmap does not follow later changes to the CDF, and
+        it remains valid after the CDF is closed.
+
+        This only works for version 3, single-file, uncompressed CDFs
+        opened read-only, for variables which are not compressed and
+        have all records in one block of the file. This is typically
+        true of files that were written all at once, but not of
+        files that were built up by adding records.
+
+        .. versionadded:: 0.2.3
+
+        Returns
+        =======
+        out : numpy.memmap
+            Data of this variable. If the variable has no records, this
+            is an empty :class:`~numpy.ndarray`.
+
+        Raises
+        ======
+        ValueError : if the variable cannot be memory-mapped; read normally
+                     instead.
+
+        Examples
+        ========
+        >>> from spacepy import pycdf
+        >>> with pycdf.CDF('cdf_filename.cdf') as cdffile:
+        ...     data = cdffile['Counts'].memmap()
+        >>> data[100000:100010] #only these records are read
+        """
+        if not self.cdf_file.readonly():
+            raise ValueError('CDF must be read-only to memory-map.')
+        filename = self.cdf_file.pathname
+        if not os.path.exists(filename):
+            filename += b'.cdf' #CDF library tries with the extension
+        offset, byteorder, row_major = _find_vvr(filename, self.name())
+        dtype = numpy.dtype(self._np_type())
+        if dtype.kind != 'S':
+            dtype = numpy.dtype((dtype.base.newbyteorder(byteorder),
+                                 dtype.shape))
+        dims = self._dim_sizes()
+        nrecs = len(self) if self.rv() else 1
+        if offset is None or nrecs == 0:
+            return numpy.empty([0] + dims, dtype=dtype)
+        data = numpy.memmap(
+            filename, dtype=dtype, mode='r', offset=offset,
+            shape=tuple([nrecs] + (dims if row_major else dims[::-1])))
+        if not row_major:
+            #Keep record first and any EPOCH16 pair last
+            data = data.transpose([0] + list(range(len(dims), 0, -1))
+                                  + list(range(len(dims) + 1, data.ndim)))
+        return data if self.rv() else data[0]
 
     def __delitem__(self, key):
         """Removes a record (or set of records) from the CDF
@@ -3177,14 +4852,13 @@ class Var(MutableSequence, spacepy.datamodel.MetaMixin):
         interval = hslice.intervals[0]
         dimsize = hslice.dimsizes[0]
 
-        self._call()
         dangerous_delete = False
         if lib._del_middle_rec_bug and \
                (interval != 1 or (start != 0 and start + count < dimsize)):
             #delete from middle is dangerous if only have one index entry
             entries = ctypes.c_long(0)
-            lib.call(const.GET_, const.zVAR_nINDEXENTRIES_,
-                     ctypes.byref(entries))
+            self._call(const.GET_, const.zVAR_nINDEXENTRIES_,
+                       ctypes.byref(entries))
             dangerous_delete = (entries.value == 1)
 
         if dangerous_delete:
@@ -3196,20 +4870,19 @@ class Var(MutableSequence, spacepy.datamodel.MetaMixin):
             self[0:dimsize - count] = data
             first_rec = dimsize - count
             last_rec = dimsize - 1
-            lib.call(const.DELETE_, const.zVAR_RECORDS_,
-                     ctypes.c_long(first_rec), ctypes.c_long(last_rec))
+            self._call(const.DELETE_, const.zVAR_RECORDS_,
+                       ctypes.c_long(first_rec), ctypes.c_long(last_rec))
         elif interval == 1:
             first_rec = ctypes.c_long(start)
             last_rec = ctypes.c_long(start + count - 1)
-            lib.call(const.DELETE_, const.zVAR_RECORDS_,
-                     first_rec, last_rec)
+            self._call(const.DELETE_, const.zVAR_RECORDS_,
+                       first_rec, last_rec)
         else:
-            self._call()
             #delete from end to avoid renumbering of records
             for recno in range(start + (count - 1) * interval,
                                start - 1, -1 * interval):
-                lib.call(const.DELETE_, const.zVAR_RECORDS_,
-                         ctypes.c_long(recno), ctypes.c_long(recno))
+                self._call(const.DELETE_, const.zVAR_RECORDS_,
+                           ctypes.c_long(recno), ctypes.c_long(recno))
 
     def _prepare(self, data):
         """Convert data to numpy array for writing to CDF
@@ -3293,17 +4966,16 @@ class Var(MutableSequence, spacepy.datamodel.MetaMixin):
                     'Sparse records do not support insertion.')
             saved_data = self[hslice.starts[0] + n_recs:]
         if hslice.counts[0] > 0:
-            hslice.select()
-            lib.call(const.PUT_, const.zVAR_HYPERDATA_,
-                     data.ctypes.data_as(ctypes.c_void_p))
+            hslice.select(const.PUT_, const.zVAR_HYPERDATA_,
+                          data.ctypes.data_as(ctypes.c_void_p))
         if hslice.counts[0] < n_recs:
             if hslice.sr:
                 raise NotImplementedError(
                     'Sparse records do not support truncation on write.')
             first_rec = hslice.starts[0] + hslice.counts[0]
             last_rec = hslice.dimsizes[0] - 1
-            lib.call(const.DELETE_, const.zVAR_RECORDS_,
-                     ctypes.c_long(first_rec), ctypes.c_long(last_rec))
+            self._call(const.DELETE_, const.zVAR_RECORDS_,
+                       ctypes.c_long(first_rec), ctypes.c_long(last_rec))
         elif hslice.counts[0] > n_recs and \
                hslice.starts[0] + n_recs < hslice.dimsizes[0]:
             #Put saved data in after inserted data
@@ -3404,12 +5076,19 @@ class Var(MutableSequence, spacepy.datamodel.MetaMixin):
                 enc_name = var_name.encode('ascii').rstrip()
             except AttributeError:
                 enc_name = var_name.rstrip() #already in ASCII
+            self._name = enc_name
+            meta = self.cdf_file._metadata()
+            if meta is not None and enc_name in meta.var_nums:
+                return
             #'touch' CDF to cause an error if the name isn't there; get number
             varNum = ctypes.c_long(0)
             self.cdf_file._call(const.GET_, const.zVAR_NUMBER_, enc_name, ctypes.byref(varNum))
-            self._name = enc_name
             self.cdf_file.add_to_cache(enc_name, varNum.value)
         else: #Looking up by number
+            meta = self.cdf_file._metadata()
+            if meta is not None and 0 <= var_name < len(meta.vars):
+                self._name = meta.vars[var_name][0]
+                return
             name = ctypes.create_string_buffer(const.CDF_VAR_NAME_LEN256+1)
             self.cdf_file._call(const.SELECT_, const.zVAR_, ctypes.c_long(var_name),
                      const.GET_, const.zVAR_NAME_, name)
@@ -3433,6 +5112,9 @@ class Var(MutableSequence, spacepy.datamodel.MetaMixin):
         @raise CDFWarning: if CDF library reports a warning and interpreter
                            is set to error on warnings.
         """
+        meta = self.cdf_file._metadata()
+        if meta is not None:
+            return meta.vars[self._num()][5]
         count = ctypes.c_long(0)
         self._call(const.GET_, const.zVAR_MAXREC_, ctypes.byref(count))
         return (count.value + 1)
@@ -3483,6 +5165,9 @@ class Var(MutableSequence, spacepy.datamodel.MetaMixin):
         @return: the number of dimensions
         @rtype: long
         """
+        meta = self.cdf_file._metadata()
+        if meta is not None:
+            return len(meta.vars[self._num()][3])
         n_dims = ctypes.c_long(0)
         self._call(const.GET_, const.zVAR_NUMDIMS_, ctypes.byref(n_dims))
         return n_dims.value
@@ -3495,6 +5180,9 @@ class Var(MutableSequence, spacepy.datamodel.MetaMixin):
         @note: This will always be in Python order (i.e. row major, last index
         iterates most quickly), *regardless* of the majority of the CDF.
         """
+        meta = self.cdf_file._metadata()
+        if meta is not None:
+            return list(meta.vars[self._num()][3])
         sizes = (ctypes.c_long * const.CDF_MAX_DIMS)(0)
         self._call(const.GET_, const.zVAR_DIMSIZES_, sizes)
         sizes = sizes[0:self._n_dims()]
@@ -3522,10 +5210,44 @@ class Var(MutableSequence, spacepy.datamodel.MetaMixin):
         if new_rv != None:
             self._call(const.PUT_, const.zVAR_RECVARY_,
                        const.VARY if new_rv else const.NOVARY)
+        meta = self.cdf_file._metadata()
+        if meta is not None:
+            return meta.vars[self._num()][4]
         vary = ctypes.c_long(0)
         self._call(const.GET_, const.zVAR_RECVARY_, ctypes.byref(vary))
         return vary.value != const.NOVARY.value
 
+    def blocking_factor(self, new_factor=None):
+        """
+        Gets or sets the blocking factor of this variable
+
+        The blocking factor is the minimum number of records allocated
+        in the file when the variable is extended. For a compressed
+        variable, it is the number of records compressed together. A
+        value of 0 means the library chooses.
+
+        See section 2.3.14 of the CDF user's guide for more information.
+
+        .. versionadded:: 0.2.3
+
+        Other Parameters
+        ================
+        new_factor : int
+            New blocking factor; unspecified to simply check.
+
+        Returns
+        =======
+        out : int
+            Blocking factor
+        """
+        if new_factor is not None:
+            self._call(const.PUT_, const.zVAR_BLOCKINGFACTOR_,
+                       ctypes.c_long(new_factor))
+        factor = ctypes.c_long(0)
+        self._call(const.GET_, const.zVAR_BLOCKINGFACTOR_,
+                   ctypes.byref(factor))
+        return factor.value
+
     def sparse(self, sparsetype=None):
         """
         Gets or sets this variable's sparse records mode.
@@ -3709,6 +5431,9 @@ class Var(MutableSequence, spacepy.datamodel.MetaMixin):
                        new_type, n_elements)
             self._type = None
         if self._type is None:
+            meta = self.cdf_file._metadata()
+            if meta is not None:
+                return meta.vars[self._num()][1]
             cdftype = ctypes.c_long(0)
             self._call(const.GET_, const.zVAR_DATATYPE_,
                        ctypes.byref(cdftype))
@@ -3726,6 +5451,9 @@ class Var(MutableSequence, spacepy.datamodel.MetaMixin):
         int
             length of strings
         """
+        meta = self.cdf_file._metadata()
+        if meta is not None:
+            return meta.vars[self._num()][2]
         nelems = ctypes.c_long(0)
         self._call(const.GET_, const.zVAR_NUMELEMS_, ctypes.byref(nelems))
         return nelems.value
@@ -4240,7 +5968,7 @@ class _Hyperslice(object):
             self.zvar._np_type(), order='C')
         return numpy.require(array, requirements=('C', 'A', 'W'))
                            
-    def convert_input_array(self, buffer):
+    def convert_input_array(self, buffer, time_as=None):
         """Converts a buffer of raw data from this slice
 
         EPOCH(16) variables always need to be converted.
@@ -4250,6 +5978,9 @@ class _Hyperslice(object):
         ==========
         buffer : numpy.array
             data as read from the CDF file
+        time_as : str
+            how to convert time types (see :meth:`CDF.time_as`); default
+            is the setting of the CDF.
 
         Returns
         =======
@@ -4266,14 +5997,15 @@ class _Hyperslice(object):
                 dt = numpy.dtype('U{0}'.format(result.dtype.itemsize))
                 result = numpy.require(numpy.char.array(result).decode(),
                                        dtype=dt)
-            elif cdftype == const.CDF_EPOCH.value:
-                result = lib.v_epoch_to_datetime(result)
-            elif cdftype == const.CDF_EPOCH16.value:
-                result = lib.v_epoch16_to_datetime(result)
-            elif cdftype == const.CDF_TIME_TT2000.value:
-                result = lib.v_tt2000_to_datetime(result)
+            elif cdftype in (const.CDF_EPOCH.value, const.CDF_EPOCH16.value,
+                             const.CDF_TIME_TT2000.value):
+                result = _convert_time(
+                    result, cdftype, self.zvar.cdf_file._time_as
+                    if time_as is None else time_as)
         if getattr(result, 'shape', None) == ():
-            result = result.item()
+            #item() would make datetime64[ns] an int
+            result = result[()] if result.dtype.kind == 'M' \
+                     else result.item()
         return result
 
     def convert_output_array(self, buffer):
@@ -4330,25 +6062,30 @@ class _Hyperslice(object):
             data = operator.getitem(data, tuple(sliced))
         return data
 
-    def select(self):
+    def select(self, *args):
         """Selects this hyperslice in the CDF
 
         Calls the CDF library to select the CDF, variable, records, and
         array elements corresponding to this slice.
+
+        Any arguments are passed to the library in the same call,
+        after the selection, e.g. to read or write the slice. This
+        keeps another thread from changing the selection in between.
         """
-        args = (const.SELECT_, const.zVAR_RECNUMBER_, ctypes.c_long(self.starts[0]),
-                const.SELECT_, const.zVAR_RECCOUNT_, ctypes.c_long(self.counts[0]),
-                const.SELECT_, const.zVAR_RECINTERVAL_,
-                ctypes.c_long(self.intervals[0]))
+        selection = (
+            const.SELECT_, const.zVAR_RECNUMBER_, ctypes.c_long(self.starts[0]),
+            const.SELECT_, const.zVAR_RECCOUNT_, ctypes.c_long(self.counts[0]),
+            const.SELECT_, const.zVAR_RECINTERVAL_,
+            ctypes.c_long(self.intervals[0]))
         if self.dims > 1:
             dims = self.dims - 1
-            args += (const.SELECT_, const.zVAR_DIMINDICES_,
-                     (ctypes.c_long * dims)(*self.starts[1:]),
-                     const.SELECT_, const.zVAR_DIMCOUNTS_,
-                     (ctypes.c_long * dims)(*self.counts[1:]),
-                     const.SELECT_, const.zVAR_DIMINTERVALS_,
-                     (ctypes.c_long * dims)(*self.intervals[1:]))
-        self.zvar._call(*args)
+            selection += (const.SELECT_, const.zVAR_DIMINDICES_,
+                          (ctypes.c_long * dims)(*self.starts[1:]),
+                          const.SELECT_, const.zVAR_DIMCOUNTS_,
+                          (ctypes.c_long * dims)(*self.counts[1:]),
+                          const.SELECT_, const.zVAR_DIMINTERVALS_,
+                          (ctypes.c_long * dims)(*self.intervals[1:]))
+        self.zvar._call(*(selection + args))
 
     @staticmethod
     def expand_ellipsis(slices, n_dims):
@@ -4476,6 +6213,19 @@ class _Hyperslice(object):
                 del types[-1]
             elif not lib.supports_int8:
                 del types[-1]
+        elif d.dtype.kind == 'M': #numpy datetime64
+            ms = d.astype('M8[ms]')
+            if ((d != ms) & ~numpy.isnat(d)).any():
+                types = [const.CDF_EPOCH16, const.CDF_EPOCH,
+                         const.CDF_TIME_TT2000]
+            else:
+                types = [const.CDF_EPOCH, const.CDF_EPOCH16,
+                         const.CDF_TIME_TT2000]
+            if backward:
+                del types[types.index(const.CDF_EPOCH16)]
+                del types[-1]
+            elif not lib.supports_int8:
+                del types[-1]
         elif d is data or isinstance(data, numpy.generic):
             #numpy array came in, use its type (or byte-swapped)
             types = [k for k in lib.numpytypedict
@@ -4940,6 +6690,9 @@ class Attr(MutableSequence):
         @return: Number of Entries
         @rtype: int
         """
+        entries = self._entries()
+        if entries is not None:
+            return len(entries)
         count = ctypes.c_long(0)
         self._call(const.GET_, self.ATTR_NUMENTRIES_, ctypes.byref(count))
         return count.value
@@ -5027,6 +6780,18 @@ class Attr(MutableSequence):
             ctypes.c_long(self._cdf_file.attr_num(self._name)[0]),
             *args, **kwargs)
 
+    def _entries(self):
+        """Entries of this Attr from the CDF's metadata snapshot
+
+        @return: (type, number of elements, data) of each Entry, by
+                 Entry number; None if the CDF has no snapshot.
+        @rtype: dict
+        """
+        meta = self._cdf_file._metadata()
+        if meta is None:
+            return None
+        return meta.entries[self._cdf_file.attr_num(self._name)[0]]
+
     def _entry_len(self, number):
         """Number of elements in an Entry
 
@@ -5035,6 +6800,12 @@ class Attr(MutableSequence):
         @return: number of elements
         @rtype: int
         """
+        entries = self._entries()
+        if entries is not None:
+            if not number in entries:
+                raise IndexError(
+                    'list index ' + str(number) + ' out of range.')
+            return entries[number][1]
         if not self.has_entry(number):
             raise IndexError('list index ' + str(number) + ' out of range.')
         count = ctypes.c_long(0)
@@ -5076,6 +6847,12 @@ class Attr(MutableSequence):
                                 ignore=(const.NO_SUCH_ENTRY,))
             if status == const.NO_SUCH_ENTRY:
                 raise IndexError('list index ' + str(number) + ' out of range.')
+        entries = self._entries()
+        if entries is not None:
+            if not number in entries:
+                raise IndexError(
+                    'list index ' + str(number) + ' out of range.')
+            return entries[number][0]
         cdftype = ctypes.c_long(0)
         status = self._call(const.SELECT_, self.ENTRY_, ctypes.c_long(number),
                             const.GET_, self.ENTRY_DATATYPE_, ctypes.byref(cdftype),
@@ -5097,6 +6874,9 @@ class Attr(MutableSequence):
         out : bool
             True if ``number`` is a valid entry number; False if not
         """
+        entries = self._entries()
+        if entries is not None:
+            return number in entries
         status = self._call(const.CONFIRM_, self.ENTRY_EXISTENCE_,
                             ctypes.c_long(number),
                             ignore=(const.NO_SUCH_ENTRY, ))
@@ -5110,6 +6890,9 @@ class Attr(MutableSequence):
         out : int
             maximum Entry number
         """
+        meta = self._cdf_file._metadata()
+        if meta is not None:
+            return meta.attrs[self._cdf_file.attr_num(self._name)[0]][2]
         count = ctypes.c_long(0)
         self._call(const.GET_, self.ATTR_MAXENTRY_, ctypes.byref(count))
         return count.value
@@ -5207,22 +6990,26 @@ class Attr(MutableSequence):
         @return: data from entry numbered L{number}
         @rtype: list or str
         """
-        if not self.has_entry(number):
-            raise IndexError('list index ' + str(number) + ' out of range.')
-        #Make a big enough buffer
-        length = self._entry_len(number)
-        cdftype = self.type(number)
-        if cdftype in (const.CDF_CHAR.value, const.CDF_UCHAR.value):
-            buff = numpy.empty((), 'S{0}'.format(length), order='C')
+        entries = self._entries()
+        if entries is not None:
+            try:
+                cdftype, length, buff = entries[number]
+            except KeyError:
+                raise IndexError(
+                    'list index ' + str(number) + ' out of range.')
+            if buff.ndim: #Don't let changes to the result change the cache
+                buff = buff.copy()
         else:
-            if not cdftype in lib.numpytypedict:
-                raise CDFError(const.BAD_DATA_TYPE)
-            buff = numpy.empty((length,), lib.numpytypedict[cdftype],
-                               order='C')
-        buff = numpy.require(buff, requirements=('C', 'A', 'W'))
-        self._call(const.SELECT_, self.ENTRY_, ctypes.c_long(number),
-                   const.GET_, self.ENTRY_DATA_,
-                   buff.ctypes.data_as(ctypes.c_void_p))
+            if not self.has_entry(number):
+                raise IndexError(
+                    'list index ' + str(number) + ' out of range.')
+            #Make a big enough buffer
+            length = self._entry_len(number)
+            cdftype = self.type(number)
+            buff = self._entry_buffer(cdftype, length)
+            self._call(const.SELECT_, self.ENTRY_, ctypes.c_long(number),
+                       const.GET_, self.ENTRY_DATA_,
+                       buff.ctypes.data_as(ctypes.c_void_p))
 
         #decode
         if cdftype in (const.CDF_CHAR.value, const.CDF_UCHAR.value):
@@ -5247,6 +7034,26 @@ class Attr(MutableSequence):
 
         return result
 
+    @staticmethod
+    def _entry_buffer(cdftype, length):
+        """Make a buffer to read an Entry
+
+        @param cdftype: CDF type of the Entry
+        @type cdftype: int
+        @param length: number of elements in the Entry
+        @type length: int
+        @return: buffer big enough to hold the Entry
+        @rtype: numpy.ndarray
+        """
+        if cdftype in (const.CDF_CHAR.value, const.CDF_UCHAR.value):
+            buff = numpy.empty((), 'S{0}'.format(length), order='C')
+        else:
+            if not cdftype in lib.numpytypedict:
+                raise CDFError(const.BAD_DATA_TYPE)
+            buff = numpy.empty((length,), lib.numpytypedict[cdftype],
+                               order='C')
+        return numpy.require(buff, requirements=('C', 'A', 'W'))
+
     def _write_entry(self, number, data, cdf_type, dims, elements):
         """Write an Entry to this Attr.
 
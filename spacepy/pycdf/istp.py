@@ -31,16 +31,21 @@ Contact: Jonathan.Niehof@unh.edu
 .. autosummary::
     :toctree:
 
+    check_archive
     fillval
     format
+    format_all
     nanfill
+    nanfill_all
 """
 
 import collections
-import datetime
+import contextlib
 import functools
+import glob
 import inspect
 import itertools
+import json
 import math
 import os.path
 import re
@@ -51,6 +56,261 @@ import spacepy.pycdf
 import spacepy.pycdf.const
 
 
+#Summary statistics of variable data, by id of the CDF, then variable name.
+#Only populated inside _shared_stats.
+_stats_cache = {}
+
+
+@contextlib.contextmanager
+def _shared_stats(f):
+    """Share the scan of variable data among checks
+
+    Within this context, the :class:`_VarStats` from :func:`_stats` of
+    each variable of CDF ``f`` are kept, so each variable is read once.
+    Nested use for the same CDF shares the outer cache.
+
+    Parameters
+    ----------
+    f : :class:`~spacepy.pycdf.CDF`
+        CDF being checked
+    """
+    key = id(f)
+    outer = key in _stats_cache
+    if not outer:
+        _stats_cache[key] = {}
+    try:
+        yield _stats_cache[key]
+    finally:
+        if not outer:
+            del _stats_cache[key]
+
+
+def _stats(v):
+    """Summarize data from a variable, shared if in :func:`_shared_stats`
+
+    Parameters
+    ----------
+    v : :class:`~spacepy.pycdf.Var`
+        Variable to summarize
+
+    Returns
+    -------
+    :class:`_VarStats`
+        Summary of the data in ``v``.
+    """
+    cache = _stats_cache.get(id(v.cdf_file))
+    if cache is None:
+        return _VarStats(v)
+    name = v.name()
+    if not name in cache:
+        cache[name] = _VarStats(v)
+    return cache[name]
+
+
+def _chunks(v, time_as=None):
+    """Read all data from a variable, a block of records at a time
+
+    Parameters
+    ----------
+    v : :class:`~spacepy.pycdf.Var`
+        Variable to read
+
+    time_as : str
+        How to return values of time variables; see
+        :meth:`~spacepy.pycdf.CDF.time_as`.
+
+    Returns
+    -------
+    iterator of tuple
+        Record number of the start of each block, and the data of the
+        block. Variables which are not record-varying are read in one
+        block, starting at 0. Blocks may be overwritten by the next.
+    """
+    if not v.rv():
+        yield 0, v.get(time_as=time_as)
+        return
+    nrec = max(1, _VarStats.chunk_values
+               // max(1, int(numpy.prod(v.shape[1:], dtype=numpy.int64))))
+    start = 0
+    for data in v.iter_chunks(nrec, time_as=time_as):
+        yield start, data
+        start += len(data)
+
+
+class _VarStats(object):
+    """Summary of the data in a variable, from one pass over the data
+
+    Data are read in blocks of records (see :func:`_chunks`), so the
+    summary of a variable of any size takes constant memory. Times are
+    read as ``numpy.datetime64``.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        Shape of the variable, including record dimension if record-varying.
+    n_fill : int
+        Number of fill values: matching ``FILLVAL``, or ``NaT`` for times.
+    n_nan : int
+        Number of NaN values which are not fill.
+    min : numpy.ndarray
+        Minimum of all values which are not fill or NaN, over all records
+        (i.e., of the same shape as a record). Elements with no
+        such values are the maximum of the type (infinity for float).
+        Times are integer in the units of `dtype`. None if the type
+        can't be compared or there are no records.
+    max : numpy.ndarray
+        Maximum, as `min`.
+    dtype : numpy.dtype
+        Type of the data, as read.
+    decreasing : numpy.ndarray
+        Record numbers where a value is less than the previous value
+        which is not fill or NaN (these are skipped, not compared).
+        None if not record-varying with scalar records.
+    days : set of str
+        All dates of a time variable (excluding fill), ``YYYYMMDD``.
+        None if not a time variable.
+    """
+    chunk_values = 2 ** 20
+    """Approximate number of values to read at once."""
+
+    def __init__(self, v):
+        """Read the data from a variable and summarize
+
+        Parameters
+        ----------
+        v : :class:`~spacepy.pycdf.Var`
+            Variable to summarize
+        """
+        self.shape = v.shape
+        self.n_fill = 0
+        self.n_nan = 0
+        self.min = self.max = self.dtype = None
+        istime = v.type() in spacepy.pycdf.lib.timetypes
+        self.days = set() if istime else None
+        rv = v.rv()
+        self.decreasing = [] if rv and len(self.shape) == 1 else None
+        fill = self._fill(v)
+        last = None # Last valid value of previous blocks
+        for start, data in _chunks(v, time_as='datetime64'):
+            data = numpy.asanyarray(data)
+            if self.dtype is None:
+                self.dtype = data.dtype
+            kind = data.dtype.kind
+            if kind == 'M':
+                invalid = numpy.isnat(data)
+                if fill is not None:
+                    invalid |= data == fill
+                self.n_fill += numpy.count_nonzero(invalid)
+            else:
+                if fill is None:
+                    invalid = numpy.zeros(data.shape, dtype=bool)
+                elif kind == 'f' and numpy.issubdtype(
+                        numpy.asanyarray(fill).dtype, numpy.floating):
+                    invalid = numpy.isclose(data, fill)
+                else:
+                    invalid = numpy.asanyarray(data == fill)
+                self.n_fill += numpy.count_nonzero(invalid)
+                if kind == 'f':
+                    nan = numpy.isnan(data) & ~invalid
+                    self.n_nan += numpy.count_nonzero(nan)
+                    invalid |= nan
+            if self.days is not None:
+                self.days.update(
+                    str(d).replace('-', '') for d in
+                    numpy.unique(data[~invalid].astype('datetime64[D]')))
+            if self.decreasing is not None and kind in 'iufM' and len(data):
+                #Compare each valid value to the previous valid value
+                valid = numpy.nonzero(~invalid)[0]
+                seq = data[valid] if last is None \
+                      else numpy.concatenate(((last,), data[valid]))
+                self.decreasing.extend(
+                    valid[len(valid) - len(seq) + 1:][seq[1:] < seq[:-1]]
+                    + start)
+                if len(valid):
+                    last = data[valid[-1]]
+            if kind not in 'iufM' or (rv and not len(data)):
+                continue
+            values = data.view(numpy.int64) if kind == 'M' else data
+            if kind == 'f':
+                hi, lo = numpy.inf, -numpy.inf
+            else:
+                hi, lo = numpy.iinfo(values.dtype).max, \
+                         numpy.iinfo(values.dtype).min
+            chunkmin = numpy.where(invalid, hi, values)
+            chunkmax = numpy.where(invalid, lo, values)
+            if rv: #Reduce over records
+                chunkmin = chunkmin.min(axis=0)
+                chunkmax = chunkmax.max(axis=0)
+            self.min = chunkmin if self.min is None \
+                       else numpy.minimum(self.min, chunkmin)
+            self.max = chunkmax if self.max is None \
+                       else numpy.maximum(self.max, chunkmax)
+        if self.decreasing is not None:
+            self.decreasing = numpy.array(self.decreasing, dtype=numpy.int64)
+
+    @staticmethod
+    def _fill(v):
+        """Get the fill value of a variable, for comparison to data
+
+        Parameters
+        ----------
+        v : :class:`~spacepy.pycdf.Var`
+            Variable to check
+
+        Returns
+        -------
+        fill
+            ``FILLVAL`` of the variable, as the type read for data
+            (``numpy.datetime64`` for times); None if there is
+            no fill or it cannot be compared to the data.
+        """
+        if not 'FILLVAL' in v.attrs:
+            return None
+        fill = v.attrs['FILLVAL']
+        if v.type() in spacepy.pycdf.lib.timetypes:
+            try:
+                return numpy.datetime64(fill)
+            except (TypeError, ValueError):
+                return None
+        filldtype = spacepy.pycdf.lib.numpytypedict.get(
+            v.attrs.type('FILLVAL'), object)
+        if numpy.issubdtype(v.dtype, numpy.floating) \
+           and numpy.issubdtype(filldtype, numpy.floating):
+            return fill
+        if numpy.can_cast(numpy.asanyarray(fill), v.dtype):
+            return fill
+        return None
+
+    def outside(self, limit, under):
+        """Check if any values may be outside a limit
+
+        Parameters
+        ----------
+        limit
+            Lower or upper limit; scalar or same shape as one record.
+
+        under : bool
+            Check for values under `limit` (True) or over (False).
+
+        Returns
+        -------
+        bool
+            False if no value (except fill and NaN) is under (or over)
+            `limit`; True if any is or if it cannot be determined from
+            the summary.
+        """
+        if self.min is None:
+            return True
+        try:
+            limit = numpy.asanyarray(limit)
+            if self.dtype.kind == 'M':
+                limit = limit.astype(self.dtype).view(numpy.int64)
+            return bool(numpy.any(self.min < limit) if under
+                        else numpy.any(self.max > limit))
+        except (TypeError, ValueError):
+            return True
+
+
 class VariableChecks(object):
     """ISTP compliance checks for a single variable.
 
@@ -124,15 +384,16 @@ class VariableChecks(object):
                   if not name.startswith('_') and not name.endswith('_')
                   and callable(func) and name != 'all']
         errors = []
-        for f in callme:
-            try:
-                errors.extend(f(v))
-            except:
-                if catch:
-                    errors.append('Test {} did not complete.'.format(
-                        f.__name__))
-                else:
-                    raise
+        with _shared_stats(v.cdf_file):
+            for f in callme:
+                try:
+                    errors.extend(f(v))
+                except:
+                    if catch:
+                        errors.append('Test {} did not complete.'.format(
+                            f.__name__))
+                    else:
+                        raise
         return errors
 
     @classmethod
@@ -461,18 +722,8 @@ class VariableChecks(object):
         errs = []
         vshape = v.shape
         minval, maxval = spacepy.pycdf.lib.get_minmax(v.type())
-        if rng:
-            data = v[...]
-            is_fill = False
-            if 'FILLVAL' in v.attrs:
-                filldtype = spacepy.pycdf.lib.numpytypedict.get(
-                    v.attrs.type('FILLVAL'), object)
-                if numpy.issubdtype(v.dtype, numpy.floating) \
-                   and numpy.issubdtype(filldtype, numpy.floating):
-                    is_fill = numpy.isclose(data, v.attrs['FILLVAL'])
-                elif numpy.can_cast(numpy.asanyarray(v.attrs['FILLVAL']),
-                                    v.dtype):
-                    is_fill = data == v.attrs['FILLVAL']
+        if rng and len(v):
+            stats = _stats(v)
         for which in (whichmin, whichmax):
             if not which in v.attrs:
                 continue
@@ -515,39 +766,85 @@ class VariableChecks(object):
                     minval, maxval))
             if not rng or not len(v): #nothing to compare
                 continue
-            #Always put numpy array on the left so knows to do element compare
-            idx = (data < attrval) if which == whichmin \
-                  else (data > attrval)
-            idx = numpy.logical_and(idx, numpy.logical_not(is_fill))
-            if idx.any():
-                direction = 'under' if which == whichmin else 'over'
-                if len(vshape) == 0: #Scalar
-                    errs.append('Value {} {} {} {}.'.format(
-                        data, direction, which,
-                        attrval[0, :] if multidim else attrval))
-                    continue
-                badidx = numpy.nonzero(idx)
-                badvals = data[badidx]
-                if len(badidx) > 1: #Multi-dimensional data
-                    badidx = numpy.transpose(badidx) #Group by value not axis
-                else:
-                    badidx = badidx[0] #Just recover the index value
-                if len(badvals) < 10:
-                    badvalstr = ', '.join(str(d) for d in badvals)
-                    badidxstr = ', '.join(str(d) for d in badidx)
-                    errs.append('Value {} at index {} {} {} {}.'.format(
-                        badvalstr, badidxstr,
-                        direction, which,
-                        attrval[0, :] if multidim else attrval))
-                else:
-                    errs.append('{} values {} {} {}'.format(
-                        len(badvals), direction, which,
-                        attrval[0, :] if multidim else attrval))
+            if not stats.outside(attrval, which == whichmin):
+                continue
+            errs.extend(cls._outside(v, which, attrval, which == whichmin))
         if (whichmin in v.attrs) and (whichmax in v.attrs):
             if numpy.any(v.attrs[whichmin] > v.attrs[whichmax]):
                 errs.append('{} > {}.'.format(whichmin, whichmax))
         return errs
 
+    @classmethod
+    def _outside(cls, v, which, attrval, under):
+        """Helper function to describe values outside VALIDMIN/VALIDMAX
+
+        Reads the data a block at a time; only used if the summary of
+        the data shows values may be outside.
+
+        Parameters
+        ----------
+        v : :class:`~spacepy.pycdf.Var`
+            Variable to check
+
+        which : str
+            Name of the attribute with the limit
+
+        attrval
+            Value of the limit, broadcastable to the data
+
+        under : bool
+            Check for values under `attrval` (True) or over (False)
+
+        Returns
+        -------
+        list of str
+            Description of each validation failure.
+        """
+        fill = _VarStats._fill(v)
+        if fill is not None and v.type() in spacepy.pycdf.lib.timetypes:
+            fill = v.attrs['FILLVAL'] #As read by default, not datetime64
+        multidim = bool(numpy.shape(attrval))
+        limit = attrval[0, :] if multidim and v.rv() else attrval
+        direction = 'under' if under else 'over'
+        count = 0
+        badvals = []
+        badidx = []
+        for start, data in _chunks(v):
+            data = numpy.asanyarray(data)
+            if fill is None:
+                is_fill = False
+            elif numpy.issubdtype(data.dtype, numpy.floating) \
+                 and isinstance(fill, (float, numpy.floating)):
+                is_fill = numpy.isclose(data, fill)
+            else:
+                is_fill = data == fill
+            #Always put numpy array on the left so knows to do element compare
+            idx = (data < attrval) if under else (data > attrval)
+            idx = numpy.logical_and(idx, numpy.logical_not(is_fill))
+            if not idx.any():
+                continue
+            if len(v.shape) == 0: #Scalar
+                return ['Value {} {} {} {}.'.format(
+                    data, direction, which, limit)]
+            thisidx = numpy.nonzero(idx)
+            count += len(thisidx[0])
+            if len(badvals) >= 10:
+                continue
+            badvals.extend(data[thisidx][:10])
+            thisidx = (thisidx[0] + start,) + thisidx[1:]
+            if len(thisidx) > 1: #Multi-dimensional data
+                badidx.extend(numpy.transpose(thisidx)[:10]) #Group by value
+            else:
+                badidx.extend(thisidx[0][:10]) #Just recover the index value
+        if not count:
+            return []
+        if count < 10:
+            return ['Value {} at index {} {} {} {}.'.format(
+                ', '.join(str(d) for d in badvals),
+                ', '.join(str(d) for d in badidx),
+                direction, which, limit)]
+        return ['{} values {} {} {}'.format(count, direction, which, limit)]
+
     @classmethod
     def validrange(cls, v):
         """Check that all values are within VALIDMIN/VALIDMAX, or FILLVAL
@@ -723,19 +1020,22 @@ class FileChecks(object):
                   if not name.startswith('_') and not name.endswith('_')
                   and callable(func) and name != 'all']
         errors = []
-        for func in callme:
-            try:
-                errors.extend(func(f))
-            except:
-                if catch:
-                    errors.append('Test {} did not complete.'.format(
-                        func.__name__))
-                else:
-                    raise
+        #Each variable is read once for all file and variable checks
+        with _shared_stats(f) as cache:
+            for func in callme:
+                try:
+                    errors.extend(func(f))
+                except:
+                    if catch:
+                        errors.append('Test {} did not complete.'.format(
+                            func.__name__))
+                    else:
+                        raise
 
-        for v in f:
-            errors.extend(('{}: {}'.format(v, e)
-                           for e in VariableChecks.all(f[v], catch=catch)))
+            for v in f:
+                errors.extend(('{}: {}'.format(v, e)
+                               for e in VariableChecks.all(f[v], catch=catch)))
+                cache.pop(f[v].name(), None) #Not needed again
         return errors
                 
     @classmethod
@@ -830,12 +1130,11 @@ class FileChecks(object):
                                    spacepy.pycdf.const.CDF_EPOCH16.value,
                                    spacepy.pycdf.const.CDF_TIME_TT2000.value):
                 continue
-            data = f[v][...]
-            idx = numpy.where(numpy.diff(data) < datetime.timedelta(0))[0]
-            if not any(idx):
+            idx = _stats(f[v]).decreasing
+            if idx is None or not len(idx):
                 continue
             errs.append('{}: Nonmonotonic time at record {}.'.format(
-                v, ', '.join((str(i) for i in (idx + 1)))))
+                v, ', '.join((str(i) for i in idx))))
         return errs
 
     @classmethod
@@ -875,7 +1174,7 @@ class FileChecks(object):
             if f[v].type() in (spacepy.pycdf.const.CDF_EPOCH.value,
                                spacepy.pycdf.const.CDF_EPOCH16.value,
                                spacepy.pycdf.const.CDF_TIME_TT2000.value):
-                datestrs = list(set((d.strftime('%Y%m%d') for d in f[v][...])))
+                datestrs = list(_stats(f[v]).days)
                 if len(datestrs) == 0:
                     continue
                 elif len(datestrs) > 1:
@@ -887,6 +1186,96 @@ class FileChecks(object):
         return errs
 
 
+def check_archive(target, processes=None, catch=True, output=None):
+    """Check every CDF in an archive for ISTP compliance
+
+    Runs :meth:`FileChecks.all` (and thus :meth:`VariableChecks.all`
+    on every variable) on each CDF, in a pool of processes. Within
+    each file, the data of each variable are read once and shared
+    among all checks that need them.
+
+    .. versionadded:: 0.2.3
+
+    Parameters
+    ----------
+    target : str or list of str
+        Directory (all ``.cdf`` files in it are checked), glob
+        pattern, or list of paths to CDFs.
+    processes : int
+        Number of processes to check files in parallel, one file at
+        a time per process. Default: number of CPUs. Specify 1 to
+        check all files in this process.
+    catch : bool
+        Catch exceptions in tests (default True), as in
+        :meth:`FileChecks.all`. If True, a file that cannot be opened
+        is reported as a validation failure rather than raising.
+    output : str
+        Path to write the report, as JSON (default: do not write).
+
+    Returns
+    -------
+    dict
+        Description of each validation failure (list of str), keyed by
+        path of each CDF.
+
+    Examples
+    --------
+    >>> import spacepy.pycdf.istp
+    >>> report = spacepy.pycdf.istp.check_archive(
+    ...     'data/rbspa/*_l2_*.cdf', processes=8, output='report.json')
+    >>> bad = [k for k, v in report.items() if v]
+    """
+    if isinstance(target, str):
+        if os.path.isdir(target):
+            target = os.path.join(target, '*.cdf')
+        paths = sorted(glob.glob(target))
+    else:
+        paths = list(target)
+    args = [(p, catch) for p in paths]
+    if processes is None or processes > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(processes)
+        try:
+            report = dict(pool.imap_unordered(_check_file, args))
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+    else:
+        report = dict(_check_file(a) for a in args)
+    report = collections.OrderedDict((p, report[p]) for p in paths)
+    if output is not None:
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=1)
+    return report
+
+
+def _check_file(args):
+    """Check one CDF, for :func:`check_archive`
+
+    Parameters
+    ----------
+    args : tuple
+        Path to the CDF, and whether to catch exceptions.
+
+    Returns
+    -------
+    tuple
+        Path to the CDF, and list of validation failures.
+    """
+    path, catch = args
+    try:
+        f = spacepy.pycdf.CDF(path)
+    except Exception as e:
+        if not catch:
+            raise
+        return path, ['Cannot open file: {}'.format(e)]
+    try:
+        return path, FileChecks.all(f, catch=catch)
+    finally:
+        f.close()
+
+
 def fillval(v, ret=False):
     """Set ISTP-compliant FILLVAL on a variable
 
@@ -985,6 +1374,123 @@ def format(v, use_scaleminmax=False, dryrun=False):
     >>> v.attrs['FORMAT']
     'I4'
 
+    """
+    attrs = {a: v.attrs[a]
+             for a in ('VALIDMIN', 'VALIDMAX', 'SCALEMIN', 'SCALEMAX')
+             if a in v.attrs}
+    fmt = _format(v.name(), v.type(), v.nelems(), attrs, use_scaleminmax)
+    if dryrun:
+        print(fmt)
+    else:
+        if 'FORMAT' in v.attrs:
+            del v.attrs['FORMAT']
+        v.attrs.new('FORMAT', data=fmt, type=spacepy.pycdf.const.CDF_CHAR)
+
+
+@contextlib.contextmanager
+def _bulk_metadata(f):
+    """Read all metadata of a CDF at once, if possible
+
+    Within this context, ``f`` is readonly so that all attributes are
+    read at once (see :meth:`~spacepy.pycdf.CDF.readonly`) and not
+    with a library call for each. This has no effect if ``f`` has been
+    changed since it was opened. Do not write to ``f`` in this context.
+
+    Parameters
+    ----------
+    f : :class:`~spacepy.pycdf.CDF`
+        CDF to read
+    """
+    ro = f.readonly()
+    if not ro:
+        f.readonly(True)
+    try:
+        yield
+    finally:
+        if not ro:
+            f.readonly(False)
+
+
+def format_all(f, use_scaleminmax=False, dryrun=False):
+    """Set ISTP-compliant FORMAT on all variables in a CDF
+
+    As :func:`format` for every variable in ``f``. The attributes of all
+    variables are read at once, then ``FORMAT`` is written only for
+    those variables where it changes. This is much faster than calling
+    :func:`format` on every variable of a large CDF.
+
+    .. versionadded:: 0.2.3
+
+    Parameters
+    ----------
+    f : :class:`~spacepy.pycdf.CDF`
+        CDF to update
+    use_scaleminmax : bool, optional
+        Use SCALEMIN/MAX instead of VALIDMIN/MAX (default False).
+        Note: istpchecks may complain about result.
+    dryrun : bool, optional
+        Print the variable name and decided format to stdout instead of
+        modifying the CDF (for use in command-line debugging)
+        (default False).
+
+    Examples
+    --------
+    >>> import spacepy.pycdf
+    >>> import spacepy.pycdf.istp
+    >>> f = spacepy.pycdf.CDF('foo.cdf', create=True)
+    >>> v = f.new('Var', data=[1, 2, 3])
+    >>> v2 = f.new('Var2', data=[1., 2., 3.])
+    >>> spacepy.pycdf.istp.format_all(f)
+    >>> v.attrs['FORMAT'], v2.attrs['FORMAT']
+    ('I4', 'G10.2E3')
+    """
+    fmts = []
+    with _bulk_metadata(f):
+        for vname in f:
+            v = f[vname]
+            attrs = {a: v.attrs[a]
+                     for a in ('VALIDMIN', 'VALIDMAX', 'SCALEMIN', 'SCALEMAX')
+                     if a in v.attrs}
+            fmt = _format(vname, v.type(), v.nelems(), attrs, use_scaleminmax)
+            same = 'FORMAT' in v.attrs and v.attrs['FORMAT'] == fmt \
+                   and v.attrs.type('FORMAT') \
+                   == spacepy.pycdf.const.CDF_CHAR.value
+            fmts.append((vname, fmt, same))
+    for vname, fmt, same in fmts:
+        if dryrun:
+            print('{}: {}'.format(vname, fmt))
+            continue
+        if same:
+            continue
+        v = f[vname]
+        if 'FORMAT' in v.attrs:
+            del v.attrs['FORMAT']
+        v.attrs.new('FORMAT', data=fmt, type=spacepy.pycdf.const.CDF_CHAR)
+
+
+def _format(name, cdftype, nelems, attrs, use_scaleminmax=False):
+    """Find ISTP-compliant FORMAT for a variable
+
+    Helper for :func:`format` and :func:`format_all`.
+
+    Parameters
+    ----------
+    name : str
+        Name of the variable (for error messages)
+    cdftype : int
+        CDF type of the variable
+    nelems : int
+        Number of elements of the variable
+    attrs : dict
+        Values of any ``VALIDMIN``, ``VALIDMAX``, ``SCALEMIN``, and
+        ``SCALEMAX`` attributes of the variable
+    use_scaleminmax : bool, optional
+        Use SCALEMIN/MAX instead of VALIDMIN/MAX (default False).
+
+    Returns
+    -------
+    str
+        The FORMAT
     """
     if use_scaleminmax:
         minn = 'SCALEMIN'
@@ -992,7 +1498,6 @@ def format(v, use_scaleminmax=False, dryrun=False):
     else:
         minn = 'VALIDMIN'
         maxx = 'VALIDMAX'
-    cdftype = v.type()
     if cdftype in (spacepy.pycdf.const.CDF_INT1.value,
                    spacepy.pycdf.const.CDF_INT2.value,
                    spacepy.pycdf.const.CDF_INT4.value,
@@ -1001,8 +1506,8 @@ def format(v, use_scaleminmax=False, dryrun=False):
                    spacepy.pycdf.const.CDF_UINT2.value,
                    spacepy.pycdf.const.CDF_UINT4.value,
                    spacepy.pycdf.const.CDF_BYTE.value):
-        if minn in v.attrs: #Just use validmin or scalemin
-            minval = v.attrs[minn]
+        if minn in attrs: #Just use validmin or scalemin
+            minval = attrs[minn]
         elif cdftype in (spacepy.pycdf.const.CDF_UINT1.value,
                          spacepy.pycdf.const.CDF_UINT2.value,
                          spacepy.pycdf.const.CDF_UINT4.value): #unsigned, easy
@@ -1013,8 +1518,8 @@ def format(v, use_scaleminmax=False, dryrun=False):
             size = next((i for i in (1, 2, 4, 8) if getattr(
                 spacepy.pycdf.const, 'CDF_INT{}'.format(i)).value == cdftype))
             minval = - 2 ** (8*size  - 1)
-        if maxx in v.attrs: #Just use max
-            maxval = v.attrs[maxx]
+        if maxx in attrs: #Just use max
+            maxval = attrs[maxx]
         elif cdftype == spacepy.pycdf.const.CDF_BYTE.value:
             maxval = 2 ** 7 - 1
         else:
@@ -1047,23 +1552,23 @@ def format(v, use_scaleminmax=False, dryrun=False):
                      spacepy.pycdf.const.CDF_FLOAT.value,
                      spacepy.pycdf.const.CDF_DOUBLE.value):
         # Prioritize SCALEMIN/MAX to find the number of decimals to include
-        if 'SCALEMIN' in v.attrs and 'SCALEMAX' in v.attrs:
-            range = v.attrs['SCALEMAX'] - v.attrs['SCALEMIN']
+        if 'SCALEMIN' in attrs and 'SCALEMAX' in attrs:
+            range = attrs['SCALEMAX'] - attrs['SCALEMIN']
         # If not, use VALIDMIN/MAX
-        elif 'VALIDMIN' in v.attrs and 'VALIDMAX' in v.attrs:
-            range = v.attrs['VALIDMAX'] - v.attrs['VALIDMIN']
+        elif 'VALIDMIN' in attrs and 'VALIDMAX' in attrs:
+            range = attrs['VALIDMAX'] - attrs['VALIDMIN']
         # If not, just use nothing.
         else:
             range = None
         # Find how many spaces we need for the 'integer' part of the number
         # (Use maxx-minn for this...effectively uses VALIDMIN/MAX for most
         # cases.)
-        if range and (minn in v.attrs and maxx in v.attrs):
-            if len(str(int(v.attrs[maxx]))) >=\
-               len(str(int(v.attrs[minn]))):
-                ln = str(int(v.attrs[maxx]))
+        if range and (minn in attrs and maxx in attrs):
+            if len(str(int(attrs[maxx]))) >=\
+               len(str(int(attrs[minn]))):
+                ln = str(int(attrs[maxx]))
             else:
-                ln = str(int(v.attrs[minn]))
+                ln = str(int(attrs[minn]))
         if range and ln and range < 0: # Cover all our bases:
             # raise ValueError('Range ({} - {}) cannot be negative:'
                 # '\nVarname: {}\nRange: {}'.format(maxx, minn, v, range))
@@ -1091,17 +1596,12 @@ def format(v, use_scaleminmax=False, dryrun=False):
             fmt = 'G10.2E3'
     elif cdftype in (spacepy.pycdf.const.CDF_CHAR.value,
                      spacepy.pycdf.const.CDF_UCHAR.value):
-        fmt = 'A{}'.format(v.nelems())
+        fmt = 'A{}'.format(nelems)
     else:
         raise ValueError("Couldn't find FORMAT for {} of type {}".format(
-            v.name(),
+            name,
             spacepy.pycdf.lib.cdftypenames.get(cdftype, 'UNKNOWN')))
-    if dryrun:
-        print(fmt)
-    else:
-        if 'FORMAT' in v.attrs:
-            del v.attrs['FORMAT']
-        v.attrs.new('FORMAT', data=fmt, type=spacepy.pycdf.const.CDF_CHAR)
+    return fmt
 
 
 def nanfill(v):
@@ -1165,6 +1665,74 @@ def nanfill(v):
     for i in badidx:
         v[tuple(i)] = numpy.nan
 
+def nanfill_all(f):
+    """Set fill values to NaN in all floating-point variables of a CDF
+
+    As :func:`nanfill` for every variable of floating-point type in
+    ``f``, but updating the CDF in place efficiently. The attributes of
+    all variables are read at once. Data are then read a block of
+    records at a time, and each block with any value to replace is
+    written back with a single write of the records from the first to
+    the last changed record.
+
+    The result is no longer ISTP compliant; this is intended for
+    post-processing files not for distribution.
+
+    .. versionadded:: 0.2.3
+
+    Parameters
+    ----------
+    f : :class:`~spacepy.pycdf.CDF`
+        CDF to update
+
+    Examples
+    --------
+    >>> import spacepy.pycdf
+    >>> import spacepy.pycdf.istp
+    >>> f = spacepy.pycdf.CDF('foo.cdf', create=True)
+    >>> v = f.new('Var', data=[1., 2., 3., -1e31])
+    >>> spacepy.pycdf.istp.fillval(v)
+    >>> spacepy.pycdf.istp.nanfill_all(f)
+    >>> v[...]
+    array([ 1.,  2.,  3., nan])
+    """
+    floattypes = (spacepy.pycdf.const.CDF_REAL4.value,
+                  spacepy.pycdf.const.CDF_REAL8.value,
+                  spacepy.pycdf.const.CDF_FLOAT.value,
+                  spacepy.pycdf.const.CDF_DOUBLE.value)
+    todo = []
+    with _bulk_metadata(f):
+        for vname in f:
+            v = f[vname]
+            if not v.type() in floattypes:
+                continue
+            limits = {a: numpy.asanyarray(v.attrs[a])
+                      for a in ('FILLVAL', 'VALIDMIN', 'VALIDMAX')
+                      if a in v.attrs}
+            if limits:
+                todo.append((vname, limits))
+    for vname, limits in todo:
+        v = f[vname]
+        for start, data in _chunks(v):
+            data = numpy.asanyarray(data) #Array even if scalar
+            badidx = numpy.zeros(shape=data.shape, dtype=bool)
+            if 'FILLVAL' in limits:
+                badidx |= (data == limits['FILLVAL'])
+            if 'VALIDMIN' in limits:
+                badidx |= (data < limits['VALIDMIN'])
+            if 'VALIDMAX' in limits:
+                badidx |= (data > limits['VALIDMAX'])
+            if not badidx.any():
+                continue
+            data[badidx] = numpy.nan
+            if not v.rv():
+                v[...] = data
+                continue
+            recs = numpy.nonzero(
+                badidx.reshape(len(badidx), -1).any(axis=1))[0]
+            lo, hi = recs[0], recs[-1] + 1
+            v[start + lo:start + hi] = data[lo:hi]
+
 
 class VarBundle(object):
     """Collective handling of ISTP-compliant variable and its dependencies.
@@ -1649,7 +2217,7 @@ class VarBundle(object):
         return [v for v, i in self._varinfo.items()
                 if i.get('thisdim', None) not in deleted]
 
-    def _same(self, newvar, invar, rv, dv, dims, data):
+    def _same(self, newvar, invar, rv, dv, dims, data=None):
         """Checks if an existing variable matches a proposed new variable
 
         Does not compare DEPEND and LABL_PTR attributes (those are handled
@@ -1674,7 +2242,8 @@ class VarBundle(object):
             Size of each dimension.
 
         data : :class:`~numpy.ndarray`
-            Data that should be in the variable.
+            Data that should be in the variable. If not specified, data
+            are not compared.
 
         Returns
         -------
@@ -1699,7 +2268,7 @@ class VarBundle(object):
                or not numpy.array_equal(ia[a], na[a]):
                 return False
         #Finally check the data
-        return (data == newvar[...]).all()
+        return data is None or (data == newvar[...]).all()
 
     def _namemap(self, suffix=None):
         """Map old variable names to new
@@ -2028,9 +2597,105 @@ class VarBundle(object):
                     ops.append((name, (dim,), {}))
         return ops
 
-    def output(self, output, suffix=None):
+    @staticmethod
+    def _blocks(invar, sl, nrec):
+        """Split the record slice of a read into blocks
+
+        Helper for :meth:`output` so record-varying variables are
+        read, processed, and written a block of records at a time.
+
+        Parameters
+        ----------
+        invar : :class:`~spacepy.pycdf.Var`
+            Input variable (record-varying)
+
+        sl : list
+            Slice on each dimension to read; first is the record slice.
+
+        nrec : int
+            Maximum number of records in each block.
+
+        Returns
+        -------
+        list of tuple
+            For each block, the index of its first record in the output,
+            and the slice on each dimension to read. If there are no
+            records, the first index is None and the slice is ``sl``.
+        """
+        start, stop, step = sl[0].indices(len(invar))
+        n = max(0, (stop - start + step - (1 if step > 0 else -1)) // step)
+        if not n:
+            return [(None, sl)]
+        blocks = []
+        for i in range(0, n, nrec):
+            bstart = start + i * step
+            bstop = bstart + min(nrec, n - i) * step
+            blocks.append(
+                (i, [slice(bstart, bstop if bstop >= 0 else None, step)]
+                 + list(sl[1:])))
+        return blocks
+
+    def _outvar(self, output, outname, invar, rv, dv, data):
+        """Find or create an output variable
+
+        Helper for :meth:`output`. A new variable is created empty,
+        with no attributes; an existing variable is checked for
+        consistency (except its data).
+
+        Parameters
+        ----------
+        output : :class:`~spacepy.pycdf.CDF`
+            Output CDF
+
+        outname : str
+            Name of the variable in the output
+
+        invar : :class:`~spacepy.pycdf.Var`
+            Input variable (opened in raw mode)
+
+        rv : bool
+            Is the output variable record-varying
+
+        dv : list of bool
+            Data variance for each dimension of the output.
+
+        data : :class:`~numpy.ndarray`
+            Data for the output (or the first block of it).
+
+        Returns
+        -------
+        tuple
+            Output variable (opened in raw mode) and if it already existed.
+        """
+        #Get shape of output variable from actual data
+        dims = data.shape
+        #Raw Epoch16 have a trailing (2,)
+        if invar.type() == spacepy.pycdf.const.CDF_EPOCH16.value:
+            dims = dims[:-1]
+        if rv: #remove record dimension from size IF output is RV
+            dims = dims[1:]
+        if outname in output:
+            newvar = output.raw_var(outname)
+            if not self._same(newvar, invar, rv, dv, dims):
+                raise RuntimeError(
+                    'Incompatible {} already exists in output.'
+                    .format(outname))
+            return newvar, True
+        output.new(outname, type=invar.type(), recVary=rv,
+                   dimVarys=dv, dims=dims, n_elements=invar.nelems())
+        newvar = output.raw_var(outname)
+        #Must create it empty so can change compression
+        newvar.compress(*invar.compress())
+        return newvar, False
+
+    def output(self, output, suffix=None, nrec=10000):
         """Output the variables as modified
 
+        Record-varying variables are read, processed, and written
+        ``nrec`` records at a time, so memory use does not depend on
+        the number of records, unless the record dimension is summed,
+        averaged, or selected by a sequence of indices.
+
         Parameters
         ----------
         output : :class:`~spacepy.pycdf.CDF`
@@ -2044,6 +2709,11 @@ class VarBundle(object):
             Any dependencies will have the suffix applied only if they have
             changed from the input CDF (e.g. from slicing.)
 
+        nrec : int
+            Number of input records to process at a time (default 10000).
+
+            .. versionadded:: 0.2.3
+
         Returns
         -------
         VarBundle
@@ -2087,53 +2757,55 @@ class VarBundle(object):
             postidx = [postidx[i] for i in range(len(postidx))
                        if not degen[i]]
 
-            #Now get the data, and sum/average it
             if not rv: #Remove fake record dimension
                 sl = sl[1:]
                 postidx = postidx[1:]
-            #Forces array scalars, makes the rest work better
-            data = numpy.asanyarray(invar.__getitem__(tuple(sl)))
-            if postidx:
-                data = data[tuple(postidx)]
-            data = self._sum_avg(data, invar, vinfo, degen, summed, averaged)
-            #Summed/averaged dimensions are now also degenerate
-            degen = [max(v) for v in zip(degen, summed, averaged)]
-
-            #Get shape of output variable from actual data
-            dims = data.shape
-            #Raw Epoch16 have a trailing (2,)
-            if invar.type() == spacepy.pycdf.const.CDF_EPOCH16.value:
-                dims = dims[:-1]
+            #Records are read in blocks unless reduced or fancy-indexed
+            blocks = self._blocks(invar, sl, nrec) \
+                     if rv and not (degen[0] or summed[0] or averaged[0]) \
+                     and isinstance(postidx[0], slice) else [(None, sl)]
+            #Summed/averaged dimensions are also degenerate on output
+            outdegen = [max(v) for v in zip(degen, summed, averaged)]
             #Cut out any degenerate dimensions from DV (skipping record dim)
-            dv = [dv[i] for i in range(len(dv)) if not degen[i + 1]]
+            dv = [dv[i] for i in range(len(dv)) if not outdegen[i + 1]]
             #Change record variance for the output if sliced away 0th
-            if rv and degen[0]:
-                rv = False
-            if rv: #remove record dimension from size IF output is RV
-                dims = dims[1:]
-
-            #Rename the variable if necessary
+            outrv = rv and not outdegen[0]
             outname = namemap.get(vname, vname)
-            if outname in output:
-                preexist = True
-                newvar = output.raw_var(outname)
-                if not self._same(newvar, invar, rv, dv, dims, data):
-                    raise RuntimeError(
-                        'Incompatible {} already exists in output.'
-                        .format(outname))
-            else:
-                preexist = False
-                newvar = output.new(
-                    outname, type=invar.type(), recVary=rv,
-                    dimVarys=dv, dims=dims,
-                    n_elements=invar.nelems())
-                newvar = output.raw_var(outname)
-                #Must create it empty so can change compression
-                newvar.compress(*invar.compress())
-                newvar[...] = data
+            newvar = None
+            written = 0
+            for start, blocksl in blocks:
+                #Forces array scalars, makes the rest work better
+                data = numpy.asanyarray(invar.__getitem__(tuple(blocksl)))
+                if postidx:
+                    data = data[tuple(postidx)]
+                data = self._sum_avg(
+                    data, invar, vinfo, degen, summed, averaged)
+                if newvar is None:
+                    newvar, preexist = self._outvar(
+                        output, outname, invar, outrv, dv, data)
+                outsl = Ellipsis if start is None \
+                        else slice(start, start + len(data))
+                if preexist:
+                    existing = numpy.asanyarray(newvar[outsl])
+                    if existing.shape != data.shape \
+                       or not (data == existing).all():
+                        raise RuntimeError(
+                            'Incompatible {} already exists in output.'
+                            .format(outname))
+                else:
+                    newvar[outsl] = data
+                if start is not None:
+                    written = start + len(data)
+            if preexist and blocks[0][0] is not None \
+               and len(newvar) != written:
+                raise RuntimeError(
+                    'Incompatible {} already exists in output.'
+                    .format(outname))
+            if not preexist:
                 newvar.attrs.clone(invar.attrs)
                 if vname != outname: #renamed
                     newvar.attrs['FIELDNAM'] = outname
+            degen = outdegen
 
             self._repoint_depend(invar, newvar, preexist, namemap, degen)
         return self
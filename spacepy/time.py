@@ -142,12 +142,13 @@ Copyright 2010 Los Alamos National Security, LLC.
 """
 from __future__ import absolute_import
 
-import bisect
 try:
     from collections.abc import Callable, MutableSequence
 except ImportError:
     from collections import Callable, MutableSequence
+import copy
 import datetime
+import functools
 
 try:
     from itertools import izip as zip
@@ -181,7 +182,7 @@ class Ticktock(MutableSequence):
     Ticktock( data, dtype )
 
     Ticktock class holding various time coordinate systems
-    (TAI, UTC, ISO, JD, MJD, UNX, RDT, CDF, DOY, eDOY, APT)
+    (TAI, UTC, ISO, JD, MJD, UNX, RDT, CDF, DOY, eDOY, APT, DT64)
 
     Possible input data types:
 
@@ -205,6 +206,11 @@ class Ticktock(MutableSequence):
     APT
         AstroPy :class:`~astropy.time.Time`. Requires AstroPy 1.0.
         (New in version 0.2.2.)
+    DT64
+        UTC as :class:`numpy.datetime64`; like ``UTC``, cannot represent
+        leap seconds. Input may be in any datetime64 unit (e.g.
+        ``datetime64[ns]``) and is used as-is; output is ``datetime64[us]``.
+        (New in version 0.2.3.)
 
     Possible output data types: All those listed above, plus:
 
@@ -221,6 +227,12 @@ class Ticktock(MutableSequence):
     The original input data will always be available as the ``data``
     attribute.
 
+    Input of ``DT64`` gives a compact, array-based Ticktock: the data
+    are stored as eight bytes per time (rather than a Python object)
+    and the ``UTC`` attribute, an array of ``datetime``, is only
+    created if it is accessed. Conversions to the other time systems
+    do not require ``UTC``.
+
     .. versionchanged:: 0.2.2
        In earlier versions of SpacePy, most values were derived from the
        ``datetime``-based ``UTC`` representation. This did not properly
@@ -248,7 +260,7 @@ class Ticktock(MutableSequence):
     ==========
     data : array_like (int, datetime, float, string)
         time stamp
-    dtype : string {`CDF`, `ISO`, `UTC`, `TAI`, `UNX`, `JD`, `MJD`, `RDT`, `APT`} or function
+    dtype : string {`CDF`, `ISO`, `UTC`, `TAI`, `UNX`, `JD`, `MJD`, `RDT`, `APT`, `DT64`} or function
         data type for data, if a function it must convert input time format to Python datetime
 
     Returns
@@ -298,10 +310,14 @@ class Ticktock(MutableSequence):
     .. autosummary::
         ~Ticktock.append
         ~Ticktock.argsort
+        ~Ticktock.concatenate
         ~Ticktock.convert
+        ~Ticktock.from_components
+        ~Ticktock.from_doy
         ~Ticktock.getAPT
         ~Ticktock.getCDF
         ~Ticktock.getDOY
+        ~Ticktock.getDT64
         ~Ticktock.getGPS
         ~Ticktock.getISO
         ~Ticktock.getJD
@@ -319,10 +335,14 @@ class Ticktock(MutableSequence):
         ~Ticktock.update_items
     .. automethod:: append
     .. automethod:: argsort
+    .. automethod:: concatenate
     .. automethod:: convert
+    .. automethod:: from_components
+    .. automethod:: from_doy
     .. automethod:: getAPT
     .. automethod:: getCDF
     .. automethod:: getDOY
+    .. automethod:: getDT64
     .. automethod:: getGPS
     .. automethod:: getISO
     .. automethod:: getJD
@@ -340,7 +360,8 @@ class Ticktock(MutableSequence):
     .. automethod:: update_items
 
     """
-    _keylist = ['UTC', 'TAI', 'ISO', 'JD', 'MJD', 'UNX', 'RDT', 'CDF', 'GPS', 'DOY', 'eDOY', 'leaps']
+    _keylist = ['UTC', 'TAI', 'ISO', 'JD', 'MJD', 'UNX', 'RDT', 'CDF', 'GPS',
+                'DT64', 'DOY', 'eDOY', 'leaps']
     if HAVE_ASTROPY:
         _keylist.append('APT')
     _keylist_upper = [key.upper() for key in _keylist]
@@ -368,6 +389,8 @@ class Ticktock(MutableSequence):
                     dtype = 'ISO'
                 elif isinstance(self.data[0], datetime.datetime):
                     dtype = 'UTC'
+                elif self.data.dtype.kind == 'M':
+                    dtype = 'DT64'
                 elif HAVE_ASTROPY and isinstance(self.data[0],
                                                  astropy.time.Time):
                     dtype = 'APT'
@@ -381,6 +404,8 @@ class Ticktock(MutableSequence):
                                      'please specify dtype.')
                 if dtype.upper() not in Ticktock._keylist_upper:
                     raise ValueError("data type " + dtype + " not provided, only " + str(Ticktock._keylist))
+                if dtype.upper() == 'DT64' and self.data.dtype.kind != 'M':
+                    self.data = self.data.astype('datetime64[us]')
             else:
                 # process input data using callable dtype to convert to datetime/UTC
                 dtype_func = np.vectorize(dtype)
@@ -394,7 +419,7 @@ class Ticktock(MutableSequence):
         except AttributeError:
             self.data.attrs['dtype'] = str(dtype_func)
         else:
-            # ISO is populated by update_items
+            # Clear any representations; calculated on access
             self.update_items('data')
             if dtype.upper() == 'TAI':
                 self.TAI = self.data
@@ -412,6 +437,8 @@ class Ticktock(MutableSequence):
                 self.UTC = no_tzinfo(self.data)
             elif dtype.upper() == 'APT':
                 self.APT = self.data
+            elif dtype.upper() == 'DT64':
+                self.DT64 = self.data
 
             ## Brian and Steve were looking at this to see about making plot work directly on the object
             ## is also making iterate as an array of datetimes
@@ -454,6 +481,8 @@ class Ticktock(MutableSequence):
         See Also http://docs.python.org/library/pickle.html
         """
         odict = self.__dict__.copy()  # copy the dict since we change it
+        # Don't pickle the full arrays of representations not yet sliced
+        odict.pop('_sliced', None)
         return odict
 
     def __setstate__(self, dict):
@@ -471,28 +500,59 @@ class Ticktock(MutableSequence):
 
         Will be called when requesting items in this instance
 
+        The returned Ticktock has the same dtype as this one. Its
+        ``data`` is indexed from this ``data`` (so, as in numpy, it is a
+        view if `idx` is a slice), and every time representation already
+        calculated here is shared and indexed when first accessed, rather
+        than recalculated.
+
+        .. versionchanged:: 0.2.3
+            Shares data and representations with this Ticktock;
+            previously a new Ticktock was created from ``UTC``.
+
         Parameters
         ==========
-        idx : int
+        idx : int, slice, or sequence of int or bool
             the item index to get
 
         Returns
         =======
         out : Ticktock
-            Ticktock instance with requested values
+            Ticktock instance with requested values; always at least
+            one-dimensional, even if `idx` is an int.
 
         Examples
         ========
         >>> a = Ticktock('2002-02-02T12:00:03', 'ISO')
         >>> a[0]
-        '2002-02-02T12:00:00'
+        Ticktock( ['2002-02-02T12:00:03'], dtype=ISO)
 
         See Also
         ========
         a.__setitem__
 
         """
-        return Ticktock(self.UTC[idx])
+        dtype = self.data.attrs['dtype']
+        if dtype not in self._keylist_upper: # Created from a function
+            return Ticktock(self.UTC[idx])
+        if isinstance(idx, (int, np.integer)):
+            if not -len(self) <= idx < len(self):
+                raise IndexError(
+                    'index {} is out of bounds for Ticktock of length {}'
+                    .format(idx, len(self)))
+            idx = slice(idx, (idx + 1) or None)
+        newobj = object.__new__(type(self))
+        newobj._isofmt = self._isofmt
+        newobj.data = self.data[idx]
+        if not hasattr(newobj.data, 'attrs'): # AstroPy time
+            newobj.data.attrs = {'dtype': dtype}
+        if dtype not in ('ISO', 'UTC'):
+            setattr(newobj, dtype, newobj.data)
+        sliced = self._sliced_cached(idx)
+        sliced.pop(dtype, None)
+        if sliced:
+            newobj._sliced = sliced
+        return newobj
 
     # -----------------------------------------------
     def __setitem__(self, idx, vals):
@@ -518,10 +578,13 @@ class Ticktock(MutableSequence):
         a.__getitem__
         """
         tmp = Ticktock(vals)
+        # data may be shared with a slice of this Ticktock (or this may be
+        # a slice), so make a copy to change.
+        self.data = self.data.copy()
         if len(tmp) > 1:
-            self.data[idx] = tmp.__getattribute__(self.data.attrs['dtype'])[:]
+            self.data[idx] = getattr(tmp, self.data.attrs['dtype'])[:]
         else:
-            self.data[idx] = tmp.__getattribute__(self.data.attrs['dtype'])[0]
+            self.data[idx] = getattr(tmp, self.data.attrs['dtype'])[0]
         self.update_items('data')
 
     # -----------------------------------------------
@@ -531,8 +594,9 @@ class Ticktock(MutableSequence):
 
         will be called when deleting items in the sequence
         """
+        olddata = self.data
         self.data = np.delete(self.data, idx)
-        self.update_items('data')
+        self._update_cached(olddata, lambda key, val: np.delete(val, idx))
 
     # -----------------------------------------------
     def __len__(self):
@@ -590,29 +654,38 @@ class Ticktock(MutableSequence):
         """
         a.__sub__(other)
 
-        Will be called if a timedelta object is subtracted from this instance and
+        Will be called if a time interval is subtracted from this instance and
         returns a new Ticktock instance. If a Ticktock is subtracted from another
         Ticktock then a list of timedeltas is returned.
 
+        The subtraction is performed on TAI, i.e. in elapsed SI seconds
+        including any leap seconds. The interval is converted exactly
+        to integer nanoseconds before subtraction.
+
+        .. versionchanged:: 0.2.3
+           Accepts `numpy.timedelta64` and seconds as well as
+           `datetime.timedelta`; subtraction is on TAI, and the result
+           has dtype TAI.
+
         Parameters
         ==========
-        other : Ticktock or datetime.timedelta
-            instance for comparison
+        other : Ticktock, datetime.timedelta, numpy.timedelta64 or float
+            Ticktock, or time interval (float and int are seconds).
+            Intervals may be scalar or sequence of same length as this
+            Ticktock.
 
         Examples
         ========
         >>> a = Ticktock('2002-02-02T12:00:00', 'ISO')
         >>> dt = datetime.timedelta(3)
-        >>> a - dt
-        Ticktock( ['2002-02-05T12:00:00'] ), dtype=ISO
+        >>> (a - dt).ISO
+        ['2002-01-30T12:00:00']
 
         See Also
         ========
         __add__
         """
-        if isinstance(other, datetime.timedelta):
-            newobj = Ticktock(self.UTC - other, 'UTC')
-        elif isinstance(other, Ticktock):
+        if isinstance(other, Ticktock):
             if not (len(other) == len(self.data)) and not (len(other) == 1):
                 raise ValueError('Ticktock lengths are mismatched, subtraction is not possible')
             same = True
@@ -624,66 +697,88 @@ class Ticktock(MutableSequence):
             else:
                 return [datetime.timedelta(seconds=t - other.TAI[0])
                         for t in self.TAI]
-        elif hasattr(other, '__iter__'):
-            if not isinstance(other[0], datetime.timedelta):
-                raise TypeError("Data supplied for addition is of the wrong type")
-            if not (len(other) == len(self.data)) or (len(other) == 1):
-                raise TypeError("Data supplied for addition is of the wrong shape")
-            same = True
-            if len(other) == 1: same = False
-            if same:
-                newUTC = [utc - o for utc, o in zip(self.UTC, other)]
-            else:
-                newUTC = [utc - other for utc in self.UTC]
-            newobj = Ticktock(newUTC, 'UTC')
-        else:
-            raise TypeError("unsupported operand type(s) for -: {0} and {1}".format(type(other), type(self)))
-        return newobj
+        return self._shifted(other, '-')
 
     # -----------------------------------------------
     def __add__(self, other):
         """
         a.__add__(other)
 
-        Will be called if an iterable of datetime.timedeltas is added to this instance and
+        Will be called if a time interval is added to this instance and
         returns a new Ticktock instance
 
+        The addition is performed on TAI, i.e. in elapsed SI seconds
+        including any leap seconds. The interval is converted exactly
+        to integer nanoseconds before addition.
+
+        .. versionchanged:: 0.2.3
+           Accepts `numpy.timedelta64` and seconds as well as
+           `datetime.timedelta`; addition is on TAI, and the result
+           has dtype TAI.
+
         Parameters
         ==========
-        other : datetime.timedelta
-            instance for comparison
+        other : datetime.timedelta, numpy.timedelta64 or float
+            Time interval (float and int are seconds), scalar or
+            sequence of same length as this Ticktock.
 
         Examples
         ========
         >>> a = Ticktock('2002-02-02T12:00:00', 'ISO')
         >>> import datetime as dt
         >>> delt = dt.timedelta(minutes=1)
-        >>> a + delt
-        Ticktock( ['2002-02-02T12:01:00'] , dtype=ISO)
+        >>> (a + delt).ISO
+        ['2002-02-02T12:01:00']
+        >>> (a + numpy.array([0.5, 90])).UTC
+        [datetime.datetime(2002, 2, 2, 12, 0, 0, 500000),
+         datetime.datetime(2002, 2, 2, 12, 1, 30)]
 
         See Also
         ========
         __sub__
 
         """
-        if isinstance(other, datetime.timedelta):
-            newobj = Ticktock(self.UTC + other, 'UTC')
-        elif hasattr(other, '__iter__'):
-            if not isinstance(other[0], datetime.timedelta):
-                raise TypeError("Data supplied for addition is of the wrong type")
-            if not (len(other) == len(self.data)) or (len(other) == 1):
-                raise TypeError("Data supplied for addition is of the wrong shape")
-            same = True
-            if len(other) == 1: same = False
-            if same:
-                newUTC = [utc + o for utc, o in zip(self.UTC, other)]
-            else:
-                newUTC = [utc + other for utc in self.UTC]
-            newobj = Ticktock(newUTC, 'UTC')
-        else:
-            raise TypeError("unsupported operand type(s) for +: {0} and {1}".format(type(other), type(self)))
+        return self._shifted(other, '+')
 
-        return newobj
+    def _shifted(self, other, op):
+        """Add or subtract a time interval on TAI
+
+        Parameters
+        ==========
+        other : datetime.timedelta, numpy.timedelta64 or float
+            Time interval, scalar or sequence.
+        op : str
+            '+' to add, '-' to subtract
+
+        Returns
+        =======
+        out : Ticktock
+            New Ticktock, dtype TAI, with no other representations
+            calculated.
+        """
+        if isinstance(other, (Ticktock, datetime.datetime, str, bytes)):
+            raise TypeError("unsupported operand type(s) for {0}: {1} and {2}"
+                            .format(op, type(self), type(other)))
+        try:
+            ns, bad = _delta_to_ns(other)
+        except TypeError:
+            if np.ndim(other):
+                raise TypeError("Data supplied for addition is of the wrong type")
+            raise TypeError("unsupported operand type(s) for {0}: {1} and {2}"
+                            .format(op, type(self), type(other)))
+        if ns.ndim > 1 or (ns.ndim == 1 and len(ns) != len(self)):
+            raise TypeError("Data supplied for addition is of the wrong shape")
+        tai = np.asarray(self.TAI, dtype=np.float64)
+        # Keep whole seconds exact (they are exact in float) so the
+        # only rounding is the final sum.
+        whole = np.floor(tai)
+        if op == '-':
+            ns = -ns
+        sec, nsec = ns // 1000000000, ns % 1000000000
+        newtai = (whole + sec) + ((tai - whole) + nsec * 1e-9)
+        if bad.any():
+            newtai = np.where(bad, np.nan, newtai)
+        return Ticktock(newtai, 'TAI')
 
     def __radd__(self, other):
         """
@@ -725,7 +820,8 @@ class Ticktock(MutableSequence):
         ==========
             name : string
                 a string from the list of time systems
-                    'UTC', 'TAI', 'ISO', 'JD', 'MJD', 'UNX', 'RDT', 'CDF', 'DOY', 'eDOY', 'leaps'
+                    'UTC', 'TAI', 'ISO', 'JD', 'MJD', 'UNX', 'RDT', 'CDF', 'DT64',
+                    'DOY', 'eDOY', 'leaps'
         Returns
         ========
             out: list, array
@@ -736,6 +832,14 @@ class Ticktock(MutableSequence):
         if name not in Ticktock._keylist:
             raise AttributeError("data type {} not provided, only {}".format(
                 str(name), str(Ticktock._keylist)))
+        # Calculated on the Ticktock this was sliced from, so just index
+        sliced = self.__dict__.get('_sliced', {})
+        if name in sliced:
+            val, idxs = sliced.pop(name)
+            for idx in idxs:
+                val = val[idx]
+            setattr(self, name, val)
+            return val
         if name.upper() == 'TAI': self.TAI = self.getTAI()
         if name.upper() == 'UTC': self.UTC = self.getUTC()
         if name.upper() == 'ISO': self.ISO = self.getISO()
@@ -748,6 +852,7 @@ class Ticktock(MutableSequence):
         if name.upper() == 'EDOY': self.eDOY = self.geteDOY()
         if name.upper() == 'GPS': self.GPS = self.getGPS()
         if name.upper() == 'APT': self.APT = self.getAPT()
+        if name.upper() == 'DT64': self.DT64 = self.getDT64()
         # if name == 'isoformat': self.__isofmt = self.isoformat()
         if name == 'leaps': self.leaps = self.getleapsecs()
         return getattr(self, name)
@@ -774,10 +879,15 @@ class Ticktock(MutableSequence):
             dum = Ticktock(val)
         else:
             dum = Ticktock(val, dtype=dtype)
-        ival = getattr(dum, fmt)
-        self.data = np.insert(self.data, idx, ival)
-
-        self.update_items('data')
+        dum._isofmt = self._isofmt
+        # Use input directly if possible, so matches other representations
+        ival = dum.data if dum.data.attrs['dtype'] == fmt \
+               else getattr(dum, fmt)
+        olddata = self.data
+        self.data = _insert_promoted(self.data, idx, ival)
+        # Calculate only the new values of existing representations
+        self._update_cached(olddata, lambda key, val: _insert_promoted(
+            val, idx, getattr(dum, key)))
 
     # -----------------------------------------------
     def remove(self, idx):
@@ -806,8 +916,9 @@ class Ticktock(MutableSequence):
         argsort, numpy.argsort
         """
         idx = self.argsort(kind=kind)
+        olddata = self.data
         self.data = self.data[idx]
-        self.update_items('data')
+        self._update_cached(olddata, lambda key, val: val[idx])
 
     # -----------------------------------------------
     def argsort(self, kind='quicksort'):
@@ -867,6 +978,10 @@ class Ticktock(MutableSequence):
         this function will update all other attributes. This function is
         called automatically in __add__, __init__, and __setitem__.
 
+        .. versionchanged:: 0.2.3
+            Other attributes are no longer recalculated immediately; they
+            are discarded and recalculated when next accessed.
+
         Parameters
         ==========
         attrib : str
@@ -886,7 +1001,6 @@ class Ticktock(MutableSequence):
         spacepy.Ticktock.__add__
         spacepy.Ticktock.__sub__
         """
-        keylist = dir(self)
         # Formerly took arguments (cls, attrib) but there's nothing from
         # the class we can't get from the instance, so removed cls.
         # If we got two position arguments, though, that indicates the cls
@@ -896,46 +1010,88 @@ class Ticktock(MutableSequence):
                 'cls argument of update_items was deprecated in 0.2.2'
                 ' and will be ignored.',
                 DeprecationWarning)
-        keylist.remove('data')
         if attrib != 'data':
-            keylist.remove(attrib)
-            attrib = attrib.upper()
-            if attrib != self.data.attrs['dtype']:
+            if attrib.upper() != self.data.attrs['dtype']:
                 # Repopulating based on a different dtype, so make a temp
                 # Ticktock to do the conversion.
                 cls = type(self)
                 dt = self.data.attrs['dtype']
                 self.data = getattr(
                     cls(getattr(self, attrib), dtype=attrib), dt)
-        if self.data.attrs['dtype'] in (
-                'TAI', 'GPS', 'JD', 'MJD', 'RDT', 'CDF', 'UNX', 'ISO', 'APT'):
-            if self.data.attrs['dtype'] == 'ISO':
-                if 'UTC' in keylist:
-                    del self.UTC # Force recalc of UTC in TAI calc
-                if 'ISO' in keylist:
-                    del self.ISO # Also will recalc the ISO
-                    del keylist[keylist.index('ISO')] # So no need to calc again
-            self.TAI = self.getTAI()
-            if 'UTC' in keylist and self.data.attrs['dtype'] != 'ISO':
-                self.UTC = self.getUTC()
-        else:
-            self.UTC = self.getUTC()
-            if 'TAI' in keylist:
-                self.TAI = self.getTAI()
-        for key in keylist:
-            if key.upper() == 'ISO': self.ISO = self.getISO()
-            if key.upper() == 'JD': self.JD = self.getJD()
-            if key.upper() == 'MJD': self.MJD = self.getMJD()
-            if key.upper() == 'UNX': self.UNX = self.getUNX()
-            if key.upper() == 'RDT': self.RDT = self.getRDT()
-            if key.upper() == 'CDF': self.CDF = self.getCDF()
-            if key.upper() == 'DOY': self.DOY = self.getDOY()
-            if key.upper() == 'EDOY': self.eDOY = self.geteDOY()
-            if key.upper() == 'GPS': self.GPS = self.getGPS()
-            if key.upper() == 'APT': self.APT = self.getAPT()
-            if key == 'leaps': self.leaps = self.getleapsecs()
+        # Everything else is stale; __getattr__ recalculates on next access.
+        for key in self._cached_keys():
+            if key != attrib:
+                delattr(self, key)
+        self.__dict__.pop('_sliced', None)
 
-        return
+    # -----------------------------------------------
+    def _cached_keys(self):
+        """
+        Names of all time representations currently calculated
+
+        Returns
+        =======
+        out : list of str
+            Time representations (from the ``_keylist``) which are
+            attributes of this instance.
+        """
+        return [key for key in self._keylist if key in self.__dict__]
+
+    # -----------------------------------------------
+    def _sliced_cached(self, idx):
+        """
+        Representations to share with a Ticktock indexed from this one
+
+        Parameters
+        ==========
+        idx : slice or sequence of int or bool
+            Index of this Ticktock being taken.
+
+        Returns
+        =======
+        out : dict
+            Keyed by name of each representation calculated here (or
+            shared with this Ticktock and not yet indexed), except
+            ``data``. Values are the representation and the sequence of
+            indices to apply to it, in order, when accessed.
+        """
+        data = self.__dict__.get('data')
+        sliced = {key: (self.__dict__[key], (idx,))
+                  for key in self._cached_keys()
+                  if self.__dict__[key] is not data}
+        for key, (val, idxs) in self.__dict__.get('_sliced', {}).items():
+            sliced.setdefault(key, (val, idxs + (idx,)))
+        return sliced
+
+    # -----------------------------------------------
+    def _update_cached(self, olddata, func):
+        """
+        Apply an operation to all currently-calculated time representations
+
+        Used when changing ``data`` in a way that can be applied directly
+        to the other representations (e.g. deleting or reordering
+        records), so they need not be recalculated. Call after updating
+        ``data``.
+
+        Parameters
+        ==========
+        olddata : array
+            Value of ``data`` before the update. Representations which
+            are ``olddata`` are discarded, since they are recalculated
+            from ``data`` when next accessed.
+        func : callable
+            Called with name and current value of each representation,
+            returns the new value.
+        """
+        # Representations from slicing are not kept, to keep this simple
+        self.__dict__.pop('_sliced', None)
+        for key in self._cached_keys():
+            val = self.__dict__[key]
+            # AstroPy times aren't numpy arrays; just recalculate
+            if val is olddata or key == 'APT':
+                delattr(self, key)
+            else:
+                setattr(self, key, func(key, val))
 
     # -----------------------------------------------
     def convert(self, dtype):
@@ -984,8 +1140,77 @@ class Ticktock(MutableSequence):
         other : Ticktock
             other (Ticktock instance)
         """
-        otherdata = getattr(other, self.data.attrs['dtype'])
-        return Ticktock(np.append(self.data, otherdata), dtype=self.data.attrs['dtype'])
+        fmt = self.data.attrs['dtype']
+        otherdata = getattr(other, fmt)
+        newobj = Ticktock(np.append(self.data, otherdata), dtype=fmt,
+                          isoformat=self._isofmt)
+        # Extend representations already calculated here, rather than
+        # recalculating for the whole combined Ticktock.
+        for key in self._cached_keys():
+            if key in (fmt, 'APT') \
+               or key == 'ISO' and other._isofmt != self._isofmt:
+                continue
+            setattr(newobj, key, _append_promoted(
+                self.__dict__[key], getattr(other, key)))
+        return newobj
+
+    # -----------------------------------------------
+    @classmethod
+    def concatenate(cls, ticks):
+        """
+        Join a sequence of Ticktocks into one
+
+        Time representations which have been calculated for every input
+        Ticktock are joined, rather than being recalculated for the result.
+
+        .. versionadded:: 0.2.3
+
+        Parameters
+        ==========
+        ticks : sequence of Ticktock
+            Ticktocks to join, in order.
+
+        Returns
+        =======
+        out : Ticktock
+            Ticktock with all times from `ticks`, with the dtype and ISO
+            format of the first one.
+
+        Examples
+        ========
+        >>> a = Ticktock(['2002-02-02T12:00:00', '2002-02-02T13:00:00'])
+        >>> b = Ticktock(1391342432., 'TAI')
+        >>> Ticktock.concatenate([a, b]).ISO
+        dmarray(['2002-02-02T12:00:00', '2002-02-02T13:00:00',
+                 '2002-02-02T12:00:00'], dtype='<U19')
+
+        See Also
+        ========
+        append
+        """
+        ticks = list(ticks)
+        if not ticks:
+            raise ValueError('Need at least one Ticktock to concatenate.')
+        first = ticks[0]
+        fmt = first.data.attrs['dtype']
+        data = [t.data if t.data.attrs['dtype'] == fmt else getattr(t, fmt)
+                for t in ticks]
+        if fmt == 'APT':
+            data = astropy.time.Time(data)
+        else:
+            data = np.concatenate([np.asarray(d) for d in data])
+        newobj = Ticktock(data, dtype=fmt, isoformat=first._isofmt)
+        # Join representations that every input has already.
+        for key in first._keylist:
+            if key in (fmt, 'APT') or key in newobj.__dict__ \
+               or key == 'ISO' and any(t._isofmt != first._isofmt
+                                       for t in ticks):
+                continue
+            if all(key in t.__dict__ or key in t.__dict__.get('_sliced', {})
+                   for t in ticks):
+                setattr(newobj, key, functools.reduce(
+                    _append_promoted, [getattr(t, key) for t in ticks]))
+        return newobj
 
     # -----------------------------------------------
     def getCDF(self):
@@ -1048,7 +1273,7 @@ class Ticktock(MutableSequence):
 
         extract DOY (days since January 1st of given year)
 
-        Always recalculates from the current value of ``UTC``, which will
+        Always recalculates from the current value of ``DT64``, which will
         be created if necessary.
 
         Updates the ``DOY`` attribute.
@@ -1077,8 +1302,10 @@ class Ticktock(MutableSequence):
         geteDOY
         getAPT
         """
-        DOY = [utc.toordinal() - datetime.date(utc.year, 1, 1).toordinal() + 1 for utc in self.UTC]
-        self.DOY = spacepy.datamodel.dmarray(DOY, attrs={'dtype': 'DOY'}).astype(int)
+        day = np.asarray(self.DT64).astype('datetime64[D]')
+        yearstart = day.astype('datetime64[Y]').astype('datetime64[D]')
+        DOY = (day - yearstart).astype(int) + 1
+        self.DOY = spacepy.datamodel.dmarray(DOY, attrs={'dtype': 'DOY'})
         return self.DOY
 
     # -----------------------------------------------
@@ -1088,7 +1315,7 @@ class Ticktock(MutableSequence):
 
         extract eDOY (elapsed days since midnight January 1st of given year)
 
-        Always recalculates from the current value of ``UTC``, which will
+        Always recalculates from the current value of ``DT64``, which will
         be created if necessary.
 
         Updates the ``eDOY`` attribute.
@@ -1117,11 +1344,9 @@ class Ticktock(MutableSequence):
         geteDOY
         getAPT
         """
-
-        eDOY = [utc.toordinal() - datetime.date(utc.year, 1, 1).toordinal() for utc in self.UTC]
-        eDOY = [edoy + utc.hour / 24. + utc.minute / 1440. + utc.second / 86400. + utc.microsecond / 86400000000.
-                for edoy, utc in zip(eDOY, self.UTC)]
-
+        dt64 = np.asarray(self.DT64)
+        yearstart = dt64.astype('datetime64[Y]').astype('datetime64[D]')
+        eDOY = (dt64 - yearstart) / np.timedelta64(1, 'D')
         self.eDOY = spacepy.datamodel.dmarray(eDOY, attrs={'dtype': 'eDOY'})
         return self.eDOY
 
@@ -1338,7 +1563,7 @@ class Ticktock(MutableSequence):
 
             1. If ``data`` was provided in UTC, returns ``data``.
             2. Else recalculates directly from ``data`` if it was
-               provided in ISO.
+               provided in ISO or DT64.
             3. Else calculates from current value of ``TAI``, which
                will be created if necessary. (``data`` is TAI, GPS,
                JD, MJD, RDT, CDF, UNX)).
@@ -1361,38 +1586,22 @@ class Ticktock(MutableSequence):
         getISO, getUNX, getRDT, getJD, getMJD, getCDF, getTAI, getDOY, geteDOY,
         getAPT
         """
-        nTAI = len(self.data)
-
         # if already UTC, we are done, no conversion
         if self.data.attrs['dtype'].upper() == 'UTC':
             UTC = self.data
 
         elif self.data.attrs['dtype'].upper() == 'ISO':
-            self.ISO = self.data
-            _, UTC, _ = dtstr2iso(self.data, fmt=self._isofmt)
+            isoout, UTC, _ = dtstr2iso(self.data, fmt=self._isofmt)
+            if 'ISO' not in self.__dict__:
+                self.ISO = spacepy.datamodel.dmarray(
+                    isoout, attrs={'dtype': 'ISO'})
+
+        elif self.data.attrs['dtype'].upper() == 'DT64':
+            UTC = np.asarray(self.data).astype('datetime64[us]').astype(object)
 
         elif self.data.attrs['dtype'].upper() in (
                 'TAI', 'GPS', 'JD', 'MJD', 'RDT', 'CDF', 'UNX', 'APT'):
-            TAI0 = datetime.datetime(1958, 1, 1, 0, 0, 0, 0)
-            UTC = [datetime.timedelta(
-                # Before 1582-10-15, UTC 10 days earlier than naive conversion
-                # since those dates are Julian not Gregorian.
-                seconds=float(tait - (864000 if tait < -11840601600.0 else 0)))
-                   + TAI0 for tait in self.TAI]
-            for i in np.arange(nTAI):
-                # This is the index of number of seconds to subtract from
-                # "naive" UTC, not just TAI - UTC.
-                # TAI of leap second does not have a new TAI - UTC, this
-                # is because UTC seconds = 60, but need to subtract off
-                # one more to make the UTC seconds = 59 in that case, thus
-                # "flip" to next leap second count 1s earlier.
-                idx = np.searchsorted(TAIleaps, self.TAI[i], side='right') - 1
-                UTC[i] = UTC[i] - datetime.timedelta(seconds=secs[idx]
-                                                          if idx > 0 else 0)
-                if int(self.TAI[i]) == TAIleaps[idx]:
-                    # TAI is in leap second
-                    UTC[i] = UTC[i].replace(
-                        second=59, microsecond=999999)
+            UTC = _tai_to_datetime64(self.TAI).astype(object)
 
         else:
             warnstr1 = 'Input data type {0} does not support calculation of UTC times'.format(self.data.attrs['dtype'])
@@ -1491,6 +1700,63 @@ class Ticktock(MutableSequence):
         self.APT.attrs = {'dtype': 'APT'}
         return self.APT
 
+    # -----------------------------------------------
+    def getDT64(self):
+        """
+        a.DT64 or a.getDT64()
+
+        Return UTC as :class:`numpy.datetime64`.
+
+        This is the same time as ``UTC`` (and, like ``UTC``, cannot
+        represent leap seconds), but as a numpy array of fixed-size
+        values instead of an array of Python objects. It is much more
+        compact and can be used in vectorized calculations.
+
+        Return value comes from (in priority order):
+
+            1. If ``data`` was provided in DT64, returns ``data``.
+            2. Else calculates from current value of ``UTC`` if ``data``
+               was provided in UTC or ISO (or a function), which will be
+               created if necessary.
+            3. Else calculates from current value of ``TAI``, which
+               will be created if necessary.
+
+        Updates the ``DT64`` attribute.
+
+        Returns
+        ========
+            out : numpy array
+                UTC as ``datetime64[us]``. Times within a leap second
+                are represented as the last microsecond of the previous
+                second.
+
+        Notes
+        =====
+        .. versionadded:: 0.2.3
+
+        Examples
+        ========
+        >>> a = Ticktock('2002-02-02T12:00:00', 'ISO')
+        >>> a.DT64
+        dmarray(['2002-02-02T12:00:00.000000'], dtype='datetime64[us]')
+
+        See Also
+        =========
+        getUTC, getUNX, getRDT, getJD, getMJD, getCDF, getISO, getDOY, geteDOY,
+        getAPT
+        """
+        if self.data.attrs['dtype'] == 'DT64':
+            # This should be the case from the constructor
+            self.DT64 = self.data
+            return self.DT64
+        if self.data.attrs['dtype'] in (
+                'TAI', 'GPS', 'JD', 'MJD', 'RDT', 'CDF', 'UNX', 'APT'):
+            dt64 = _tai_to_datetime64(self.TAI)
+        else:
+            dt64 = np.asarray(self.UTC, dtype='datetime64[us]')
+        self.DT64 = spacepy.datamodel.dmarray(dt64, attrs={'dtype': 'DT64'})
+        return self.DT64
+
     # -----------------------------------------------
     def getTAI(self):
         """
@@ -1509,7 +1775,7 @@ class Ticktock(MutableSequence):
             1. If ``data`` was provided in TAI, returns ``data``.
             2. Else recalculates directly from ``data`` if it was
                provided in APT, CDF, GPS, ISO, JD, MJD, RDT, or UNX.
-            3. Else calculates from current value of ``UTC``, which
+            3. Else calculates from current value of ``DT64``, which
                will be created if necessary.
 
         Updates the ``TAI`` attribute; will also create the ``UTC``
@@ -1599,21 +1865,21 @@ class Ticktock(MutableSequence):
             if 'ISO' not in dir(self):
                 self.ISO = spacepy.datamodel.dmarray(
                     isoout, attrs={'dtype': 'ISO'})
+            dt64 = np.asarray(UTC, dtype='datetime64[us]')
         else:
-            UTC = self.UTC
+            dt64 = np.asarray(self.DT64)
             offset = None
-
-        TAI0 = datetime.datetime(1958, 1, 1, 0, 0, 0, 0)
+        if np.datetime_data(dt64.dtype)[0] not in ('ns', 'ps', 'fs', 'as'):
+            dt64 = dt64.astype('datetime64[us]')
 
         leapsec = self.getleapsecs()
-        TAItup = [utc - TAI0 + datetime.timedelta(seconds=int(ls)) for utc, ls in zip(UTC, leapsec)]
+        # Keep whole seconds and fraction separate until the end
+        onesec = np.timedelta64(1, 's')
+        delta = dt64 - np.datetime64('1958-01-01T00:00:00')
+        fracdelta = delta % onesec
         if offset is not None:
-            TAI = [tai.days * 86400 + tai.seconds
-                   + (tai.microseconds + offset[i])/ 1.e6
-                   for i, tai in enumerate(TAItup)]
-        else:
-            TAI = [tai.days * 86400 + tai.seconds + tai.microseconds / 1.e6
-                   for tai in TAItup]
+            fracdelta = fracdelta + offset.astype('timedelta64[us]')
+        TAI = (delta // onesec + leapsec) + fracdelta / onesec
 
         TAI = spacepy.datamodel.dmarray(TAI, attrs={'dtype': 'TAI'})
         # 1582-10-5 through 1582-10-14 do not exist, so anything
@@ -1630,7 +1896,7 @@ class Ticktock(MutableSequence):
 
         convert dtype data into ISO string
 
-        Always recalculates from the current value of ``UTC``, which
+        Always recalculates from the current value of ``DT64``, which
         will be created if necessary. Applies leapsecond correction
         based on ``TAI``, also created as necessary.
 
@@ -1657,23 +1923,21 @@ class Ticktock(MutableSequence):
                 dtstr2iso(self.data, fmt=self._isofmt)[0],
                 attrs={'dtype': 'ISO'})
             return self.ISO
-        nTAI = len(self.data)
         self.TAI = self.getTAI()
-        try:
-            iso = [utc.strftime(self._isofmt) for utc in self.UTC]
-        except ValueError: # Python before 3.3 fails on strftime before 1900.
-            iso = [utc.replace(year=1900).strftime(
-                self._isofmt.replace('%Y', str(utc.year))) for utc in self.UTC]
+        dt64 = np.asarray(self.DT64)
+        iso = _datetime64_to_iso(dt64, self._isofmt)
         self.ISO = spacepy.datamodel.dmarray(iso, attrs={'dtype': 'ISO'})
-        for i in range(nTAI):
-            if int(self.TAI[i]) in TAIleaps:
-                # UTC is 23:59:59.9999, get correct number of microseconds
-                tmpdt = self.UTC[i].replace(
-                    microsecond=int((self.TAI[i] % 1) * 1e6))
-                # And fudge the second
-                a, b, c = tmpdt.strftime(self._isofmt).split(':')
-                cnew = c.replace('59', '60')
-                self.ISO[i] = a + ':' + b + ':' + cnew
+        # Only the (few) times in a leap second need fixing up
+        leapidx = np.nonzero(np.isin(np.trunc(self.TAI),
+                                     _leaptable['leapTAI']))[0]
+        for i in leapidx:
+            # UTC is 23:59:59.9999, get correct number of microseconds
+            tmpdt = dt64[i].astype('datetime64[us]').astype(object).replace(
+                microsecond=int((self.TAI[i] % 1) * 1e6))
+            # And fudge the second
+            a, b, c = tmpdt.strftime(self._isofmt).split(':')
+            cnew = c.replace('59', '60')
+            self.ISO[i] = a + ':' + b + ':' + cnew
 
         return self.ISO
 
@@ -1685,7 +1949,7 @@ class Ticktock(MutableSequence):
         retrieve leapseconds from lookup table, used in getTAI
 
         Always recalculates from current value of ``TAI`` if ``data``
-        is dtype ``TAI``, otherwise from the current value of ``UTC``,
+        is dtype ``TAI``, otherwise from the current value of ``DT64``,
         which will be created if necessary.
 
         Updates the ``leaps`` attribute.
@@ -1706,51 +1970,167 @@ class Ticktock(MutableSequence):
         getTAI
 
         """
-        if self.data.attrs['dtype'] == 'TAI':
-            # TAIleaps contains the TAI which IS the leap second.
-            # The leap second count increments in the NEXT second.
-            # (TAI - UTC changes at end of leap second.)
-            # So find the latest index where the TAI-after-leap-second
-            # is less than current TAI (i.e. we are not after leap second yet).
-            idx = np.searchsorted(TAIleaps + 1, self.data, side='right') - 1
-            return secs[idx]
-        tup = self.UTC
-
-        # check if array:
-        if isinstance(tup, datetime.datetime):  # not an array of objects
-            tup = [tup]
-            nTAI = 1
-            aflag = False
-        else:
-            nTAI = len(tup)
-            aflag = True
-
-        # convert them into a time tuple and find the correct leap seconds
+        dtype = self.data.attrs['dtype']
+        if dtype == 'TAI':
+            # The leap second count increments in the NEXT second after
+            # the leap second (TAI - UTC changes at end of leap second),
+            # which is what the table is keyed on.
+            return _leaptable['taiutc'][_leap_index(self.data, 'TAI')]
         self.TAIleaps = TAIleaps
-        leaps = [secs[0]] * nTAI
-        leap_dates = [datetime.datetime(int(y), int(m), int(d)) for
-                      y, m, d, s in zip(year, mon, day, secs)]
-        for i, itup in enumerate(tup):
-            ind = bisect.bisect_right(leap_dates, tup[i])
-            leaps[i] = secs[ind - 1] if ind > 0 else 0
-
-        ## ldatetime = datetime.datetime # avoid an expensive lookup below
-        ## for i, itup in enumerate(tup):
-        ##     for y,m,d,s in zip(year, mon, day, secs):
-        ##         if tup[i] >= ldatetime(int(y),int(m),int(d)):
-        ##             leaps[i] = s
-        ##         else:
-        ##             break
-
-        # if datetime.datetime(1971,12,31) > tup[0]:
-        #   print "WARNING: date before 1972/1/1; leap seconds are by fractions off"
-
-        if aflag == False:
-            self.leaps = int(leaps[0])
-            return int(leaps[0])  # if you want to allow fractional leap seconds, remove 'int' here
+        # Look up directly in the input time base if possible, otherwise UTC
+        if dtype in ('UNX', 'RDT', 'CDF'):
+            idx = _leap_index(np.require(self.data, dtype=np.float64), dtype)
         else:
-            self.leaps = np.array(leaps, dtype=int)
-            return self.leaps
+            idx = _leap_index(np.asarray(self.DT64).astype('datetime64[us]'),
+                              'DT64')
+        # if you want to allow fractional leap seconds, remove 'int' here
+        self.leaps = _leaptable['taiutc'][idx].astype(int)
+        return self.leaps
+
+    # -----------------------------------------------
+    @classmethod
+    def from_components(cls, year, month=1, day=1, hour=0, minute=0,
+                        second=0, microsecond=0):
+        """
+        Create Ticktock from arrays of date and time components
+
+        The components are combined as arrays, without making a
+        :class:`~datetime.datetime` for each time, so this is much
+        faster than e.g. ``Ticktock([datetime.datetime(*v) for v in tm])``.
+
+        .. versionadded:: 0.2.3
+
+        Parameters
+        ==========
+        year : array of int
+            Year
+        month : array of int, optional
+            Month, January is 1 (default 1)
+        day : array of int, optional
+            Day of month (default 1)
+        hour : array of int, optional
+            Hour (default 0)
+        minute : array of int, optional
+            Minute (default 0)
+        second : array of int or float, optional
+            Second, including fraction if desired; rounded to microseconds.
+            Second 60 is a leap second. (default 0)
+        microsecond : array of int, optional
+            Microsecond, added to `second` (default 0)
+
+        All components are broadcast against each other.
+
+        Returns
+        =======
+        out : Ticktock
+            Ticktock of the specified times, with dtype ``DT64``; if any
+            time is in a leap second, the dtype is ``TAI`` so that the leap
+            second is represented.
+
+        Raises
+        ======
+        ValueError : if any component is out of range, or a leap second
+            is specified that is not in the leap second table.
+
+        Examples
+        ========
+        >>> a = Ticktock.from_components([2002, 2002], 2, 2, [12, 13])
+        >>> a.ISO
+        dmarray(['2002-02-02T12:00:00', '2002-02-02T13:00:00'], dtype='<U19')
+
+        See Also
+        ========
+        from_doy
+        """
+        year, month, day, hour, minute, second, microsecond = [
+            np.atleast_1d(v).ravel() for v in np.broadcast_arrays(
+                year, month, day, hour, minute, second, microsecond)]
+        if ((month < 1) | (month > 12)).any():
+            raise ValueError('month must be in 1..12')
+        monthstart = ((year.astype(np.int64) - 1970) * 12
+                      + month.astype(np.int64) - 1).astype('datetime64[M]')
+        monthlen = ((monthstart + 1).astype('datetime64[D]')
+                    - monthstart.astype('datetime64[D]')).astype(np.int64)
+        usec = np.round(np.require(second, dtype=np.float64) * 1e6).astype(
+            np.int64) + microsecond.astype(np.int64)
+        if ((day < 1) | (day > monthlen)).any():
+            raise ValueError('day is out of range for month')
+        if ((hour < 0) | (hour > 23) | (minute < 0) | (minute > 59)).any():
+            raise ValueError('hour must be in 0..23 and minute in 0..59')
+        if ((usec < 0) | (usec >= 61000000)).any():
+            raise ValueError('second must be in 0..60')
+        # Leap seconds are represented as the last second of the minute
+        # until converted to TAI.
+        inleap = usec >= 60000000
+        usec[inleap] -= 1000000
+        usec += ((((day.astype(np.int64) - 1) * 24 + hour) * 60 + minute)
+                 * 60000000)
+        dt64 = monthstart.astype('datetime64[us]') \
+               + usec.astype('timedelta64[us]')
+        if not inleap.any():
+            return Ticktock(dt64, 'DT64')
+        # The second after each leap second must be when TAI - UTC changes.
+        after = dt64[inleap].astype('datetime64[s]') + np.timedelta64(1, 's')
+        bad = ~np.isin(after, _leaptable['DT64'][1:])
+        if bad.any():
+            iso = np.datetime_as_string(dt64[inleap][bad][0])
+            raise ValueError('{}60{} is not a valid leapsecond.'.format(
+                iso[:17], iso[19:]))
+        tai = np.asarray(Ticktock(dt64, 'DT64').TAI) + inleap
+        return Ticktock(tai, 'TAI')
+
+    # -----------------------------------------------
+    @classmethod
+    def from_doy(cls, year, doy):
+        """
+        Create Ticktock from arrays of year and day of year
+
+        As with :meth:`from_components`, no
+        :class:`~datetime.datetime` is made for each time.
+
+        .. versionadded:: 0.2.3
+
+        Parameters
+        ==========
+        year : array of int
+            Year
+        doy : array of float
+            Day of year, with January 1 as day 1, including fraction of day
+            if desired; rounded to microseconds. Elapsed days since the
+            start of the year (as in :meth:`geteDOY`) are ``doy - 1``.
+
+        `year` and `doy` are broadcast against each other.
+
+        Returns
+        =======
+        out : Ticktock
+            Ticktock of the specified times, with dtype ``DT64``.
+
+        Raises
+        ======
+        ValueError : if `doy` is not within the year.
+
+        Examples
+        ========
+        >>> a = Ticktock.from_doy(2002, [33, 33.5])
+        >>> a.ISO
+        dmarray(['2002-02-02T00:00:00', '2002-02-02T12:00:00'], dtype='<U19')
+
+        See Also
+        ========
+        from_components
+        """
+        year, doy = [np.atleast_1d(v).ravel()
+                     for v in np.broadcast_arrays(year, doy)]
+        yearstart = (year.astype(np.int64) - 1970).astype('datetime64[Y]')
+        yearlen = ((yearstart + 1).astype('datetime64[D]')
+                   - yearstart.astype('datetime64[D]')).astype(np.int64)
+        doy = np.require(doy, dtype=np.float64)
+        if ((doy < 1) | (doy >= yearlen + 1)).any():
+            raise ValueError('day of year is out of range for year')
+        usec = np.round((doy - 1) * 86400e6).astype(np.int64)
+        return Ticktock(yearstart.astype('datetime64[us]')
+                   + usec.astype('timedelta64[us]'), 'DT64')
 
     # -----------------------------------------------
     @classmethod
@@ -1815,6 +2195,129 @@ class Ticktock(MutableSequence):
 # End of Ticktock class
 # -----------------------------------------------
 
+# -----------------------------------------------
+# RegularTicktock class
+# -----------------------------------------------
+class RegularTicktock(Ticktock):
+    """
+    RegularTicktock(start, step, count)
+
+    Ticktock of times evenly spaced in UTC
+
+    Only the first time, the step between times, and the number of times
+    are stored. ``data`` (as ``DT64``) and all other time representations
+    are calculated from these when accessed, without making a
+    :class:`~datetime.datetime` for each time unless ``UTC`` is
+    requested. Indexing with an int or slice makes another
+    RegularTicktock without calculating anything.
+
+    Once ``data`` has been changed (e.g. by :meth:`~Ticktock.insert` or
+    :meth:`~Ticktock.sort`) this behaves as a normal :class:`Ticktock`.
+
+    .. versionadded:: 0.2.3
+
+    Parameters
+    ==========
+    start : str, datetime, datetime64, or Ticktock
+        First time. Anything that makes a :class:`Ticktock` without
+        specifying dtype; only the first element of a Ticktock is used.
+    step : float, timedelta or timedelta64
+        Time between successive times; float is in days. Rounded to
+        microseconds.
+    count : int
+        Number of times.
+
+    Other Parameters
+    ================
+    isoformat : str, optional
+        Format for ``ISO`` output, as for :class:`Ticktock`.
+
+    Examples
+    ========
+    >>> import datetime
+    >>> import spacepy.time as spt
+    >>> ticks = spt.RegularTicktock('2002-02-01', datetime.timedelta(seconds=1),
+    ...                             86400 * 365)
+    >>> ticks[86400].ISO
+    dmarray(['2002-02-02T00:00:00'], dtype='<U19')
+
+    See Also
+    ========
+    tickrange
+    """
+    def __init__(self, start, step, count, isoformat=None):
+        self._isofmt = isoformat or self._isoformatstr['seconds']
+        if not isinstance(start, Ticktock):
+            start = Ticktock(start)
+        self._start = np.asarray(start.DT64)[0].astype('datetime64[us]')
+        if isinstance(step, datetime.timedelta):
+            step = np.timedelta64(step)
+        if isinstance(step, np.timedelta64):
+            self._step = step.astype('timedelta64[us]')
+        else:
+            self._step = np.timedelta64(int(round(step * 86400e6)), 'us')
+        self._count = int(count)
+        if self._count < 0:
+            raise ValueError('count must not be negative.')
+
+    def _isgrid(self):
+        """True if data is (or will be) the regular times"""
+        data = self.__dict__.get('data')
+        return data is None or data is self.__dict__.get('_griddata')
+
+    def __getattr__(self, name):
+        if name == 'data':
+            self.data = self._griddata = self.DT64
+            return self.data
+        return super(RegularTicktock, self).__getattr__(name)
+
+    def __getstate__(self):
+        odict = super(RegularTicktock, self).__getstate__()
+        # Can be recalculated, and keeping data in the pickle makes it
+        # harder to know if data is still regular. Same for every
+        # representation, so the pickle is only start, step, count.
+        if self._isgrid():
+            odict.pop('data', None)
+            odict.pop('_griddata', None)
+            for key in self._keylist:
+                odict.pop(key, None)
+        return odict
+
+    def __len__(self):
+        return self._count if self._isgrid() else len(self.data)
+
+    def __getitem__(self, idx):
+        if not self._isgrid() or not isinstance(idx, (int, np.integer, slice)):
+            return super(RegularTicktock, self).__getitem__(idx)
+        if isinstance(idx, slice):
+            start, stop, stride = idx.indices(self._count)
+            count = len(range(start, stop, stride))
+        else:
+            if not -self._count <= idx < self._count:
+                raise IndexError(
+                    'index {} is out of bounds for Ticktock of length {}'
+                    .format(idx, self._count))
+            start, stride, count = idx % self._count, 1, 1
+            idx = slice(start, start + 1)
+        newobj = object.__new__(type(self))
+        newobj._isofmt = self._isofmt
+        newobj._start = self._start + self._step * start
+        newobj._step = self._step * stride
+        newobj._count = count
+        sliced = self._sliced_cached(idx)
+        if sliced:
+            newobj._sliced = sliced
+        return newobj
+
+    def getDT64(self):
+        if not self._isgrid():
+            return super(RegularTicktock, self).getDT64()
+        self.DT64 = spacepy.datamodel.dmarray(
+            self._start + self._step * np.arange(self._count),
+            attrs={'dtype': 'DT64'})
+        return self.DT64
+    getDT64.__doc__ = Ticktock.getDT64.__doc__
+
 def doy2date(year, doy, dtobj=False, flAns=False):
     """
     convert integer day-of-year doy into a month and day
@@ -1893,6 +2396,10 @@ def tickrange(start, end, deltadays, dtype=None):
     """
     return a Ticktock range given the start, end, and delta
 
+    .. versionchanged:: 0.2.3
+        Returns a :class:`RegularTicktock`, so times are calculated
+        only when needed. ``data`` is datetime64, not datetime.
+
     Parameters
     ==========
     start : string or number
@@ -1906,8 +2413,8 @@ def tickrange(start, end, deltadays, dtype=None):
 
     Returns
     =======
-    out : Ticktock instance
-        ticks
+    out : RegularTicktock instance
+        ticks, with dtype DT64
 
     Examples
     ========
@@ -1918,22 +2425,14 @@ def tickrange(start, end, deltadays, dtype=None):
 
     See Also
     ========
-    Ticktock
+    Ticktock, RegularTicktock
 
     """
     Tstart = Ticktock(start, dtype)
     Tend = Ticktock(end, dtype)
-    diff = Tend.UTC[0] - Tstart.UTC[0]
-    dmusec, dsec = diff.microseconds / 86400000000., diff.seconds / 86400.
-    if isinstance(deltadays, datetime.timedelta):
-        musec, sec = deltadays.microseconds / 86400000000., deltadays.seconds / 86400.
-        deltat = musec + sec + deltadays.days
-        nticks = int((dmusec + dsec + diff.days) / deltat + 1)
-        trange = [Tstart.UTC[0] + deltadays * n for n in range(nticks)]
-    else:
-        nticks = int((dmusec + dsec + diff.days) / float(deltadays) + 1)
-        trange = [Tstart.UTC[0] + datetime.timedelta(days=deltadays) * n for n in range(nticks)]
-    ticks = Ticktock(trange, 'UTC')
+    ticks = RegularTicktock(Tstart, deltadays, 0)
+    diff = np.asarray(Tend.DT64)[0] - ticks._start
+    ticks._count = max(int(diff // ticks._step) + 1, 0)
     return ticks
 
 
@@ -2001,40 +2500,54 @@ def dtstr2iso(dtstr, fmt='%Y-%m-%dT%H:%M:%S'):
             offset[i] = 1e6
     # Cut index of leap seconds down to real ones.
     leapidx = np.array(realleap)
-    # try a few special cases that are faster than dateutil.parser
-    strfmts = ['%Y-%m-%dT%H:%M:%S',
-               '%Y-%m-%dT%H:%M:%SZ',
-               '%Y-%m-%d',
-               '%Y%m%d',
-               '%Y%m%d %H:%M:%S']
-    if fmt not in strfmts:
-        strfmts.insert(0, fmt)
-    for strfmt in strfmts:
+    # Most input is the fixed ISO layout, which can be parsed for the
+    # whole array at once; try a few special cases that are faster than
+    # dateutil.parser for anything that isn't.
+    flat = dtstr.reshape(-1)
+    UTC = np.empty(flat.shape, dtype=object)
+    isostr = np.empty(flat.shape, dtype=object)
+    if fmt in ('%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%S.%f'):
+        dt64, good = _parse_iso_fixed(flat)
+    else: # Custom format takes priority over guessing
+        good = np.zeros(flat.shape, dtype=bool)
+    if good.any():
+        UTC[good] = dt64[good].astype(object)
+        isostr[good] = _datetime64_to_iso(dt64[good], fmt)
+    slowidx = np.nonzero(~good)[0]
+    if len(slowidx):
+        strfmts = ['%Y-%m-%dT%H:%M:%S',
+                   '%Y-%m-%dT%H:%M:%SZ',
+                   '%Y-%m-%d',
+                   '%Y%m%d',
+                   '%Y%m%d %H:%M:%S']
+        if fmt not in strfmts:
+            strfmts.insert(0, fmt)
+        for strfmt in strfmts:
+            try:
+                slowUTC = np.frompyfunc(
+                    lambda x: datetime.datetime.strptime(x, strfmt), 1, 1)(
+                        flat[slowidx])
+                break
+            except ValueError:
+                continue
+        else:
+            slowUTC = np.frompyfunc(dup.parse, 1, 1)(flat[slowidx])
+        UTC[slowidx] = slowUTC
         try:
-            UTC = np.frompyfunc(
-                lambda x: datetime.datetime.strptime(x, strfmt), 1, 1)(dtstr)
-            break
-        except ValueError:
-            continue
-    else:
-        UTC = np.frompyfunc(dup.parse, 1, 1)(dtstr)
-    otypes = ['S' if str is bytes else 'U']
-    try:
-        isostr = np.vectorize(lambda x: x.strftime(fmt), otypes=otypes)(UTC)
-    except ValueError: # Python before 3.3 fails on strftime before 1900.
-        isostr = np.vectorize(
-            lambda x: x.replace(year=1900).strftime(fmt.replace(
-                '%Y', str(x.year))), otypes=otypes)(UTC)
+            isostr[slowidx] = [x.strftime(fmt) for x in slowUTC]
+        except ValueError: # Python before 3.3 fails on strftime before 1900.
+            isostr[slowidx] = [
+                x.replace(year=1900).strftime(fmt.replace('%Y', str(x.year)))
+                for x in slowUTC]
+    isostr = isostr.astype('S' if str is bytes else 'U').reshape(dtstr.shape)
+    UTC = UTC.reshape(dtstr.shape)
+    if dtstr.shape == ():
+        UTC = UTC[()]
     # Check that leap seconds are actually valid
     if len(leapidx):
-        # Day that ends in leap second *entry* (may not be leap second)
-        # Unbelievably these are read as floats, and other places rely on that.
-        leapsecday = np.array([
-            datetime.date(int(y), int(m), int(d))- datetime.timedelta(days=1)
-            for y, m , d in zip(year, mon, day)])
-        # Find only those leap seconds that are really changes
-        idx = np.nonzero(np.diff(np.concatenate(([0], secs))))[0]
-        leapsecday = leapsecday[idx]
+        # Day that ends in each leap second
+        leapsecday = (_leaptable['DT64'][1:].astype('datetime64[D]')
+                      - np.timedelta64(1, 'D')).astype(object)
         if dtstr.shape == ():
             if UTC.date() not in leapsecday:
                 raise ValueError('{} is not a valid leapsecond.'.format(
@@ -2067,6 +2580,240 @@ def dtstr2iso(dtstr, fmt='%Y-%m-%dT%H:%M:%S'):
     return isostr, UTC, offset
 
 
+def _insert_promoted(arr, idx, values):
+    """Insert values into an array, promoting type if necessary
+
+    :func:`numpy.insert` casts the inserted values to the type of the
+    array, which e.g. can truncate strings. This promotes the array
+    to a type which can hold both.
+
+    Parameters
+    ==========
+    arr : array
+        Array to insert into
+    idx : int, slice or sequence of ints
+        Index or indices before which `values` is inserted.
+    values : array
+        Values to insert
+
+    Returns
+    =======
+    out : array
+        Copy of `arr` with `values` inserted, same class as `arr`.
+    """
+    values = np.asanyarray(values)
+    dtype = np.promote_types(arr.dtype, values.dtype)
+    return np.insert(arr.astype(dtype, copy=False), idx, values)
+
+
+def _append_promoted(arr, values):
+    """Append values to an array, promoting type if necessary
+
+    Parameters
+    ==========
+    arr : array
+        Array to append to
+    values : array
+        Values to append
+
+    Returns
+    =======
+    out : array
+        New array with `values` following `arr`, same class and attributes
+        as `arr`.
+    """
+    out = np.concatenate((arr, values))
+    if hasattr(arr, 'attrs'):
+        out = spacepy.datamodel.dmarray(out, attrs=copy.copy(arr.attrs))
+    return out
+
+
+def _delta_to_ns(delta):
+    """Convert a time interval to integer nanoseconds
+
+    Parameters
+    ==========
+    delta : datetime.timedelta, numpy.timedelta64, float or int
+        Time interval, scalar or sequence. Float and int are seconds.
+
+    Returns
+    =======
+    ns : array of int64
+        Interval in nanoseconds, same shape as input (0-d for scalar).
+        Zero where the input is not valid.
+    bad : array of bool
+        True where the input is NaN or NaT (not a time).
+
+    Raises
+    ======
+    TypeError : if `delta` is not an interval or number
+    """
+    if isinstance(delta, datetime.timedelta):
+        ns = ((delta.days * 86400 + delta.seconds) * 1000000000
+              + delta.microseconds * 1000)
+        return np.array(ns, dtype=np.int64), np.array(False)
+    delta = np.asarray(delta)
+    if delta.dtype == object: # e.g. sequence of timedelta
+        try:
+            delta = delta.astype('timedelta64[us]')
+        except (TypeError, ValueError):
+            raise TypeError('Cannot convert {0} to time interval'
+                            .format(delta.dtype))
+    if delta.dtype.kind == 'm':
+        # Calendar units aren't a fixed interval
+        if np.datetime_data(delta.dtype)[0] in ('Y', 'M', 'generic'):
+            raise TypeError('Cannot convert {0} to time interval'
+                            .format(delta.dtype))
+        ns = delta.astype('timedelta64[ns]').view(np.int64)
+        bad = ns == np.iinfo(np.int64).min
+        ns = np.where(bad, 0, ns)
+    elif delta.dtype.kind in 'iu':
+        ns = delta.astype(np.int64) * 1000000000
+        bad = np.zeros(delta.shape, dtype=bool)
+    elif delta.dtype.kind == 'f':
+        bad = ~np.isfinite(delta)
+        delta = np.where(bad, 0., delta)
+        whole = np.floor(delta)
+        ns = whole.astype(np.int64) * 1000000000 \
+             + np.round((delta - whole) * 1e9).astype(np.int64)
+    else:
+        raise TypeError('Cannot convert {0} to time interval'
+                        .format(delta.dtype))
+    return ns, bad
+
+
+def _parse_iso_fixed(dtstr):
+    """Parse fixed-layout ISO 8601 strings as datetime64
+
+    Handles ``YYYY-MM-DD``, optionally followed by ``T`` or a space and
+    ``hh:mm:ss``, optionally followed by ``.`` and one to six digits of
+    fractional seconds, and optionally a trailing ``Z``. Every string
+    is parsed at once from the character codes, without making a
+    Python object per element. Strings that do not match this layout
+    (or are not valid times, including leap seconds) are flagged so
+    they can be parsed some other way.
+
+    Parameters
+    ==========
+    dtstr : array of str
+        One-dimensional array of time strings, unicode or bytes.
+
+    Returns
+    =======
+    dt64 : array of datetime64
+        Parsed time with microsecond resolution, ``NaT`` where not parsed.
+    good : array of bool
+        True where `dtstr` was parsed.
+    """
+    dtstr = np.ascontiguousarray(dtstr)
+    n = len(dtstr)
+    dt64 = np.full((n,), np.datetime64('NaT'), dtype='datetime64[us]')
+    good = np.zeros((n,), dtype=bool)
+    if n == 0 or dtstr.dtype.kind not in 'US' or dtstr.dtype.itemsize == 0:
+        return dt64, good
+    codes = dtstr.view(np.uint32 if dtstr.dtype.kind == 'U' else np.uint8)
+    codes = codes.reshape((n, -1))
+    width = codes.shape[1]
+    length = np.char.str_len(dtstr)
+
+    def col(k):
+        """Character code in column k (0 if past the end of the string)"""
+        return codes[:, k] if k < width else np.zeros((n,), codes.dtype)
+
+    def isdigit(k):
+        c = col(k)
+        return (c >= 48) & (c <= 57)
+
+    def number(*cols):
+        """Integer value of the digits in cols"""
+        val = np.zeros((n,), dtype=np.int64)
+        for k in cols:
+            val = val * 10 + (col(k).astype(np.int64) - 48)
+        return val
+
+    # Length without trailing Z
+    hasz = (length >= 20) & (codes[np.arange(n), np.maximum(length - 1, 0)]
+                             == ord('Z'))
+    core = length - hasz
+    good[:] = (core == 10) | (core == 19) | ((core >= 21) & (core <= 26))
+    for k in (0, 1, 2, 3, 5, 6, 8, 9):
+        good &= isdigit(k)
+    good &= (col(4) == ord('-')) & (col(7) == ord('-'))
+    hastime = core >= 19
+    timeok = ((col(10) == ord('T')) | (col(10) == ord(' '))) \
+             & (col(13) == ord(':')) & (col(16) == ord(':'))
+    for k in (11, 12, 14, 15, 17, 18):
+        timeok &= isdigit(k)
+    good &= ~hastime | timeok
+    usec = np.zeros((n,), dtype=np.int64)
+    fracok = col(19) == ord('.')
+    for k in range(20, 26):
+        present = k < core
+        fracok &= ~present | isdigit(k)
+        usec += np.where(present, col(k).astype(np.int64) - 48, 0) \
+                * 10 ** (25 - k)
+    good &= (core < 21) | fracok
+    if not good.any():
+        return dt64, good
+    # Only use fields from rows with the right layout
+    year = np.where(good, number(0, 1, 2, 3), 1970)
+    month = np.where(good, number(5, 6), 1)
+    day = np.where(good, number(8, 9), 1)
+    hms = np.where(good & hastime, number(11, 12), 0), \
+          np.where(good & hastime, number(14, 15), 0), \
+          np.where(good & hastime, number(17, 18), 0)
+    good &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1) \
+            & (hms[0] < 24) & (hms[1] < 60) & (hms[2] < 60)
+    month = np.where(good, month, 1)
+    monthstart = ((year - 1970) * 12 + month - 1).astype('datetime64[M]')
+    good &= day <= ((monthstart + 1).astype('datetime64[D]')
+                    - monthstart.astype('datetime64[D]')).astype(np.int64)
+    us = (((day - 1) * 24 + hms[0]) * 60 + hms[1]) * 60 + hms[2]
+    us = us * 1000000 + usec
+    dt64[good] = monthstart[good].astype('datetime64[us]') \
+                 + us[good].astype('timedelta64[us]')
+    return dt64, good
+
+
+def _datetime64_to_iso(dt64, fmt):
+    """Format datetime64 as strings
+
+    The two standard Ticktock ISO formats are done in numpy; any other
+    format is done by :meth:`~datetime.datetime.strftime`. No leap second
+    handling is done.
+
+    Parameters
+    ==========
+    dt64 : array of datetime64
+        Times to format
+    fmt : str
+        Format appropriate for :meth:`~datetime.datetime.strftime`
+
+    Returns
+    =======
+    array of str
+        Representation of `dt64` formatted according to `fmt`.
+    """
+    dt64 = np.asarray(dt64)
+    # numpy unit and string length for formats numpy can do
+    unit, width = {'%Y-%m-%dT%H:%M:%S': ('s', 19),
+                   '%Y-%m-%dT%H:%M:%S.%f': ('us', 26)}.get(fmt, (None, 0))
+    # numpy always uses four-digit years; strftime does not.
+    if unit is not None \
+       and (dt64 >= np.datetime64('1000-01-01')).all() \
+       and (dt64 < np.datetime64('10000-01-01')).all():
+        return np.datetime_as_string(
+            dt64.astype('datetime64[{}]'.format(unit)), unit=unit).astype(
+                'U{}'.format(width))
+    utc = dt64.astype('datetime64[us]').astype(object)
+    try:
+        iso = [u.strftime(fmt) for u in utc]
+    except ValueError: # Python before 3.3 fails on strftime before 1900.
+        iso = [u.replace(year=1900).strftime(
+            fmt.replace('%Y', str(u.year))) for u in utc]
+    return np.array(iso, dtype='U')
+
+
 def sec2hms(sec, rounding=True, days=False, dtobj=False):
     """Convert seconds of day to hours, minutes, seconds
 
@@ -2283,10 +3030,10 @@ def _read_leaps():
     """Read leapseconds in from spacepy tai-utc file
 
     Populates module-global variables with leapsecond information:
-    secs, year, mon, day, TAIleaps.
-    Called on first initialization of Ticktock.
+    secs, year, mon, day, TAIleaps, and the lookup table used by
+    :func:`_leap_index`. Called on import.
     """
-    global secs, year, mon, day, TAIleaps
+    global secs, year, mon, day, TAIleaps, _leaptable
     # load current file
     fname = os.path.join(spacepy.DOT_FLN, 'data', 'tai-utc.dat')
     mtime = datetime.datetime(*time.gmtime(os.path.getmtime(fname))[:6])
@@ -2321,13 +3068,14 @@ def _read_leaps():
             warnings.warn('Leapseconds may be out of date.'
                           ' Use spacepy.toolbox.update(leapsecs=True)')
 
-    TAIleaps = np.zeros(len(secs))
-    TAItup = [''] * len(secs)
-    TAI0 = datetime.datetime(1958, 1, 1, 0, 0, 0, 0)
-    for i in np.arange(len(secs)):
-        TAItup[i] = datetime.datetime(int(year[i]), int(mon[i]), int(day[i])) - TAI0 + datetime.timedelta(
-            seconds=int(secs[i]) - 1)
-        TAIleaps[i] = TAItup[i].days * 86400 + TAItup[i].seconds + TAItup[i].microseconds / 1.e6
+    # Date of each record, i.e. midnight after the leap second.
+    leapdate = ((year - 1970) * 12 + mon - 1).astype(np.int64).astype(
+        'datetime64[M]').astype('datetime64[D]') \
+        + (day - 1).astype(np.int64).astype('timedelta64[D]')
+    # TAI of the leap second itself: one second before TAI - UTC changes.
+    TAIleaps = (leapdate - np.datetime64('1958-01-01', 'D')).astype(
+        np.float64) * 86400 + secs - 1
+    _leaptable = _make_leap_table()
 
 
 def _days1958(tai, leaps='rubber', midnight=False):
@@ -2380,12 +3128,13 @@ def _days1958(tai, leaps='rubber', midnight=False):
     """
     off = 0. if midnight else 43200. # Offset from midnight
     # Shift to time-since-noon, if desired (also makes copy), call delta-TAI
-    dtai = np.require(tai, dtype=np.float64) - off
-    leap_dtai, taiutc = _changed_leaps()
-    leap_dtai -= off # delta-TAI of start of leap second
+    tai = np.require(tai, dtype=np.float64)
+    dtai = tai - off
+    taiutc = _leaptable['taiutc']
+    leap_dtai = _leaptable['leapTAI'] - off # delta-TAI of start of leap sec
     if leaps in ('rubber', 'drop'):
         # Index of leapsecond equal to or before each time record
-        lidx = np.searchsorted(leap_dtai, dtai, side='right') - 1
+        lidx = _leap_index(tai, 'leapTAI')
     elif leaps != 'continuous':
         raise ValueError('leaps handling {} not recognized.'.format(leaps))
     if leaps == 'rubber':
@@ -2492,13 +3241,13 @@ def _days1958totai(days, leaps='rubber', midnight=False):
         return days * 86400 + off
     elif leaps not in ('rubber', 'drop'):
         raise ValueError('leaps handling {} not recognized.'.format(leaps))
-    leap_tai, taiutc = _changed_leaps()
-    leap_dtai = leap_tai - off # delta-TAI of start of leap second
+    leap_tai, taiutc = _leaptable['leapTAI'], _leaptable['taiutc']
     # Days with leap second. Leap second is always late in day: end
-    # of day if doing midnight-to-midnight, halfway if noon-to-noon.
-    leap_day = np.floor((leap_dtai - taiutc) / 86400)
+    # of day if doing midnight-to-midnight, halfway if noon-to-noon,
+    # so this is the same day number either way.
+    leap_day = _leaptable['leapday']
     # Closest leapsecond-day before record.
-    ldidx = np.searchsorted(leap_day, days) - 1
+    ldidx = _leap_index(days, 'leapday', side='left')
     # All records that happen on leap second days.
     leap_sec_day = (ldidx > 0) \
                    & (leap_day[ldidx] <= days) \
@@ -2525,29 +3274,86 @@ def _days1958totai(days, leaps='rubber', midnight=False):
     return taiout
 
 
-def _changed_leaps():
-    """Find only those times where leap seconds actually changed
+def _make_leap_table():
+    """Build the leap second lookup table
 
     There are leap second records where there is no actual change
     in leap seconds, and there isn't a record for TAI-UTC == 0; this
-    adds a record (where the TAI of the leap second time is -inf) and
-    eliminated those with no actual change.
+    adds a record (where the time of the leap second is -inf) and
+    eliminates those with no actual change. The time of every change
+    is then precomputed in each time base, so times can be looked up
+    (see :func:`_leap_index`) without first converting to TAI.
 
     Returns
     =======
-    leap_tai : sequence of float
-        TAI of the start of every leap second.
-    taiutc : sequence of float
-        TAI - UTC at the end of the leap second.
+    dict of arrays
+        Read-only arrays, all indexed the same way. The value of TAI - UTC
+        after each change is ``taiutc`` and the size of the change is
+        ``dtaiutc``. ``leapTAI`` is the TAI of the start of the leap second
+        and ``leapday`` the day containing it (days since 1958-01-01).
+        The first time with the new TAI - UTC is in ``TAI``, ``naive``
+        (TAI without leap seconds, i.e. UTC seconds since 1958),
+        ``UNX``, ``RDT``, ``CDF`` (as for :class:`Ticktock`),
+        and ``DT64`` (microsecond resolution).
     """
     # Find only those leap seconds that are really changes
     idx = np.nonzero(np.diff(np.concatenate(([0], secs))))[0]
-    leap_tai = TAIleaps[idx] # TAI of start of leap second
-    taiutc = secs[idx] # TAI - UTC after leap second (same index as leap_tai)
     # Add fake TAI - UTC = 0 at the Big Bang
-    leap_tai = np.concatenate(([-np.inf], leap_tai))
-    taiutc = np.concatenate(([0], taiutc))
-    return leap_tai, taiutc
+    leaptai = np.concatenate(([-np.inf], TAIleaps[idx]))
+    taiutc = np.concatenate(([0.], secs[idx]))
+    naive = leaptai - taiutc + 1
+    dt64 = np.empty(naive.shape, dtype='datetime64[us]')
+    dt64[0] = np.datetime64(np.iinfo(np.int64).min + 1, 'us') # NaT is last
+    dt64[1:] = np.datetime64('1958-01-01', 'us') \
+               + (naive[1:] * 1e6).astype(np.int64).astype('timedelta64[us]')
+    table = {
+        'taiutc': taiutc,
+        'dtaiutc': np.concatenate(([0.], np.diff(taiutc))),
+        'leapTAI': leaptai,
+        'leapday': np.floor((leaptai - taiutc) / 86400),
+        'TAI': leaptai + 1,
+        'naive': naive,
+        'UNX': naive - 378691200.,
+        'RDT': naive / 86400 + 714780.,
+        'CDF': naive * 1e3 + 61788528000000.,
+        'DT64': dt64,
+    }
+    for v in table.values():
+        v.flags.writeable = False
+    return table
+
+
+def _leap_index(t, base='TAI', side='right'):
+    """Find the leap second in effect at a time
+
+    This is the single lookup used by all time conversions: it returns
+    an index into the arrays of the leap second table, e.g.
+    ``_leaptable['taiutc'][_leap_index(t, 'UNX')]`` is TAI - UTC at
+    each Unix time `t`.
+
+    Parameters
+    ==========
+    t : sequence
+        Times to look up.
+    base : str, optional
+        Time base of `t`: any key of the leap second table
+        (see :func:`_make_leap_table`) that is a time. Default ``TAI``.
+        For ``leapTAI`` and ``leapday`` the index is of the most recent
+        leap second starting at or before `t`, even if it is still in
+        progress.
+
+    Returns
+    =======
+    sequence of int
+        Index into the table of the last change at or before each `t`.
+
+    Other Parameters
+    ================
+    side : str, optional
+        Passed to :func:`~numpy.searchsorted`; ``left`` finds the last
+        change strictly before each `t`. Default ``right``.
+    """
+    return np.searchsorted(_leaptable[base], t, side=side) - 1
 
 
 def _tai_naive_to_real(tai):
@@ -2568,12 +3374,9 @@ def _tai_naive_to_real(tai):
     tai : sequence of float
         TAI
     """
-    # This is the ACTUAL TAI and TAI-UTC at the end of that TAI
-    leap_tai, taiutc = _changed_leaps()
-    # Naive TAI and index that corresponds to TAI - UTC
-    naive_leap_tai = leap_tai - taiutc + 1
-    taiutcidx = np.searchsorted(naive_leap_tai, tai, side='right') - 1
-    realtai = tai + taiutc[taiutcidx]
+    # Index of TAI - UTC for each naive TAI
+    taiutcidx = _leap_index(tai, 'naive')
+    realtai = tai + _leaptable['taiutc'][taiutcidx]
     # Anything before 1582-10-5 has TAI ten days later than the
     # naive conversion, because naive has ten days that are not in TAI.
     realtai[realtai < -11840601600.0] += 864000
@@ -2599,11 +3402,11 @@ def _tai_real_to_naive(tai):
         Naive TAI
     """
     # ACTUAL TAI and TAI-UTC at the end of that TAI
-    leap_tai, taiutc = _changed_leaps()
+    leap_tai, taiutc = _leaptable['leapTAI'], _leaptable['taiutc']
     # Points to largest leap-TAI less-than input TAI, thus also TAI-UTC
-    lidx = np.searchsorted(leap_tai, tai, side='right') - 1
+    lidx = _leap_index(tai, 'leapTAI')
     # Records in a leap second
-    inleap = tai < leap_tai[lidx] + np.diff(taiutc)[lidx - 1]
+    inleap = tai < leap_tai[lidx] + _leaptable['dtaiutc'][lidx]
     naive_tai = np.choose(inleap, (
         tai - taiutc[lidx], # Just subtract off LS
         np.floor(tai) + (.999 - taiutc[lidx]) # Peg to end of sec
@@ -2614,4 +3417,49 @@ def _tai_real_to_naive(tai):
     return naive_tai
 
 
+def _tai_to_datetime64(tai):
+    """Convert TAI to UTC as numpy datetime64
+
+    This is the array-based equivalent of calculating a ``datetime`` for
+    each value of TAI: one search of the leap second table is made for
+    the entire input, and the result is only converted to Python
+    ``datetime`` objects if the caller asks for it (e.g. via
+    ``astype(object)``.)
+
+    Times within a leap second are pinned to the last microsecond
+    of the previous second, as for :meth:`Ticktock.getUTC`.
+
+    Parameters
+    ==========
+    tai : sequence of float
+        TAI seconds (i.e. continuous SI seconds relative to 1958-01-01T00:00)
+
+    Returns
+    =======
+    sequence of datetime64
+        UTC, with microsecond resolution (``datetime64[us]``)
+    """
+    tai = np.require(tai, dtype=np.float64)
+    # This is the index of number of seconds to subtract from
+    # "naive" UTC, not just TAI - UTC.
+    # TAI of leap second does not have a new TAI - UTC, this
+    # is because UTC seconds = 60, but need to subtract off
+    # one more to make the UTC seconds = 59 in that case, thus
+    # "flip" to next leap second count 1s earlier.
+    idx = _leap_index(tai, 'leapTAI')
+    naive = tai - _leaptable['taiutc'][idx]
+    # Before 1582-10-15, UTC 10 days earlier than naive conversion
+    # since those dates are Julian not Gregorian.
+    naive -= np.where(tai < -11840601600.0, 864000., 0.)
+    # Keep whole seconds exact, round fraction to microseconds.
+    whole = np.floor(naive)
+    usec = np.round((naive - whole) * 1e6).astype(np.int64)
+    # TAI is in leap second: peg to end of previous second
+    inleap = np.trunc(tai) == _leaptable['leapTAI'][idx]
+    usec[inleap] = 999999
+    usec += whole.astype(np.int64) * 1000000
+    return np.datetime64('1958-01-01T00:00:00', 'us') \
+        + usec.astype('timedelta64[us]')
+
+
 _read_leaps()
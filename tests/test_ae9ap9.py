@@ -6,6 +6,7 @@ Test suite for toolbox
 
 Copyright 2010-2012 Los Alamos National Security, LLC.
 """
+import datetime
 import glob
 import gzip
 import os, sys
@@ -17,6 +18,8 @@ import shutil
 import tempfile
 import unittest
 
+import numpy
+
 import spacepy_testing
 from spacepy import ae9ap9
 
@@ -88,6 +91,44 @@ class ae9ap9Tests(unittest.TestCase):
         finally:
             os.remove(tmpname)
 
+    def test_readFileTimeFormats(self):
+        """Read files with year/month/day and year/day-of-year times"""
+        with open(self.datafiles[0]) as f:
+            lines = f.readlines()
+        header = [l for l in lines if l.startswith('#')]
+        body = [l.split(',', 1)[1] for l in lines if not l.startswith('#')]
+        formats = [
+            ('Year, Month, Day, Hour, Minute, Seconds',
+             'datetime(year),datetime(month),datetime(day),datetime(hour),'
+             'datetime(minute),datetime(seconds)',
+             ['2010,1,19,7,0,0', '2010,1,19,7,0,59', '2010,1,19,7,2,0']),
+            ('Year, day_of_year.frac', 'datetime(year),datetime(ddd.frac)',
+             ['2010,18.5', '2010,18.75', '2010,364.0']),
+        ]
+        expected = [
+            [datetime.datetime(2010, 1, 19, 7, 0, 0),
+             datetime.datetime(2010, 1, 19, 7, 0, 59),
+             datetime.datetime(2010, 1, 19, 7, 2, 0)],
+            [datetime.datetime(2010, 1, 19, 12),
+             datetime.datetime(2010, 1, 19, 18),
+             datetime.datetime(2010, 12, 31)],
+        ]
+        tmpdir = tempfile.mkdtemp()
+        try:
+            for (fmt, cols, times), exp in zip(formats, expected):
+                tmpname = os.path.join(tmpdir, 'ae9.txt')
+                with open(tmpname, 'w') as f:
+                    f.writelines([l.replace('Modified Julian Date', fmt)
+                                  .replace('datetime(mjd)', cols)
+                                  for l in header])
+                    f.writelines([t + ',' + b
+                                  for t, b in zip(times, body)])
+                ans = ae9ap9.readFile(tmpname)
+                numpy.testing.assert_equal(exp, ans['Epoch'])
+                self.assertEqual((3, 21), ans['Fluence'].shape)
+        finally:
+            shutil.rmtree(tmpdir)
+
     def test_combinePercentiles(self):
         """Can read and combine percentile files"""
         realstdout = sys.stdout
@@ -216,6 +216,86 @@ class SpaceDataTests(unittest.TestCase):
         self.assertRaises(KeyError, a.__getitem__, 'NotAkey')
         self.assertRaises(KeyError, a.__getitem__, ['a', 'nokey'])
 
+    def test_LazySpaceData(self):
+        '''LazySpaceData reads on access and evicts over budget'''
+        reads = []
+        def loader(k):
+            reads.append(k)
+            return dm.dmarray(np.arange(10, dtype=np.float64))
+        a = dm.LazySpaceData(attrs={'foo': 'bar'}, budget=200)
+        for k in ('a', 'b', 'c'):
+            a.addLazy(k, lambda k=k: loader(k), {'units': k})
+        a['d'] = dm.dmarray([1, 2, 3])
+        self.assertEqual(['a', 'b', 'c', 'd'], sorted(a.keys()))
+        self.assertFalse(a.isLoaded('a'))
+        self.assertTrue(a.isLoaded('d'))
+        self.assertEqual([], reads)
+        np.testing.assert_array_equal(np.arange(10), a['a'])
+        self.assertEqual('a', a['a'].attrs['units'])
+        self.assertEqual(['a'], reads)
+        a['b'].attrs['units'] = 'm'
+        self.assertEqual(['a', 'b'], reads)
+        self.assertTrue(a.isLoaded('a'))
+        a['c'] #Over budget, evicts a (least recently used)
+        self.assertEqual(['a', 'b', 'c'], reads)
+        self.assertFalse(a.isLoaded('a'))
+        self.assertTrue(a.isLoaded('b'))
+        self.assertTrue(a.isLoaded('d')) #Never evicted
+        a.unload('b')
+        self.assertFalse(a.isLoaded('b'))
+        self.assertEqual('m', a['b'].attrs['units']) #Attributes kept
+        self.assertEqual(['a', 'b', 'c', 'b'], reads)
+        b = copy.deepcopy(a)
+        self.assertEqual(dm.SpaceData, type(b))
+        self.assertEqual('bar', b.attrs['foo'])
+        np.testing.assert_array_equal(np.arange(10), b['a'])
+
+    def test_LazySpaceData_dict(self):
+        """dict methods of LazySpaceData read values, not return loaders"""
+        def make():
+            a = dm.LazySpaceData(attrs={'foo': 'bar'})
+            for k in ('a', 'b'):
+                a.addLazy(k, lambda k=k: dm.dmarray([1, 2, 3]), {'units': k})
+            return a
+        a = make()
+        v = a.pop('a')
+        self.assertEqual(dm.dmarray, type(v))
+        np.testing.assert_array_equal([1, 2, 3], v)
+        self.assertEqual('a', v.attrs['units'])
+        self.assertFalse('a' in a)
+        self.assertFalse('a' in a._lazy)
+        self.assertFalse('a' in a._lru)
+        self.assertEqual(None, a.pop('a', None))
+        self.assertRaises(KeyError, a.pop, 'a')
+        k, v = a.popitem()
+        self.assertEqual('b', k)
+        self.assertEqual(dm.dmarray, type(v))
+        self.assertEqual('b', v.attrs['units'])
+        self.assertEqual({}, a._lazy)
+        self.assertEqual(0, len(a._lru))
+        a = make()
+        v = a.setdefault('a', None)
+        self.assertEqual(dm.dmarray, type(v))
+        self.assertTrue(a.isLoaded('a'))
+        self.assertEqual(5, a.setdefault('c', 5))
+        self.assertEqual(5, a['c'])
+        a = make()
+        b = a.copy()
+        self.assertEqual(dm.SpaceData, type(b))
+        self.assertEqual('bar', b.attrs['foo'])
+        for k in ('a', 'b'):
+            self.assertEqual(dm.dmarray, type(b[k]))
+        a = make()
+        b = dict(a)
+        for k in ('a', 'b'):
+            self.assertEqual(dm.dmarray, type(b[k]))
+        a = make()
+        self.assertFalse('_LazyValue' in repr(a))
+        self.assertTrue('dmarray([1, 2, 3])' in repr(a))
+        a.clear()
+        self.assertEqual(0, len(a))
+        self.assertEqual({}, a._lazy)
+
     def test_resample_input(self):
         '''resample requires SpaceData or dmarray'''
         self.assertRaises(TypeError, dm.resample, [1,2,3])
@@ -671,6 +751,51 @@ class converterTests(unittest.TestCase):
         np.testing.assert_almost_equal(self.SDobj['var'], newobj['var'])
         self.assertEqual(self.SDobj['var'].attrs['a'], newobj['var'].attrs['a'])
 
+    def test_HDF5roundtrip_lazy(self):
+        """Data can go to hdf and back, read lazily"""
+        self.SDobj['grp'] = dm.SpaceData(
+            {'var2': dm.dmarray([4, 5], attrs={'b': 'b'})})
+        dm.toHDF5(self.testfile, self.SDobj)
+        newobj = dm.fromHDF5(self.testfile, lazy=True)
+        self.assertTrue(isinstance(newobj, dm.LazySpaceData))
+        self.assertEqual(self.SDobj.attrs['global'], newobj.attrs['global'])
+        self.assertFalse(newobj.isLoaded('var'))
+        np.testing.assert_almost_equal(self.SDobj['var'], newobj['var'])
+        self.assertEqual(self.SDobj['var'].attrs['a'], newobj['var'].attrs['a'])
+        self.assertFalse(newobj['grp'].isLoaded('var2'))
+        np.testing.assert_almost_equal([4, 5], newobj['grp']['var2'])
+        self.assertEqual('b', newobj['grp']['var2'].attrs['b'])
+
+    def test_NC3roundtrip_lazy(self):
+        """Data can be read lazily from netCDF3"""
+        try:
+            import scipy.io
+        except ImportError:
+            self.skipTest('scipy not available')
+        fname = os.path.join(self.testdir, 'test.nc')
+        ncfile = scipy.io.netcdf_file(fname, 'w')
+        try:
+            ncfile.history = 'test'
+            ncfile.createDimension('x', 3)
+            var = ncfile.createVariable('var', 'i4', ('x',))
+            var[:] = [1, 2, 3]
+            var.units = 'm'
+            ncfile.close()
+            expected = dm.fromNC3(fname)
+            newobj = dm.fromNC3(fname, lazy=True)
+            self.assertTrue(isinstance(newobj, dm.LazySpaceData))
+            self.assertEqual(expected.attrs['history'],
+                             newobj.attrs['history'])
+            self.assertFalse(newobj.isLoaded('var'))
+            np.testing.assert_array_equal([1, 2, 3], newobj['var'])
+            self.assertTrue(newobj.isLoaded('var'))
+            self.assertEqual(expected['var'].attrs['units'],
+                             newobj['var'].attrs['units'])
+            self.assertEqual(b'm', newobj['var'].attrs['units'])
+        finally:
+            if os.path.exists(fname):
+                os.remove(fname)
+
     def test_HDF5roundtrip_method(self):
         """Data can go to hdf and back"""
         self.SDobj.toHDF5(self.testfile)
@@ -765,6 +890,40 @@ class converterTestsCDF(unittest.TestCase):
         for k in self.SDobj:
             np.testing.assert_array_equal(self.SDobj[k], tst[k])
 
+    def test_toCDFroundtrip_lazy(self):
+        """toCDF should be able to make a file and then read it lazily"""
+        dm.toCDF(self.testfile, self.SDobj)
+        tst = dm.fromCDF(self.testfile, lazy=True, budget=1)
+        self.assertTrue('global' in tst.attrs)
+        self.assertFalse(tst.isLoaded('var'))
+        for k in self.SDobj:
+            np.testing.assert_array_equal(self.SDobj[k], tst[k])
+            self.assertEqual('a', tst[k].attrs['a'])
+        self.assertTrue(tst.isLoaded('var'))
+        tst.close()
+        np.testing.assert_array_equal(self.SDobj['var'], tst['var'])
+
+    def test_toCDF_lazy_open_once(self):
+        """fromCDF lazy should not reopen the CDF to read each variable"""
+        from spacepy import pycdf
+        self.SDobj['var2'] = dm.dmarray([4, 5, 6])
+        dm.toCDF(self.testfile, self.SDobj)
+        builds = []
+        class CountingMetadata(pycdf._Metadata):
+            def __init__(self, *args, **kwargs):
+                builds.append(1)
+                super(CountingMetadata, self).__init__(*args, **kwargs)
+        orig = pycdf._Metadata
+        pycdf._Metadata = CountingMetadata
+        try:
+            with dm.fromCDF(self.testfile, lazy=True, budget=1) as tst:
+                for i in range(3):
+                    for k in ('var', 'var2'):
+                        np.testing.assert_array_equal(self.SDobj[k], tst[k])
+        finally:
+            pycdf._Metadata = orig
+        self.assertEqual(1, len(builds))
+
     def test_toCDFroundtrip_method(self):
         """toCDF should be able to make a file and then read it in the same"""
         self.SDobj.toCDF(self.testfile)
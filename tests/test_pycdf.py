@@ -35,6 +35,7 @@ import spacepy_testing
 from spacepy import datamodel
 import spacepy.pycdf as cdf
 import spacepy.pycdf.const as const
+import spacepy.time
 
 __all__ = ['NoCDF', 'MakeCDF', 'CDFTestsBase', 'CDFTests', 'ColCDFTests',
            'OpenCDF', 'ReadCDF', 'ReadColCDF', 'ChangeCDFBase', 'ChangeCDF',
@@ -212,6 +213,95 @@ class NoCDF(unittest.TestCase):
         expected = numpy.array(dts)
         numpy.testing.assert_array_equal(expected, result)
 
+    def testTT2000ToDatetimeBulk(self):
+        """Vectorized TT2000 to datetime matches scalar, incl. leapsecond"""
+        if not cdf.lib.supports_int8:
+            return
+        leap = cdf.lib.datetime_to_tt2000(datetime.datetime(2017, 1, 1))
+        tt2000s = numpy.array([
+            leap - 1000000001, leap - 1000000000, leap - 500000000,
+            leap - 1, leap, leap - 1000000500, leap - 1000000501,
+            cdf.lib.datetime_to_tt2000(datetime.datetime(1972, 1, 1)) - 1,
+            -315575942816000000, # 1990-01-01
+            -883655957816000000 - 86400 * 10 ** 9, # 1971-12-31
+            -2 ** 63, -2 ** 63 + 1, 2 ** 63 - 1], dtype=numpy.int64)
+        expected = [cdf.lib.tt2000_to_datetime(t) for t in tt2000s]
+        self.assertEqual(datetime.datetime(2016, 12, 31, 23, 59, 59, 999999),
+                         expected[2])
+        numpy.testing.assert_array_equal(
+            expected, cdf.lib.v_tt2000_to_datetime(tt2000s))
+        numpy.testing.assert_array_equal(
+            expected[:5], cdf.lib.v_tt2000_to_datetime(tt2000s[:5]
+                                                       .reshape(5, 1))[:, 0])
+        self.assertEqual(expected[0], cdf.lib.v_tt2000_to_datetime(
+            tt2000s[0]))
+        numpy.testing.assert_array_equal(
+            [cdf.lib.datetime_to_tt2000(e) for e in expected[5:10]],
+            cdf.lib.v_datetime_to_tt2000(expected[5:10]))
+
+    def testTT2000ToDatetime64(self):
+        """Convert TT2000 to numpy datetime64"""
+        if not cdf.lib.supports_int8:
+            self.assertRaises(NotImplementedError,
+                              cdf.lib.v_tt2000_to_datetime64, [1])
+            return
+        leap = cdf.lib.datetime_to_tt2000(datetime.datetime(2017, 1, 1))
+        tt2000s = [284040066184000000, 284040066184000001,
+                   leap - 500000000, leap, -883655957816000000 - 1000,
+                   -2 ** 63, 2 ** 63 - 1]
+        expected = numpy.array(
+            ['2009-01-01T00:00:00', '2009-01-01T00:00:00.000000001',
+             '2016-12-31T23:59:59.999999999', '2017-01-01T00:00:00',
+             '1971-12-31', 'NaT', 'NaT'],
+            dtype='datetime64[ns]')
+        result = cdf.lib.v_tt2000_to_datetime64(tt2000s)
+        self.assertEqual(numpy.dtype('datetime64[ns]'), result.dtype)
+        # Before 1972 only microsecond resolution.
+        numpy.testing.assert_array_equal(expected[:4], result[:4])
+        self.assertEqual(cdf.lib.tt2000_to_datetime(tt2000s[4]),
+                         result[4].astype('datetime64[us]').tolist())
+        numpy.testing.assert_array_equal(expected[5:], result[5:])
+        numpy.testing.assert_array_equal(
+            [284040066184000000, 284040066184000001, leap,
+             -2 ** 63],
+            cdf.lib.v_datetime_to_tt2000(expected[[0, 1, 3, 5]]))
+
+    def testEpochToDatetime64(self):
+        """Convert EPOCH to numpy datetime64"""
+        epochs = [63397987200000.0, 63397987200001.7, -1e31, 0.]
+        expected = numpy.array(
+            ['2009-01-01T00:00:00', '2009-01-01T00:00:00.001', 'NaT', 'NaT'],
+            dtype='datetime64[ms]')
+        result = cdf.lib.v_epoch_to_datetime64(epochs)
+        self.assertEqual(numpy.dtype('datetime64[ms]'), result.dtype)
+        numpy.testing.assert_array_equal(expected, result)
+        numpy.testing.assert_array_equal(
+            [63397987200000.0, 63397987200001.0, -1e31],
+            cdf.lib.v_datetime_to_epoch(expected[:3]))
+        numpy.testing.assert_array_equal(
+            [63397987200001.0, 63397987200000.0],
+            cdf.lib.v_datetime_to_epoch(numpy.array(
+                ['2009-01-01T00:00:00.0005', '2009-01-01T00:00:00.000499'],
+                dtype='datetime64[us]')))
+
+    def testEpoch16ToDatetime64(self):
+        """Convert EPOCH16 to numpy datetime64"""
+        epochs = [[63397987199.0, 999999999000.0],
+                  [63397987200.0, 1500.0],
+                  [-1e31, -1e31],
+                  ]
+        expected = numpy.array(
+            ['2008-12-31T23:59:59.999999999', '2009-01-01T00:00:00.000000002',
+             'NaT'], dtype='datetime64[ns]')
+        result = cdf.lib.v_epoch16_to_datetime64(epochs)
+        self.assertEqual(numpy.dtype('datetime64[ns]'), result.dtype)
+        numpy.testing.assert_array_equal(expected, result)
+        numpy.testing.assert_array_equal(
+            [[63397987199.0, 999999999000.0],
+             [63397987200.0, 2000.0],
+             [-1e31, -1e31]],
+            cdf.lib.v_datetime_to_epoch16(expected))
+
     def testEpoch16ToDatetime(self):
         epochs = [[63397987199.0, 999999999999.0],
                   [-1.0, -1.0],
@@ -688,6 +778,54 @@ class NoCDF(unittest.TestCase):
             cdf.lib.v_datetime_to_epoch([datetime.datetime(2010, 1, i)
                                                    for i in range(1, 7)]))
 
+    def testConcatCDFPaths(self):
+        """Read from sequential CDF files, by time, in parallel"""
+        td = tempfile.mkdtemp()
+        cdf.lib.set_backward(False)
+        files = [os.path.join(td, '{0}.cdf'.format(i)) for i in range(3)]
+        try:
+            for i, fname in enumerate(files):
+                with cdf.CDF(fname, create=True) as cdffile:
+                    cdffile.attrs['gattr'] = i
+                    for t in (const.CDF_EPOCH, const.CDF_EPOCH16,
+                              const.CDF_TIME_TT2000):
+                        cdffile.new(
+                            str(t), [datetime.datetime(2010, 1, i + 1, h)
+                                     for h in range(0, 24, 6)], type=t)
+                    cdffile['var'] = numpy.arange(4 * i, 4 * i + 4)
+                    cdffile['var'].attrs['DEPEND_0'] = str(const.CDF_EPOCH)
+                    cdffile['str'] = ['a' * (i + 1)] * 4
+                    cdffile.new('nrv', [i, i], recVary=False)
+            expected = [datetime.datetime(2010, 1, d, h)
+                        for d in range(1, 4) for h in range(0, 24, 6)]
+            for processes in (None, 2):
+                data = cdf.concatCDF(files, processes=processes)
+                self.assertEqual(0, data.attrs['gattr'][0])
+                numpy.testing.assert_array_equal(numpy.arange(12),
+                                                 data['var'])
+                numpy.testing.assert_array_equal([0, 0], data['nrv'])
+                self.assertEqual(['a', 'a', 'a', 'a', 'aa'],
+                                 list(data['str'][:5]))
+                self.assertEqual(['aaa'], list(data['str'][-1:]))
+                data = cdf.concatCDF(
+                    files, ['var', str(const.CDF_EPOCH16),
+                            str(const.CDF_TIME_TT2000)],
+                    starttime=datetime.datetime(2010, 1, 1, 12),
+                    endtime=datetime.datetime(2010, 1, 3, 6),
+                    processes=processes)
+                numpy.testing.assert_array_equal(numpy.arange(2, 9),
+                                                 data['var'])
+                for t in (const.CDF_EPOCH16, const.CDF_TIME_TT2000):
+                    self.assertEqual(expected[2:9], list(data[str(t)]))
+            with cdf.CDF(files[0]) as cdf1:
+                self.assertRaises(ValueError, cdf.concatCDF,
+                                  [cdf1, files[1]])
+                self.assertRaises(ValueError, cdf.concatCDF,
+                                  [cdf1], processes=2)
+        finally:
+            cdf.lib.set_backward(True)
+            shutil.rmtree(td)
+
 
 class MakeCDF(unittest.TestCase):
     def setUp(self):
@@ -1110,6 +1248,202 @@ class MakeCDF(unittest.TestCase):
         # Revert to the default (for now)
         cdf.lib.set_backward(True)
 
+    def testTimeAs(self):
+        """Read time variables as datetime64 and TAI"""
+        cdf.lib.set_backward(False)
+        #Across the 2016 leap second
+        data = [datetime.datetime(2016, 12, 31, 23, 59, 59, 500000)
+                + datetime.timedelta(seconds=i) for i in range(4)]
+        tai = spacepy.time.Ticktock(data).TAI
+        types = (cdf.const.CDF_EPOCH, cdf.const.CDF_EPOCH16,
+                 cdf.const.CDF_TIME_TT2000)
+        fills = (-1e31, (-1e31, -1e31), -9223372036854775808)
+        try:
+            with cdf.CDF(self.testfspec, '') as f:
+                for t, fill in zip(types, fills):
+                    f.new(str(t), data, type=t)
+                    f.raw_var(str(t))[3] = fill
+                self.assertEqual('datetime', f.time_as())
+        finally:
+            cdf.lib.set_backward(True)
+        with cdf.CDF(self.testfspec, time_as='tai') as f:
+            self.assertEqual('tai', f.time_as())
+            for t in types:
+                numpy.testing.assert_array_equal(
+                    tai[:3], f[str(t)][:3])
+                self.assertTrue(numpy.isnan(f[str(t)][3]))
+                self.assertEqual(tai[0], f[str(t)][0])
+            self.assertEqual('datetime64', f.time_as('datetime64'))
+            for t in types:
+                expected = numpy.array(data[:3], dtype='M8[ms]')
+                actual = f[str(t)][...]
+                self.assertEqual('M', actual.dtype.kind)
+                numpy.testing.assert_array_equal(expected, actual[:3])
+                self.assertTrue(numpy.isnat(actual[3]))
+                self.assertEqual(expected[0], f[str(t)][0])
+            self.assertEqual(
+                data[:3], list(f[str(types[2])].get(
+                    slice(0, 3), time_as='datetime')))
+            self.assertRaises(ValueError, f.time_as, 'foo')
+            self.assertRaises(ValueError, f[str(types[0])].get, 0, 'foo')
+        self.assertRaises(ValueError, cdf.CDF, self.testfspec,
+                          time_as='foo')
+
+    def testWriteDatetime64(self):
+        """Write datetime64 to a new variable"""
+        cdf.lib.set_backward(False)
+        try:
+            with cdf.CDF(self.testfspec, '') as f:
+                data = numpy.array(['2010-01-01T00:00:00.123',
+                                    '2010-01-01T00:00:01.123'],
+                                   dtype='M8[ns]')
+                f.new('ms', data)
+                self.assertEqual(cdf.const.CDF_EPOCH.value, f['ms'].type())
+                f.new('ns', data + numpy.timedelta64(456789, 'ns'),
+                      type=cdf.const.CDF_TIME_TT2000)
+                f.time_as('datetime64')
+                numpy.testing.assert_array_equal(data, f['ms'][...])
+                numpy.testing.assert_array_equal(
+                    data + numpy.timedelta64(456789, 'ns'), f['ns'][...])
+        finally:
+            cdf.lib.set_backward(True)
+
+    def testTimeSlice(self):
+        """Read records in a time range"""
+        cdf.lib.set_backward(False)
+        times = [datetime.datetime(2010, 1, 1) + datetime.timedelta(minutes=i)
+                 for i in range(100)]
+        try:
+            with cdf.CDF(self.testfspec, '') as f:
+                f.new('Epoch', times, type=const.CDF_TIME_TT2000)
+                f.new('Epoch16', times[::10], type=const.CDF_EPOCH16)
+                f['data'] = numpy.arange(100)
+                f['data'].attrs['DEPEND_0'] = 'Epoch'
+                f['data16'] = numpy.arange(10)
+                f['data16'].attrs['DEPEND_0'] = 'Epoch16'
+                f.new('nrv', [1, 2], recVary=False)
+        finally:
+            cdf.lib.set_backward(True)
+        with cdf.CDF(self.testfspec) as f:
+            data = f.time_slice(datetime.datetime(2010, 1, 1, 0, 15),
+                                datetime.datetime(2010, 1, 1, 0, 40, 30))
+            self.assertEqual(
+                ['Epoch', 'Epoch16', 'data', 'data16', 'nrv'],
+                sorted(data.keys()))
+            numpy.testing.assert_array_equal(numpy.arange(15, 41),
+                                             data['data'])
+            self.assertEqual(times[15:41], list(data['Epoch']))
+            numpy.testing.assert_array_equal([2, 3, 4], data['data16'])
+            self.assertEqual(times[20:50:10], list(data['Epoch16']))
+            numpy.testing.assert_array_equal([1, 2], data['nrv'])
+            self.assertEqual('Epoch', data['data'].attrs['DEPEND_0'])
+            data = f.time_slice(stop=datetime.datetime(2010, 1, 1, 0, 5),
+                                varnames=['data'])
+            numpy.testing.assert_array_equal(numpy.arange(5), data['data'])
+            data = f.time_slice(datetime.datetime(2010, 1, 2),
+                                varnames=['data'])
+            self.assertEqual(0, len(data['data']))
+
+    def testMemmap(self):
+        """Memory-map uncompressed variables"""
+        cdf.lib.set_backward(False)
+        try:
+            for col_major in (False, True):
+                with cdf.CDF(self.testfspec, '') as f:
+                    f.col_major(col_major)
+                    f['multi'] = numpy.arange(60, dtype=numpy.float32)\
+                                      .reshape(5, 3, 4)
+                    f.new('nrv', numpy.arange(6, dtype=numpy.int16)
+                          .reshape(2, 3), recVary=False)
+                    f.new('epoch16', [datetime.datetime(2010, 1, 1, i)
+                                      for i in range(4)],
+                          type=const.CDF_EPOCH16)
+                    f['string'] = ['abc', 'de']
+                    f.new('empty', type=const.CDF_INT4, dims=[3])
+                with cdf.CDF(self.testfspec) as f:
+                    for name in ('multi', 'nrv', 'epoch16', 'string',
+                                 'empty'):
+                        expected = f.raw_var(name)[...]
+                        actual = f[name].memmap()
+                        self.assertEqual(expected.shape, actual.shape)
+                        numpy.testing.assert_array_equal(expected, actual)
+                    self.assertIsInstance(f['multi'].memmap(), numpy.memmap)
+                    self.assertFalse(f['multi'].memmap().flags.writeable)
+                os.remove(self.testfspec)
+        finally:
+            cdf.lib.set_backward(True)
+
+    def testMemmapFail(self):
+        """Memory-map variables where not possible"""
+        cdf.lib.set_backward(False)
+        try:
+            with cdf.CDF(self.testfspec, '') as f:
+                f.new('compressed', numpy.arange(100.),
+                      compress=const.GZIP_COMPRESSION)
+                f.new('one', type=const.CDF_INT4)
+                f.new('two', type=const.CDF_INT4)
+                #Interleaving records puts them in many blocks
+                for i in range(3000):
+                    f['one'].append(i)
+                    f['two'].append(i)
+                self.assertRaises(ValueError, f['compressed'].memmap)
+        finally:
+            cdf.lib.set_backward(True)
+        with cdf.CDF(self.testfspec) as f:
+            self.assertRaises(ValueError, f['compressed'].memmap)
+            self.assertRaises(ValueError, f['one'].memmap)
+
+    def testRecordWriter(self):
+        """Append records through a buffered writer"""
+        cdf.lib.set_backward(False)
+        times = [datetime.datetime(2010, 1, 1) + datetime.timedelta(seconds=i)
+                 for i in range(25)]
+        counts = numpy.arange(100, dtype=numpy.uint16).reshape(25, 4)
+        try:
+            with cdf.CDF(self.testfspec, '') as f:
+                f.new('Epoch', type=const.CDF_TIME_TT2000)
+                f.new('Counts', type=const.CDF_UINT2, dims=[4],
+                      compress=const.GZIP_COMPRESSION)
+                f.new('nrv', [1, 2], recVary=False)
+                self.assertRaises(ValueError, f.writer, ['nrv'])
+                with f.writer(['Epoch', 'Counts'], block=4, nrecs=25) as w:
+                    self.assertEqual(25, f['Epoch'].blocking_factor())
+                    self.assertEqual(4, f['Counts'].blocking_factor())
+                    for i in range(3):
+                        w.append({'Epoch': times[i], 'Counts': counts[i]})
+                    self.assertEqual(0, len(f['Epoch']))
+                    w.append({'Epoch': times[3]})
+                    self.assertEqual(4, len(f['Epoch']))
+                    self.assertEqual(0, len(f['Counts']))
+                    w.extend({'Epoch': numpy.array(times[4:25],
+                                                   dtype='M8[us]'),
+                              'Counts': counts[3:25]})
+                    self.assertEqual(24, len(f['Epoch']))
+                    self.assertRaises(ValueError, w.extend,
+                                      {'Counts': counts[:, :2]})
+            with cdf.CDF(self.testfspec) as f:
+                self.assertEqual(times, list(f['Epoch'][...]))
+                numpy.testing.assert_array_equal(counts, f['Counts'][...])
+            #Fill is outside the range of datetime64[ns]
+            fill = datetime.datetime(9999, 12, 31, 23, 59, 59, 999999)
+            with cdf.CDF(self.testfspec, readonly=False) as f:
+                f.new('TT', type=const.CDF_TIME_TT2000)
+                f.new('E16', type=const.CDF_EPOCH16)
+                with f.writer(['TT', 'E16'], block=2) as w:
+                    w.append({'TT': times[0], 'E16': times[0]})
+                    w.append({'TT': fill, 'E16': fill})
+                    w.extend({'TT': [fill, times[1]],
+                              'E16': [fill, times[1]]})
+                    w.append({'TT': fill, 'E16': fill})
+            with cdf.CDF(self.testfspec) as f:
+                expected = [times[0], fill, fill, times[1], fill]
+                self.assertEqual(expected, list(f['TT'][...]))
+                self.assertEqual(expected, list(f['E16'][...]))
+                self.assertEqual(const.FILLED_TT2000_VALUE.value,
+                                 f.raw_var('TT')[1])
+        finally:
+            cdf.lib.set_backward(True)
+
 
 class CDFTestsBase(unittest.TestCase):
     """Base class for tests involving existing CDF, column or row major"""
@@ -1482,6 +1816,62 @@ class ReadCDF(CDFTests):
         SpinRateScalersCounts = self.cdf['SpinRateScalersCounts'][...]
         self.assertEqual(100, len(SpinRateScalersCounts))
 
+    def testPrefetch(self):
+        """Read slices ahead on a worker thread"""
+        v = self.cdf['SpinRateScalersCounts']
+        keys = [slice(i, i + 30) for i in range(0, 100, 30)] + [(41, 2, 15)]
+        results = list(v.prefetch(iter(keys), depth=3))
+        self.assertEqual(len(keys), len(results))
+        for k, r in zip(keys, results):
+            numpy.testing.assert_array_equal(v[k], r)
+        #Abandon part way
+        it = v.prefetch(slice(i, i + 10) for i in range(0, 100, 10))
+        numpy.testing.assert_array_equal(v[0:10], next(it))
+        it.close()
+        epochs = list(self.cdf['Epoch'].prefetch([slice(0, 2)],
+                                                 time_as='datetime64'))
+        numpy.testing.assert_array_equal(
+            self.cdf['Epoch'].get(slice(0, 2), time_as='datetime64'),
+            epochs[0])
+        self.assertRaises(ValueError, v.prefetch, [0], depth=0)
+        self.assertRaises(ValueError, v.prefetch, [0], time_as='foo')
+
+    def testVarIterChunks(self):
+        """Iterate over blocks of records of a variable"""
+        v = self.cdf['SpinRateScalersCounts']
+        blocks = [b.copy() for b in v.iter_chunks(30)]
+        self.assertEqual([30, 30, 30, 10], [len(b) for b in blocks])
+        numpy.testing.assert_array_equal(v[...], numpy.concatenate(blocks))
+        blocks = list(self.cdf['Epoch'].iter_chunks(
+            40, start=10, stop=95, time_as='datetime64'))
+        numpy.testing.assert_array_equal(
+            self.cdf['Epoch'].get(slice(10, 95), time_as='datetime64'),
+            numpy.concatenate(blocks))
+        self.assertEqual([], list(v.iter_chunks(10, start=100)))
+        self.assertRaises(ValueError, v.iter_chunks, 0)
+        self.assertRaises(ValueError, self.cdf['RateScalerNames'].iter_chunks,
+                          10)
+
+    def testCDFIterChunks(self):
+        """Iterate over aligned blocks of records of several variables"""
+        depend = self.cdf['PhysRecNo'].attrs['DEPEND_0']
+        n = len(self.cdf['PhysRecNo'])
+        starts = []
+        for block in self.cdf.iter_chunks(['PhysRecNo', 'RateScalerNames'],
+                                          40):
+            self.assertEqual(sorted(['PhysRecNo', 'RateScalerNames', depend]),
+                             sorted(block.keys()))
+            numpy.testing.assert_array_equal(
+                self.cdf['PhysRecNo'][len(starts) * 40:][:40],
+                block['PhysRecNo'])
+            self.assertEqual(
+                list(self.cdf[depend][len(starts) * 40:][:40]),
+                list(block[depend]))
+            numpy.testing.assert_array_equal(
+                self.cdf['RateScalerNames'][...], block['RateScalerNames'])
+            starts.append(len(starts) * 40)
+        self.assertEqual(list(range(0, n, 40)), starts)
+
     def testEmptyResults(self):
         """Request an empty slice from a variable"""
         data = self.cdf['SectorRateScalersCounts'][1:1]
@@ -2528,6 +2918,25 @@ class ChangeCDF(ChangeCDFBase):
             (type, val, traceback) = sys.exc_info()
             self.fail('Raised exception ' + str(val))
 
+    def testMetadataSnapshot(self):
+        """Readonly metadata matches library, is dropped on readonly off"""
+        def describe(f):
+            return (len(f),
+                    [(v.name(), v.type(), v.nelems(), v._dim_sizes(),
+                      v.rv(), len(v), v.attrs.copy()) for v in f.values()],
+                    f.attrs.copy())
+        expected = describe(self.cdf)
+        self.assertTrue(self.cdf.readonly(True))
+        self.assertTrue(self.cdf._metadata() is not None)
+        self.assertEqual(expected, describe(self.cdf))
+        self.assertRaises(IndexError, self.cdf.attrs['PI_name'].__getitem__,
+                          5)
+        self.assertFalse(self.cdf.readonly(False))
+        self.assertTrue(self.cdf._metadata() is None)
+        self.cdf['ATC'].attrs['FIELDNAM'] = 'changed'
+        self.cdf.readonly(True)
+        self.assertEqual('changed', self.cdf['ATC'].attrs['FIELDNAM'])
+
     def testRenameVar(self):
         """Rename a variable"""
         zvar = self.cdf['PhysRecNo']
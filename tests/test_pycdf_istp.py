@@ -4,6 +4,7 @@
 
 import datetime
 import inspect
+import json
 import os.path
 import shutil
 import sys
@@ -304,6 +305,35 @@ class VariablesTests(ISTPTestsBase):
         self.assertEqual(
             0, len(spacepy.pycdf.istp.VariableChecks.validrange(v)))
 
+    def testValidRangeChunks(self):
+        """Validmin/validmax with data read in several blocks"""
+        v = self.cdf.new('var1', data=numpy.arange(20, dtype=numpy.float64))
+        v.attrs['VALIDMIN'] = 0.
+        v.attrs['VALIDMAX'] = 15.
+        v.attrs['FILLVAL'] = -1e31
+        v[3] = -1e31
+        v[4] = numpy.nan
+        oldchunk = spacepy.pycdf.istp._VarStats.chunk_values
+        spacepy.pycdf.istp._VarStats.chunk_values = 3
+        try:
+            stats = spacepy.pycdf.istp._stats(v)
+            self.assertEqual((20,), stats.shape)
+            self.assertEqual(1, stats.n_fill)
+            self.assertEqual(1, stats.n_nan)
+            self.assertEqual(0., stats.min)
+            self.assertEqual(19., stats.max)
+            #Fill and NaN are not compared
+            numpy.testing.assert_array_equal([], stats.decreasing)
+            errs = spacepy.pycdf.istp.VariableChecks.validrange(v)
+            self.assertEqual(1, len(errs))
+            self.assertEqual('Value 16.0, 17.0, 18.0, 19.0 at index '
+                             '16, 17, 18, 19 over VALIDMAX 15.0.', errs[0])
+            v.attrs['VALIDMAX'] = 5.
+            errs = spacepy.pycdf.istp.VariableChecks.validrange(v)
+            self.assertEqual(['14 values over VALIDMAX 5.0'], errs)
+        finally:
+            spacepy.pycdf.istp._VarStats.chunk_values = oldchunk
+
     def testFillval(self):
         """Test for fillval presence, type, value"""
         v = self.cdf.new('var1', data=[1, 2, 3],
@@ -675,6 +705,41 @@ class FileTests(ISTPTestsBase):
             ],
             sorted(errs))
 
+    def testCheckArchive(self):
+        """Check a directory of files"""
+        self.cdf['var1'] = [1, 2, 3]
+        self.cdf['var1'].attrs['DEPEND_0'] = 'var2'
+        self.cdf['var1'].attrs['FIELDNAM'] = 'var1'
+        self.cdf.attrs['Logical_source'] = \
+            'source_descriptor_datatype'
+        self.cdf.attrs['Logical_file_id'] = \
+            'source_descriptor_datatype_19990101_v00'
+        self.cdf.close()
+        good = os.path.join(
+            self.tempdir, 'source_descriptor_datatype_19990101_v00.cdf')
+        bad = os.path.join(self.tempdir, 'notacdf.cdf')
+        with open(bad, 'w') as f:
+            f.write('This is not a CDF.')
+        output = os.path.join(self.tempdir, 'report.json')
+        for processes in (1, 2):
+            report = spacepy.pycdf.istp.check_archive(
+                self.tempdir, processes=processes, output=output)
+            self.assertEqual([bad, good], list(report.keys()))
+            self.assertEqual([
+                'var1: DEPEND_0 variable var2 missing.',
+                'var1: No FILLVAL attribute.',
+                ], sorted(report[good]))
+            self.assertEqual(1, len(report[bad]))
+            self.assertTrue(report[bad][0].startswith('Cannot open file'))
+            with open(output) as f:
+                self.assertEqual(report, json.load(f))
+        report = spacepy.pycdf.istp.check_archive(
+            os.path.join(self.tempdir, 'source_*.cdf'), processes=1)
+        self.assertEqual([good], list(report.keys()))
+        self.assertRaises(spacepy.pycdf.CDFError,
+                          spacepy.pycdf.istp.check_archive, [bad],
+                          processes=1, catch=False)
+
     def testAllFailure(self):
         """Call file checks with a known bad one"""
         self.cdf.attrs['Logical_source'] = \
@@ -735,6 +800,19 @@ class FileTests(ISTPTestsBase):
         self.assertEqual(1, len(errs))
         self.assertEqual('Epoch: Nonmonotonic time at record 4.', errs[0])
 
+    def testTimesMonotonFill(self):
+        """Test monotonic time, compared across fill"""
+        self.cdf['Epoch'] = [datetime.datetime(1999, 1, 1, i)
+                             for i in (0, 2, 0, 1, 3)]
+        self.cdf.raw_var('Epoch')[2] = -1e31
+        oldchunk = spacepy.pycdf.istp._VarStats.chunk_values
+        spacepy.pycdf.istp._VarStats.chunk_values = 2 #Fill starts a block
+        try:
+            errs = spacepy.pycdf.istp.FileChecks.time_monoton(self.cdf)
+        finally:
+            spacepy.pycdf.istp._VarStats.chunk_values = oldchunk
+        self.assertEqual(['Epoch: Nonmonotonic time at record 3.'], errs)
+
     def testTimes(self):
         """Compare filename to Epoch times"""
         warnings.filterwarnings(
@@ -815,6 +893,51 @@ class FuncTests(ISTPTestsBase):
         spacepy.pycdf.istp.format(v)
         self.assertEqual('A5', v.attrs['FORMAT'])
 
+    def testFormatAll(self):
+        """Set the format on all variables"""
+        expected = {'var1': 'A24', 'var2': 'I2', 'var3': 'I5', 'var4': 'A5'}
+        self.cdf.new('var1', type=spacepy.pycdf.const.CDF_EPOCH)
+        v = self.cdf.new('var2', type=spacepy.pycdf.const.CDF_INT2)
+        v.attrs['VALIDMIN'] = -2
+        v.attrs['VALIDMAX'] = -2
+        v = self.cdf.new('var3', type=spacepy.pycdf.const.CDF_UINT2)
+        v.attrs['FORMAT'] = 'I10'
+        v = self.cdf.new('var4', data=['hi', 'there'])
+        v.attrs['FORMAT'] = 'A5'
+        spacepy.pycdf.istp.format_all(self.cdf)
+        for k, e in expected.items():
+            self.assertEqual(e, self.cdf[k].attrs['FORMAT'])
+
+    def testNanFillAll(self):
+        """Replace fill/invalid values with nan in all variables"""
+        indata = numpy.array([[5., 99., -1., 3., 4., 12.],
+                              [2., 2., 2., 2., 2., 2.],
+                              [2., 2., 2., 2., 3., -1.]])
+        attrs = { 'FILLVAL': 3,
+                  'VALIDMIN': 0,
+                  'VALIDMAX': 12 }
+        var = self.cdf.new('var', data=indata)
+        var.attrs = attrs
+        nrv = self.cdf.new('nrv', data=[1., 3., 5.], recVary=False)
+        nrv.attrs = attrs
+        var2 = self.cdf.new(
+            'var2', data=indata, type=spacepy.pycdf.const.CDF_INT2)
+        var2.attrs = attrs
+        expected = var.copy()
+        spacepy.pycdf.istp.nanfill(expected)
+        oldchunk = spacepy.pycdf.istp._VarStats.chunk_values
+        spacepy.pycdf.istp._VarStats.chunk_values = 12 #Two records
+        try:
+            spacepy.pycdf.istp.nanfill_all(self.cdf)
+        finally:
+            spacepy.pycdf.istp._VarStats.chunk_values = oldchunk
+        numpy.testing.assert_almost_equal(
+            var[...], expected, decimal=15)
+        numpy.testing.assert_almost_equal(
+            nrv[...], [1., numpy.nan, 5.], decimal=15)
+        #Integers untouched
+        numpy.testing.assert_array_equal(var2[...], indata)
+
     def testNanFill(self):
         """Replace fill/invalid values with nan"""
         indata = numpy.array([[5., 99., -1., 3., 4., 12.],
@@ -1186,6 +1309,41 @@ class VarBundleChecks(VarBundleChecksBase):
         self.assertFalse('DEPEND_3'
                         in self.outcdf['SectorRateScalersCounts'].attrs)
 
+    def testSliceSumBlocks(self):
+        """Slice and sum over a dimension, processing a few records at once"""
+        bundle = spacepy.pycdf.istp.VarBundle(
+            self.incdf['SectorRateScalersCounts'])
+        bundle.slice(0, 1, None, 2).slice(1, 0, 16).sum(1)
+        bundle.output(self.outcdf, nrec=3)
+        counts = self.incdf['SectorRateScalersCounts'][1::2, 0:16, ...]
+        expected = counts.sum(axis=1)
+        expected[(counts < 0).max(axis=1)] = -1e31
+        numpy.testing.assert_allclose(
+            expected, self.outcdf['SectorRateScalersCounts'][...])
+        numpy.testing.assert_array_equal(
+            self.incdf['ATC'][1::2], self.outcdf['ATC'][...])
+        #Same output again, checked block by block against existing
+        bundle.output(self.outcdf, nrec=2)
+        bundle.slice(0, 0, None, 2)
+        with self.assertRaises(RuntimeError):
+            bundle.output(self.outcdf, nrec=2)
+
+    def testBlocks(self):
+        """Split record slices into blocks"""
+        v = self.incdf['SectorRateScalersCounts']
+        n = len(v)
+        blocks = spacepy.pycdf.istp.VarBundle._blocks(
+            v, [slice(None, None, -1), slice(0, 16)], 3)
+        self.assertEqual((n + 2) // 3, len(blocks))
+        self.assertEqual(list(range(0, n, 3)), [b[0] for b in blocks])
+        self.assertEqual(list(range(n))[::-1], [
+            i for _, (sl, _) in blocks for i in range(n)[sl]])
+        self.assertEqual([slice(0, 16)] * len(blocks),
+                         [b[1][1] for b in blocks])
+        self.assertEqual([(None, [slice(n, None)])],
+                         spacepy.pycdf.istp.VarBundle._blocks(
+                             v, [slice(n, None)], 3))
+
     def testMean(self):
         """Average over a dimension"""
         bundle = spacepy.pycdf.istp.VarBundle(
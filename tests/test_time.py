@@ -119,6 +119,16 @@ class TimeFunctionTests(unittest.TestCase):
         ans = t.tickrange(*inval)
         numpy.testing.assert_equal(real_ans, ans.UTC[-1])
 
+    def test_tickrange_regular(self):
+        """tickrange returns a regular grid"""
+        ans = t.tickrange('2016-12-31T23:59:58', '2017-01-01T00:00:01.5',
+                          1. / 86400)
+        self.assertTrue(isinstance(ans, t.RegularTicktock))
+        self.assertEqual(4, len(ans))
+        self.assertEqual('DT64', ans.data.attrs['dtype'])
+        numpy.testing.assert_equal(
+            [1861920034, 1861920035, 1861920037, 1861920038], ans.TAI)
+
     def test_sec2hms(self):
         """sec2hms should return a known value for known input"""
         inval = ((30, False, False),
@@ -354,6 +364,29 @@ class TimeFunctionTests(unittest.TestCase):
         numpy.testing.assert_equal(expectediso, actualiso)
         numpy.testing.assert_equal(expectedoffset, actualoffset)
 
+    def test_dtstr2isomixed(self):
+        """dtstr2iso with fixed-layout ISO mixed with other formats"""
+        inputs = ['2001-02-03T04:05:06.5Z', '2001-02-03 04:05:06.123456',
+                  '20010203', '2012-06-30T23:59:60.25', '2001-02-03',
+                  'Feb 3 2001 04:05']
+        expectedUTC = [(2001, 2, 3, 4, 5, 6, 500000),
+                       (2001, 2, 3, 4, 5, 6, 123456),
+                       (2001, 2, 3), (2012, 6, 30, 23, 59, 59, 999999),
+                       (2001, 2, 3), (2001, 2, 3, 4, 5)]
+        expectedUTC = [datetime.datetime(*e) for e in expectedUTC]
+        expectediso = ['2001-02-03T04:05:06.500000',
+                       '2001-02-03T04:05:06.123456',
+                       '2001-02-03T00:00:00.000000',
+                       '2012-06-30T23:59:60.250000',
+                       '2001-02-03T00:00:00.000000',
+                       '2001-02-03T04:05:00.000000']
+        expectedoffset = [0, 0, 0, 250001, 0, 0]
+        actualiso, actualUTC, actualoffset = t.dtstr2iso(
+            inputs, fmt='%Y-%m-%dT%H:%M:%S.%f')
+        numpy.testing.assert_equal(expectedUTC, actualUTC)
+        numpy.testing.assert_equal(expectediso, actualiso)
+        numpy.testing.assert_equal(expectedoffset, actualoffset)
+
     def test_dtstr2isobadleap(self):
         """Convert a string with bad leap second to UTC"""
         inputs = ['2008-12-31T23:59:60.123', '2009-12-31T23:59:60.100']
@@ -782,7 +815,8 @@ class TimeClassTests(unittest.TestCase):
         n2 = t.Ticktock(['2002-03-01T11:23:11',
                          '2002-03-01T12:23:11'], 'ISO')
         self.assertRaises(ValueError, n1.__sub__, n2)
-        self.assertRaises(TypeError, n1.__sub__, 4)
+        self.assertRaises(TypeError, n1.__sub__, '4')
+        self.assertRaises(TypeError, n1.__sub__, numpy.timedelta64(1, 'M'))
 
     def test_subtimedeltalist(self):
         """a ticktock minus a list of timedeltas is a ticktock"""
@@ -1145,6 +1179,66 @@ class TimeClassTests(unittest.TestCase):
         t1 = t.Ticktock(tai, dtype='TAI')
         numpy.testing.assert_equal(utc, t1.UTC)
 
+    def test_UTCfromTAIArray(self):
+        """UTC from TAI for an array spanning several leap seconds"""
+        # Leap seconds at the end of 1972-06-30, 2008-12-31, 2016-12-31
+        tai = numpy.array([
+            457488009.5, 457488010, 457488011,
+            1609459232.25, 1609459233.5, 1609459234,
+            1861920035, 1861920036.75, 1861920037,
+        ])
+        expected = [datetime.datetime(*dt) for dt in [
+            (1972, 6, 30, 23, 59, 59, 500000),
+            (1972, 6, 30, 23, 59, 59, 999999),
+            (1972, 7, 1),
+            (2008, 12, 31, 23, 59, 59, 250000),
+            (2008, 12, 31, 23, 59, 59, 999999),
+            (2009, 1, 1),
+            (2016, 12, 31, 23, 59, 59),
+            (2016, 12, 31, 23, 59, 59, 999999),
+            (2017, 1, 1)]]
+        t1 = t.Ticktock(tai, dtype='TAI')
+        numpy.testing.assert_equal(expected, t1.UTC)
+        numpy.testing.assert_equal(
+            numpy.array(expected, dtype='datetime64[us]'),
+            t._tai_to_datetime64(tai))
+
+    def test_DT64input(self):
+        """Make a Ticktock from datetime64 without making UTC"""
+        dt64 = numpy.array(['2008-12-31T23:59:59', '2009-01-01T00:00:00',
+                            '2012-02-03T23:59:42.123456789'],
+                           dtype='datetime64[ns]')
+        tt = t.Ticktock(dt64)
+        self.assertEqual('DT64', tt.data.attrs['dtype'])
+        self.assertTrue(tt.DT64 is tt.data)
+        numpy.testing.assert_equal([1609459232, 1609459234], tt.TAI[:2])
+        self.assertAlmostEqual(1707004816.123456789, tt.TAI[2], places=6)
+        numpy.testing.assert_equal([366, 1, 34], tt.DOY)
+        numpy.testing.assert_equal(
+            ['2008-12-31T23:59:59', '2009-01-01T00:00:00',
+             '2012-02-03T23:59:42'], tt.ISO)
+        self.assertFalse('UTC' in tt.__dict__)
+        numpy.testing.assert_equal(
+            [datetime.datetime(2008, 12, 31, 23, 59, 59),
+             datetime.datetime(2009, 1, 1),
+             datetime.datetime(2012, 2, 3, 23, 59, 42, 123456)], tt.UTC)
+
+    def test_DT64output(self):
+        """Get datetime64 from other time systems"""
+        tt = t.Ticktock([1609459232, 1609459233.5, 1609459234], dtype='TAI')
+        numpy.testing.assert_equal(
+            numpy.array(['2008-12-31T23:59:59', '2008-12-31T23:59:59.999999',
+                         '2009-01-01T00:00:00'], dtype='datetime64[us]'),
+            tt.DT64)
+        tt = t.Ticktock([datetime.datetime(1582, 10, 4),
+                         datetime.datetime(2002, 2, 2, 12)])
+        numpy.testing.assert_equal(
+            numpy.array(['1582-10-04', '2002-02-02T12:00'],
+                        dtype='datetime64[us]'),
+            tt.DT64)
+        numpy.testing.assert_equal(
+            t.Ticktock(tt.DT64).TAI, tt.TAI)
+
     def test_pickle(self):
         """TickTock objects should pickle"""
         t1 = t.Ticktock(['2002-01-01T01:00:00', '2002-01-02'])
@@ -1176,7 +1270,57 @@ class TimeClassTests(unittest.TestCase):
                          '2002-03-01T12:23:11'], 'ISO')
         self.assertRaises(TypeError, n1.__add__, n2)  # can't add Ticktocks
         self.assertRaises(TypeError, n1.__add__, [datetime.timedelta(seconds=5)] * 8)
-        self.assertRaises(TypeError, n1.__add__, 345)
+        self.assertRaises(TypeError, n1.__add__, '345')
+        self.assertRaises(TypeError, n1.__add__, [True] * 3)
+        self.assertRaises(TypeError, n1.__add__, numpy.ones((3, 1)))
+
+    def test_add_types(self):
+        """Add intervals of various types to Ticktock"""
+        t1 = t.Ticktock(['2002-01-01T01:00:00', '2002-01-02'])
+        expected = numpy.array([t1.TAI[0] + 2700, t1.TAI[1] + 2700])
+        for addme in (datetime.timedelta(minutes=45),
+                      numpy.timedelta64(45, 'm'),
+                      2700, 2700., numpy.float32(2700.),
+                      [2700., 2700.],
+                      numpy.array([2700, 2700], dtype='timedelta64[s]'),
+                      numpy.array([datetime.timedelta(minutes=45)] * 2)):
+            res = t1 + addme
+            self.assertEqual('TAI', res.data.attrs['dtype'])
+            self.assertEqual(['TAI'], [k for k in res._keylist
+                                       if k in res.__dict__])
+            numpy.testing.assert_array_equal(expected, res.TAI)
+            numpy.testing.assert_array_equal(t1.TAI, (res - addme).TAI)
+
+    def test_add_leap(self):
+        """Arithmetic is in elapsed seconds, across leap seconds"""
+        t1 = t.Ticktock(['2008-12-31T23:59:59', '2008-12-31T12:00:00'])
+        res = t1 + numpy.array([1, 86400])
+        self.assertEqual(['2008-12-31T23:59:60', '2009-01-01T11:59:59'],
+                         list(res.ISO))
+        self.assertEqual(list(t1.ISO),
+                         list((res - numpy.array([1, 86400])).ISO))
+
+    def test_add_precision(self):
+        """Sub-microsecond intervals are kept"""
+        t1 = t.Ticktock([1609459232.] * 3, 'TAI')
+        res = t1 + numpy.array([1, 250, 1000000], dtype='timedelta64[ns]')
+        numpy.testing.assert_allclose(
+            [1e-9, 2.5e-7, 1e-3], res.TAI - t1.TAI, rtol=0, atol=2.5e-7)
+        res = t1 + 2.5e-7
+        self.assertTrue(res.TAI[0] > t1.TAI[0])
+        # Large whole number of seconds and small fraction
+        res = t1 + 86400 * 365 * 10 + 0.125
+        self.assertEqual(1609459232. + 86400 * 365 * 10 + 0.125, res.TAI[0])
+
+    def test_add_nan(self):
+        """Adding not-a-time gives not-a-time"""
+        t1 = t.Ticktock(['2002-01-01T01:00:00', '2002-01-02'])
+        res = t1 + numpy.array([numpy.nan, 1.])
+        self.assertTrue(numpy.isnan(res.TAI[0]))
+        self.assertEqual(t1.TAI[1] + 1, res.TAI[1])
+        res = t1 + numpy.array(['NaT', 1], dtype='timedelta64[s]')
+        self.assertTrue(numpy.isnan(res.TAI[0]))
+        self.assertEqual(t1.TAI[1] + 1, res.TAI[1])
 
     def test_insert(self):
         """you can insert to a TickTock"""
@@ -1402,6 +1546,44 @@ class TimeClassTests(unittest.TestCase):
         self.assertEqual(v1.UTC[0].second, 0)
         self.assertEqual(v1.UTC[0].microsecond, 0)
 
+    def test_from_components(self):
+        """Create Ticktock from arrays of date/time components"""
+        tt = t.Ticktock.from_components(
+            [2002, 2008, 2016, 2016], [2, 2, 12, 12], [2, 29, 31, 31],
+            [12, 0, 23, 23], [1, 0, 59, 59], [2, 0, 59.5, 60.25],
+            [3, 0, 0, 0])
+        numpy.testing.assert_equal(
+            [datetime.datetime(2002, 2, 2, 12, 1, 2, 3),
+             datetime.datetime(2008, 2, 29),
+             datetime.datetime(2016, 12, 31, 23, 59, 59, 500000),
+             datetime.datetime(2016, 12, 31, 23, 59, 59, 999999)], tt.UTC)
+        self.assertEqual('2016-12-31T23:59:60', tt.ISO[-1])
+        self.assertEqual(0.75, tt.TAI[-1] - tt.TAI[-2])
+        tt = t.Ticktock.from_components(2001, [1, 2])
+        self.assertEqual('DT64', tt.data.attrs['dtype'])
+        numpy.testing.assert_equal(
+            [datetime.datetime(2001, 1, 1), datetime.datetime(2001, 2, 1)],
+            tt.UTC)
+        for args in ((2001, 2, 29), (2001, 13, 1), (2001, 1, 1, 24),
+                     (2001, 1, 1, 0, 0, 61)):
+            self.assertRaises(ValueError, t.Ticktock.from_components, *args)
+        with self.assertRaises(ValueError) as cm:
+            t.Ticktock.from_components(2015, 12, 31, 23, 59, 60)
+        self.assertEqual(
+            '2015-12-31T23:59:60.000000 is not a valid leapsecond.',
+            str(cm.exception))
+
+    def test_from_doy(self):
+        """Create Ticktock from year and day of year"""
+        tt = t.Ticktock.from_doy([2002, 2002, 2004], [33, 33.5, 366.25])
+        self.assertEqual('DT64', tt.data.attrs['dtype'])
+        numpy.testing.assert_equal(
+            [datetime.datetime(2002, 2, 2), datetime.datetime(2002, 2, 2, 12),
+             datetime.datetime(2004, 12, 31, 6)], tt.UTC)
+        numpy.testing.assert_equal([32, 32.5, 365.25], tt.eDOY)
+        self.assertRaises(ValueError, t.Ticktock.from_doy, 2002, 366)
+        self.assertRaises(ValueError, t.Ticktock.from_doy, 2002, 0.5)
+
     def test_UTCGPS(self):
         """testing get UTC from GPS"""
         t1 = t.Ticktock([6.93882013e+08, 6.93964813e+08], 'GPS')
@@ -1480,6 +1662,32 @@ class TimeClassTests(unittest.TestCase):
         numpy.testing.assert_equal(
             [0, 0, 1, 3, 4], t1.getleapsecs())
 
+    def test_getleapsecs_bases(self):
+        """Leap seconds looked up in each time base"""
+        utc = [datetime.datetime(1958, 1, 1),
+               datetime.datetime(1961, 3, 1),
+               datetime.datetime(1972, 6, 30, 23, 59, 59),
+               datetime.datetime(1972, 7, 1),
+               datetime.datetime(2017, 1, 1)]
+        expected = [0, 1, 10, 11, 37]
+        t1 = t.Ticktock(utc)
+        for dtype in ('TAI', 'UNX', 'RDT', 'CDF', 'ISO'):
+            t2 = t.Ticktock(getattr(t1, dtype), dtype)
+            numpy.testing.assert_equal(expected, t2.getleapsecs(),
+                                       err_msg=dtype)
+            if dtype != 'RDT': # RDT precision is only ~10us
+                numpy.testing.assert_equal(utc, t2.UTC, err_msg=dtype)
+
+    def test_leaptable(self):
+        """Leap second table is consistent across time bases"""
+        table = spacepy.time._leaptable
+        dt64 = table['DT64'][1:]
+        for dtype in ('UNX', 'RDT', 'CDF'):
+            tt = t.Ticktock(table[dtype][1:], dtype)
+            numpy.testing.assert_equal(dt64, tt.DT64, err_msg=dtype)
+        numpy.testing.assert_equal(dt64, t.Ticktock(table['TAI'][1:], 'TAI').DT64)
+        self.assertRaises(ValueError, table['taiutc'].__setitem__, 0, 1)
+
     def test_readleapsecs(self):
         """Test that the leap second file was properly read"""
         numpy.testing.assert_equal(
@@ -1641,6 +1849,131 @@ class TimeClassTests(unittest.TestCase):
         # Nothing new calculated
         self.assertEqual(preattrs, postattrs)
 
+    def testUpdateItemsLazy(self):
+        """update_items discards other attributes instead of recalculating"""
+        tt = t.Ticktock([datetime.datetime(2001, 1, 1)])
+        tt.TAI, tt.ISO
+        tt.data[0] = datetime.datetime(2002, 1, 1)
+        tt.update_items('data')
+        self.assertFalse('TAI' in tt.__dict__)
+        self.assertFalse('ISO' in tt.__dict__)
+        self.assertEqual('2002-01-01T00:00:00', tt.ISO[0])
+
+    def testAppendCached(self):
+        """Append extends existing representations"""
+        t1 = t.Ticktock([datetime.datetime(2008, 12, 31, 23, 59, 59)])
+        t2 = t.Ticktock([1609459233.5, 1609459234], dtype='TAI')
+        t1.TAI, t1.ISO, t1.DOY
+        t3 = t1.append(t2)
+        for key in ('TAI', 'ISO', 'DOY'):
+            self.assertTrue(key in t3.__dict__)
+        numpy.testing.assert_equal(
+            [1609459232, 1609459233.5, 1609459234], t3.TAI)
+        numpy.testing.assert_equal(
+            ['2008-12-31T23:59:59', '2008-12-31T23:59:60',
+             '2009-01-01T00:00:00'], t3.ISO)
+        numpy.testing.assert_equal([366, 366, 1], t3.DOY)
+        numpy.testing.assert_equal(t.Ticktock(t3.TAI, 'TAI').JD, t3.JD)
+
+    def testSliceShared(self):
+        """Slicing shares data and representations"""
+        t1 = t.Ticktock([1609459232, 1609459233.5, 1609459234, 1609459300],
+                        dtype='TAI')
+        t1.UTC, t1.ISO
+        t2 = t1[1:3]
+        self.assertEqual('TAI', t2.data.attrs['dtype'])
+        self.assertTrue(t2.data.base is t1.data)
+        # Indexed from original, not recalculated
+        t1.__dict__['ISO'][2] = 'not recalculated'
+        numpy.testing.assert_equal(
+            ['2008-12-31T23:59:60', 'not recalculated'], t2.ISO)
+        self.assertIs(t1.UTC[1], t2.UTC[0])
+        t3 = t2[-1]
+        self.assertEqual(1, len(t3))
+        numpy.testing.assert_equal([datetime.datetime(2009, 1, 1)], t3.UTC)
+        numpy.testing.assert_equal([366, 1], t1[[True, False, True, False]].DOY)
+        self.assertRaises(IndexError, t1.__getitem__, 4)
+        # Changing a slice doesn't change the original, or vice versa
+        t2[0] = datetime.datetime(2009, 1, 2)
+        numpy.testing.assert_equal(1609459233.5, t1.TAI[1])
+        numpy.testing.assert_equal([2, 1], t2.DOY)
+        t1[2] = datetime.datetime(2009, 1, 2)
+        numpy.testing.assert_equal(1609459234, t2.TAI[1])
+
+    def testConcatenate(self):
+        """Concatenate Ticktocks and their representations"""
+        t1 = t.Ticktock(['2008-12-31T23:59:59', '2008-12-31T23:59:60'])
+        t2 = t.Ticktock([1609459234], dtype='TAI')
+        t1.TAI, t1.DOY, t2.DOY, t1.JD
+        t3 = t.Ticktock.concatenate([t1, t2, t1[:1]])
+        self.assertEqual('ISO', t3.data.attrs['dtype'])
+        self.assertTrue('DOY' in t3.__dict__)
+        self.assertFalse('JD' in t3.__dict__)
+        numpy.testing.assert_equal(
+            [1609459232, 1609459233, 1609459234, 1609459232], t3.TAI)
+        numpy.testing.assert_equal([366, 366, 1, 366], t3.DOY)
+        numpy.testing.assert_equal(
+            ['2008-12-31T23:59:59', '2008-12-31T23:59:60',
+             '2009-01-01T00:00:00', '2008-12-31T23:59:59'], t3.ISO)
+        self.assertRaises(ValueError, t.Ticktock.concatenate, [])
+
+    def testRegularTicktock(self):
+        """Regular grid calculates times as needed"""
+        tt = t.RegularTicktock(datetime.datetime(2002, 2, 1),
+                               datetime.timedelta(hours=6), 10)
+        self.assertEqual(10, len(tt))
+        self.assertFalse('data' in tt.__dict__)
+        t2 = tt[2:9:3]
+        self.assertTrue(isinstance(t2, t.RegularTicktock))
+        numpy.testing.assert_equal(
+            ['2002-02-01T12:00:00', '2002-02-02T06:00:00',
+             '2002-02-03T00:00:00'], t2.ISO)
+        numpy.testing.assert_equal([datetime.datetime(2002, 2, 2, 18)],
+                                   tt[-3].UTC)
+        self.assertRaises(IndexError, tt.__getitem__, 10)
+        self.assertFalse('data' in tt.__dict__)
+        numpy.testing.assert_equal(
+            t.Ticktock([datetime.datetime(2002, 2, 1)
+                        + datetime.timedelta(hours=6) * i
+                        for i in range(10)]).TAI, tt.TAI)
+        numpy.testing.assert_equal(
+            tt.RDT, pickle.loads(pickle.dumps(tt)).RDT)
+        # Representations are recalculated, not pickled
+        big = t.RegularTicktock('2002-02-01', numpy.timedelta64(1, 's'),
+                                86400 * 60)
+        big.DT64, big.TAI
+        pkl = pickle.dumps(big)
+        self.assertTrue(len(pkl) < 2000)
+        numpy.testing.assert_equal(big.TAI, pickle.loads(pkl).TAI)
+        # Once changed, no longer regular
+        tt.insert(1, '2003-01-01')
+        self.assertEqual(11, len(tt))
+        numpy.testing.assert_equal(['2002-02-01T00:00:00',
+                                    '2003-01-01T00:00:00'], tt[:2].ISO)
+        tt.sort()
+        self.assertEqual('2003-01-01T00:00:00', tt[-1].ISO[0])
+        tt = t.RegularTicktock('2002-02-01', numpy.timedelta64(1, 's'),
+                               86400 * 365 * 100)
+        numpy.testing.assert_equal(['2052-01-20T00:00:00'],
+                                   tt[86400 * 365 * 50].ISO)
+
+    def testInsertDeleteSortCached(self):
+        """Insert, delete, sort keep existing representations"""
+        tt = t.Ticktock(['2002-01-03', '2002-01-01'])
+        tt.TAI, tt.DOY
+        tt.insert(1, '2002-01-02T12:00:00.5')
+        self.assertTrue('DOY' in tt.__dict__)
+        numpy.testing.assert_equal([3, 2, 1], tt.DOY)
+        numpy.testing.assert_equal(t.Ticktock(tt.data).TAI, tt.TAI)
+        tt.sort()
+        numpy.testing.assert_equal([1, 2, 3], tt.DOY)
+        numpy.testing.assert_equal(
+            ['2002-01-01', '2002-01-02T12:00:00.5', '2002-01-03'], tt.data)
+        del tt[1]
+        self.assertTrue('TAI' in tt.__dict__)
+        numpy.testing.assert_equal([1, 3], tt.DOY)
+        numpy.testing.assert_equal(t.Ticktock(tt.data).TAI, tt.TAI)
+
     def testUpdateItemsGiveCls(self):
         """Change data and call update with a class"""
         tt = t.Ticktock(['2001-01-01'])